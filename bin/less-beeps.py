@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 r"""
-usage: less-beeps.py [-h] [--yolo] [CHORD ...]
+usage: less-beeps.py [-h] [--yolo] [--idle] [--kitty] [--motion] [CHORD ...]
 
 give away nine classic simple Terminal games
 
@@ -11,11 +11,17 @@ positional arguments:
 options:
   -h, --help  show this help message and exit
   --yolo      do what's popular now
+  --idle      close each Input after a pause, not at the Reply to a Status Call
+  --kitty     ask for the Kitty Keyboard Protocol, and fall back if not answered
+  --motion    ask for Mouse Moves and Drags too, not only Press and Release
 
 examples:
   ./bin/less-beeps.py --yolo
   bin/@ F2
   bin/@ Esc-F5
+  bin/@ --idle Esc-F3
+  bin/@ --kitty Esc-F4
+  bin/@ --motion Esc-F4
 """
 
 # code reviewed by People, Black, Flake8, Mypy-Strict, & Pylance-Standard
@@ -25,7 +31,10 @@ from __future__ import annotations  # backports new datatype syntaxes into old P
 
 import __main__
 import argparse
+import asyncio
+import base64
 import bdb
+import codecs
 import collections
 import collections.abc  # .abc is not .collections.abc
 import dataclasses
@@ -33,13 +42,16 @@ import difflib
 import math
 import os
 import pdb
+import queue
 import re
 import select
 import signal
 import sys
 import termios
 import textwrap
+import threading
 import time
+import tracemalloc
 import tty
 import types
 import typing
@@ -106,9 +118,62 @@ def main() -> None:
     if testing:
         t0 = time.time()
         TerminalBytePack(b"")._try_terminal_byte_pack_()
+        terminal_byte_scanner._try_terminal_byte_scanner_()
+        terminal_keycap_index._try_terminal_keycap_index_()
+        mt = MouseTerminal()
+        mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
+        mt._try_mirror_write_()
+        mt._try_arrow_runs_move_y_x_()
+        mt._try_read_paste_chunks_()
+        mt._try_drop_late_dsr_0_()
+        mt._try_take_osc_()
+        mt._try_frame_writes_()
+        TerminalInputCoalescer()._try_terminal_input_coalescer_()
+        TerminalScreenStudio()._try_loopback_frames_()
+        TerminalSgrTracker()._try_terminal_sgr_tracker_()
+        TerminalScreenBuffer(5, x_wide=20)._try_terminal_screen_buffer_()
+        MouseMotionTracker()._try_mouse_motion_tracker_()
         t1 = time.time()
         print(t1 - t0)  # 233us
 
+        (slow, fast) = terminal_byte_scanner._time_terminal_byte_scanner_()
+        print(slow, fast, slow / fast)  # 64 KiB framed 1 Byte at a time, vs by Table Lookup
+
+        (slow, fast) = terminal_keycap_index._time_terminal_keycap_index_()
+        print(slow, fast, slow / fast)  # 6K Key Caps formed by testing each Char, vs by Lookup
+
+        (slow, fast) = TerminalInputCoalescer()._time_terminal_input_coalescer_()
+        print(slow, fast, slow / fast)  # Inputs of a Flood read, vs dispatched after Coalescing
+
+        TicTacTuhGameboard()._try_key_echo_()
+
+        TerminalGapStats()._try_terminal_gap_stats_()
+
+        (slow, fast) = TicTacTuhGameboard()._time_board_turns_()
+        print(slow, fast, slow / fast)  # Bytes of 4 Board Turns, all 9 Cells in full, vs the Changed
+
+        (dsr_lag, idle_lag) = TerminalPokeStudio()._time_poke_framings_(round_trip=0.030)
+        print(dsr_lag, idle_lag, dsr_lag / idle_lag)  # Keypress to Dispatch, ⎋[0 N vs Idle Gap
+
+        TerminalPokeStudio()._try_read_deadlines_(round_trip=0.030)
+        TerminalPokeStudio()._try_kitty_keyboard_(round_trip=0.001)
+        TerminalPokeStudio()._try_theme_reply_split_(split=0.060)
+
+        (sync_lag, async_lag) = TerminalPokeStudio()._time_async_inputs_(round_trip=0.001)
+        print(sync_lag, async_lag, async_lag / sync_lag)  # Keypress to Terminal Input
+
+        TerminalPokeStudio()._try_async_stays_live_(round_trip=0.001)
+
+        (sync_skew, thread_skew) = TerminalPokeStudio()._time_reader_thread_(0.001, redraw=0.050)
+        print(sync_skew, thread_skew)  # Keypress to Arrival, while slow Redraws run
+
+        TerminalPokeStudio()._try_reader_slow_round_trip_(round_trip=0.120)
+
+        (pack_size, ti_size) = TerminalInputStudio()._size_terminal_inputs_()
+        print(
+            pack_size, ti_size, pack_size / ti_size
+        )  # Bytes held per Input, of 10K synthetic Inputs
+
     # Launch
 
     mc = MainClass()
@@ -136,7 +201,12 @@ class MainClass:
         # Run till quit, inside a Terminal
 
         with TerminalStudio() as ts:
-            with MouseTerminal() as mt:
+            idle_framing = bool(ns.idle)
+            motion_tracking = bool(ns.motion)
+            with MouseTerminal(idle_framing=idle_framing, motion_tracking=motion_tracking) as mt:
+                if ns.kitty:
+                    mt.negotiate_kitty_keyboard(timeout=KittyTimeout)
+
                 mt.kbytearray.extend(ns.chords_kbytes)
                 while True:
 
@@ -164,8 +234,6 @@ class MainClass:
     def parse_less_beeps_args(self) -> argparse.Namespace:
         """Take in the Shell Command-Line Args"""
 
-        kcap_by_ktext = KCAP_BY_KTEXT
-
         #
 
         parser = self.compile_less_beeps_doc()
@@ -185,34 +253,14 @@ class MainClass:
             caps_list = chord_to_caps_list(chord)
             caps = "".join(caps_list)
 
-            ktext = ""
-            for k, v in kcap_by_ktext.items():
-                if v == caps:
-                    ktext = k
-                    break
-            if caps.startswith("⎋") and (caps != "⎋"):
-                caps = caps[len("⎋") :]
-                for k, v in kcap_by_ktext.items():
-                    if v == caps:
-                        ktext = k
-                        break
-                assert ktext, (ktext, caps, chord)
-                chords_kbytes += b"\033"
-                for k, v in kcap_by_ktext.items():
-                    if v == caps:
-                        ktext = k
-                        break
-
-            assert ktext, (ktext, caps, chord)
-
-            kbytes = ktext.encode()
-            assert kbytes, (kbytes, ktext)
+            kbytes = terminal_keycap_index.kcaps_to_kbytes_if(caps)
+            assert kbytes, (kbytes, caps, chord)
 
             chords_kbytes += kbytes
 
         ns.chords_kbytes = chords_kbytes
 
-        if chords_kbytes:
+        if chords_kbytes or ns.idle or ns.kitty or ns.motion:
             ns.yolo = True
 
         #
@@ -235,6 +283,15 @@ class MainClass:
         yolo_help = "do what's popular now"
         parser.add_argument("--yolo", action="count", help=yolo_help)
 
+        idle_help = "close each Input after a pause, not at the Reply to a Status Call"
+        parser.add_argument("--idle", action="count", help=idle_help)
+
+        kitty_help = "ask for the Kitty Keyboard Protocol, and fall back if not answered"
+        parser.add_argument("--kitty", action="count", help=kitty_help)
+
+        motion_help = "ask for Mouse Moves and Drags too, not only Press and Release"
+        parser.add_argument("--motion", action="count", help=motion_help)
+
         return parser
 
 
@@ -246,6 +303,8 @@ class MainClass:
 class TerminalStudio:
     """Run inside 1 Terminal Window Pane, till Quit"""
 
+    kitty_esc_pending: bool = False  # holds a Kitty ⎋[27U, to join with the F Key after it
+
     def __enter__(self) -> typing.Self:
         return self
 
@@ -258,6 +317,19 @@ class TerminalStudio:
         caps = ti.caps
         face = ti.face
 
+        # Join a Kitty ⎋[27U with the F Key after it, as Legacy Keyboards send ⎋⎋OP for ⎋F1
+
+        if self.kitty_esc_pending:
+            self.kitty_esc_pending = False
+            if face in ("F1", "F2", "F3", "F4", "F5"):
+                face = "⎋" + face
+            else:
+                tprint("⎋", end=" ")
+
+        elif ti.kbytes == b"\033[27u":
+            self.kitty_esc_pending = True
+            return
+
         #
 
         if caps == "⌃M":
@@ -345,7 +417,9 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
     last_y: int = -1  # the Southmost Screen Row written
 
     cells: dict[int, dict[int, str]]  # 3 Rows x 3 Cols
+    screen: TerminalScreenBuffer  # the Tiles drawn, and the Tiles to draw next
 
+    sprites: dict[str, TerminalSprite] = dict()  # compiled once from the Sketches, for every Board
     rune_by_tytx: dict[tuple[int, int], str] = dict()  # defines ⌥-Click & Click at each Y X
     func_by_rune: dict[str, collections.abc.Callable[[str, tuple[int, int]], bool]] = dict()
     tapping: bool = False  # hides Keyboard while taking Input from Tap or Click
@@ -387,6 +461,12 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         func_by_rune = d
 
+        # Compile the Sketches once, to stamp out many times
+
+        sprites = TicTacTuhGameboard.sprites
+        if not sprites:
+            sprites.update(self.sketches_to_sprites())
+
         # Init this
 
         self.cells = cells
@@ -400,7 +480,6 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
         """Run 1 Tic-Tac-Tuh Gameboard on Screen"""
 
         mt = mouse_terminal()
-        fileno = mt.fileno
         stdio = mt.stdio
 
         assert SM_DECTCEM == "\033[" "?25h"
@@ -408,11 +487,11 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         # Launch
 
-        self.fetch_y_high_x_width()
+        self.fetch_y_high_x_width(timeout=None)
         (y_high, x_width) = (mt.y_high, mt.x_wide)
         assert -1 not in (y_high, x_width), (y_high, x_width)  # todo: stop asserting init order
 
-        theme_color = mt.read_appearance_theme_if()
+        theme_color = mt.read_appearance_theme_if(timeout=None)
 
         self.ttt_board_draw(theme_color)
 
@@ -480,20 +559,14 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
             if ti.face in ("←", "↑", "→", "↓"):
 
                 kbytes = ti.kbytes
-                stdio.flush()  # before each 'os.write' of .try_tic_tac_tuh
-
-                fd = fileno
-                data = kbytes
-                os.write(fd, data)
+                stdio.write_bytes(kbytes)
 
                 continue
 
-            #
+            # Echo other Keystrokes through the Screen Buffer, so later Stamps know to write over them
 
-            if ti.face:
-                tprint(ti.face, end="")
-            else:
-                tprint(ti.caps, end="")
+            text = ti.face if ti.face else ti.caps
+            self.key_echo(text)
 
         stdio.write(f"\033[{last_y + 2}H")
 
@@ -571,16 +644,42 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         (ty, tx) = tytx
 
+        screen = self.screen
+
         mt = mouse_terminal()
         stdio = mt.stdio
 
+        # Write the Rune through the Screen Buffer, so later Stamps know to write over it
+
+        sgr = screen.sgr_tracker.sgr_now or ""  # keeps the SGR as it was, when known
+        screen.write_text(ty, tx, text=rune, sgr=sgr)
+
         stdio.write("\0337")
-        stdio.write(f"\033[{ty};{tx}H")
-        stdio.write(rune)
+        stdio.write(screen.render())
         stdio.write("\0338")
 
         return True
 
+    def key_echo(self, text: str) -> None:
+        """Show this Keystroke at the Cursor, and move the Cursor past it"""
+
+        screen = self.screen
+
+        mt = mouse_terminal()
+        stdio = mt.stdio
+
+        (y, x) = (mt.row_y, mt.column_x)
+
+        # Write the Text through the Screen Buffer, so later Stamps know to write over it
+
+        sgr = screen.sgr_tracker.sgr_now or ""  # keeps the SGR as it was, when known
+        screen.write_text(y, x, text=text, sgr=sgr)
+
+        stdio.write(screen.render())
+
+        x_ = min(x + len(text), mt.x_wide)  # todo: count Wide Chars as 2 Columns
+        stdio.write(f"\033[{y};{x_}H")
+
     def board_flip_wide(self, rune: str, tytx: tuple[int, int]) -> bool:
         """Flip the Board head over heels, across a Horizontal Axis in the Middle"""
 
@@ -592,10 +691,13 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         wide = [wide_2, wide_1, wide_0]
 
+        fresh_by_row_col = dict()
         for row in range(3):  # todo: magic 3 Rows
             wide_row = wide[row]
             for col, fresh in zip(range(3), wide_row):  # todo: magic 3 Cols
-                self.row_col_fresh_stamp(row, col=col, fresh=fresh)
+                fresh_by_row_col[(row, col)] = fresh
+
+        self.cells_fresh_stamp(fresh_by_row_col)
 
         return True
 
@@ -610,10 +712,13 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         high = [high_2, high_1, high_0]
 
+        fresh_by_row_col = dict()
         for col in range(3):  # todo: magic 3 Cols
             high_col = high[col]
             for row, fresh in zip(range(3), high_col):  # todo: magic 3 Rows
-                self.row_col_fresh_stamp(row, col=col, fresh=fresh)
+                fresh_by_row_col[(row, col)] = fresh
+
+        self.cells_fresh_stamp(fresh_by_row_col)
 
         return True
 
@@ -628,10 +733,13 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         wide = [high_2, high_1, high_0]
 
+        fresh_by_row_col = dict()
         for row in range(3):  # todo: magic 3 Rows
             wide_row = wide[row]
             for col, fresh in zip(range(3), wide_row):  # todo: magic 3 Cols
-                self.row_col_fresh_stamp(row, col=col, fresh=fresh)
+                fresh_by_row_col[(row, col)] = fresh
+
+        self.cells_fresh_stamp(fresh_by_row_col)
 
         return True
 
@@ -646,10 +754,13 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         high = [wide_2, wide_1, wide_0]
 
+        fresh_by_row_col = dict()
         for col in range(3):  # todo: magic 3 Cols
             high_col = high[col]
             for row, fresh in zip(range(3), high_col):  # todo: magic 3 Rows
-                self.row_col_fresh_stamp(row, col=col, fresh=fresh)
+                fresh_by_row_col[(row, col)] = fresh
+
+        self.cells_fresh_stamp(fresh_by_row_col)
 
         return True
 
@@ -693,9 +804,11 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         colors_screen_back = self.colors_screen_back
 
-        stdio.write("\033[m")
-        stdio.write(colors_screen_back)
-        stdio.write("\033[2J")  # ⎋[J works, but ⎋[H ⎋[2J gets more test
+        screen = TerminalScreenBuffer(mt.y_high, x_wide=mt.x_wide)
+        self.screen = screen
+
+        text = screen.clear_screen(sgr="\033[m" + colors_screen_back)
+        stdio.write(text)  # ⎋[J works, but ⎋[H ⎋[2J gets more test
 
         self.ttt_board_redraw()
 
@@ -703,6 +816,7 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
         """Draw the Board at launch or later: its Cells and its Colors"""
 
         rune_by_tytx = self.rune_by_tytx
+        screen = self.screen
 
         colors_screen_back = self.colors_screen_back
         colors_board_back = self.colors_board_back
@@ -718,84 +832,50 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         (y0, x0) = self.find_y0x0()
 
-        xo_board = TicTacTuhGameboard.xo_board
-        xo_text = textwrap.dedent(xo_board)
-        xo_rows = list(_ for _ in xo_text.splitlines() if _)
-        xo_wide = max(len(_.lstrip()) for _ in xo_rows)
+        sprite = TicTacTuhGameboard.sprites["xo_board"]
 
-        assert len(xo_rows) == (2 * 17 - 1), (len(xo_rows),)
-        assert xo_wide == (2 * 24 - 1), (xo_wide,)
+        assert sprite.high == (2 * 17 - 1), (sprite.high,)
+        assert sprite.wide == (2 * 24 - 1), (sprite.wide,)
 
-        y = y0 - len(xo_rows) // 2
-        x = x0 - xo_wide // 2
+        y = y0 - sprite.high // 2
+        x = x0 - sprite.wide // 2
         yx = (y, x)
 
-        # Choose Glyphs for Tap/ Click Widgets
-
-        from_codes = "+-<>|" + "*." "12345678" "@_" "abcdefgh"
-        from_codes += "DFn←↑→↓⇧⌃⌘⌥"
+        # Choose Colors
 
-        to_glyphs = len("+-<>|") * "█" + len("*.12345678@_abcdefgh") * " "
-        to_glyphs += "DFn←↑→↓⇧⌃⌘⌥"
+        board_sgr = "\033[m" + colors_board_back + colors_wall_front
+        keycap_sgr = "\033[m" + colors_screen_back + colors_wall_front
 
-        trans = str.maketrans(from_codes, to_glyphs)
+        sgr_by_ink = {"": board_sgr, "keycap": keycap_sgr, "⌥": keycap_sgr + "\033[7m"}
 
-        # Write Colors first
-
-        stdio.write("\033[m")
-        stdio.write(colors_board_back)
-        stdio.write(colors_wall_front)
-
-        # Write every Tile of the Board
+        # Define ⌥-Click & Click at each Y X, and find the @ Y X to place the Cursor
 
         cycx = (-1, -1)
-        last_y = -1
-
-        for dy, xo_row in enumerate(xo_rows):
-            assert xo_row == xo_row.rstrip(), (xo_row, xo_row.rstrip())
-
-            row = xo_row.lstrip()
-            dx = len(xo_row) - len(row)
-
-            for i, t in enumerate(row):
-                assert t in from_codes, (t, from_codes)
-
-                ty = y + dy
-                tx = x + dx + i
-                tytx = (ty, tx)
-
-                if t == "@":
-                    assert cycx == (-1, -1), (cycx, t, tytx)
-                    cycx = tytx
-
-                rune_by_tytx[tytx] = t
+        for dy, dx, rune in sprite.hits:
+            tytx = (y + dy, x + dx)
+            rune_by_tytx[tytx] = rune
 
-                stdio.write(f"\033[{ty};{tx}H")
+            if rune == "@":
+                assert cycx == (-1, -1), (cycx, rune, tytx)
+                cycx = tytx
 
-                if t in "DF_n←↑→↓⇧⌃⌘⌥":
-                    stdio.write("\033[m")
-                    stdio.write(colors_screen_back)
-                    stdio.write(colors_wall_front)
+        assert cycx != (-1, -1), (cycx,)
 
-                    if t == "⌥":
-                        stdio.write("\033[7m")
+        last_y = y + sprite.high - 1
 
-                if t != "_":
-                    write = t.translate(trans)
-                    stdio.write(write)
+        # Stamp every Tile of the Board into the Screen Buffer
 
-                last_y = ty
+        screen.write_sprite(y, x, sprite=sprite, sgr_by_ink=sgr_by_ink)
 
-            stdio.write(colors_board_back)
-            stdio.write(colors_wall_front)
+        # Write just the Tiles changed
 
-        assert cycx != (-1, -1), (cycx,)
+        text = screen.render()
+        stdio.write(text)
 
         # Write Colors last
 
-        stdio.write("\033[m")
-        stdio.write(colors_board_back)
-        stdio.write(colors_wall_front)
+        text = screen.sgr_tracker.choose_sgr(board_sgr)
+        stdio.write(text)
 
         # Place the Y X Cursor
 
@@ -805,16 +885,21 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
         self.yx = yx
         self.last_y = last_y
 
-    def fetch_y_high_x_width(self) -> None:
+    def fetch_y_high_x_width(self, timeout: float | None) -> None:
         """Count out Screen Rows Wide x Columns High"""
 
         mt = mouse_terminal()
 
+        t0 = time.time()
+        deadline = mt._deadline_(timeout, t0=t0)
+
         mt.stdio.write("\033[18t")  # the ⎋[18 T Call  # todo: earlier/ more robustly
         while True:
-            ti = mt.read_terminal_input(timeout=None)
+            ti = mt.read_terminal_input(timeout=mt._timeout_till_(deadline))
             if ti:
                 break
+            if mt._deadline_passed_(deadline):
+                return  # leaves .y_high and .x_wide as they were
 
         mt._ti_snoop_(ti)
 
@@ -882,48 +967,48 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
     def row_col_fresh_stamp(self, row: int, col: int, fresh: str) -> None:
         """Stamp the fresh Rune at the Row Col"""
 
-        assert fresh in ("X", "O", " ", ""), (fresh,)
+        self.cells_fresh_stamp({(row, col): fresh})
+
+    def cells_fresh_stamp(self, fresh_by_row_col: dict[tuple[int, int], str]) -> None:
+        """Stamp the Cells into the Screen Buffer, and write out just the Tiles changed, as 1 Frame"""
 
         cells = self.cells
         yx = self.yx
+        screen = self.screen
 
-        x_glyph = self.x_glyph
-        o_glyph = self.o_glyph
-        xo_glyph = self.xo_glyph
+        sprites = TicTacTuhGameboard.sprites
+        blank_sprite = sprites[" "]
 
         mt = mouse_terminal()
         stdio = mt.stdio
 
-        # Form the Write
+        board_sgr = "\033[m" + self.colors_board_back + self.colors_wall_front
+
+        # Stamp each Glyph into the Screen Buffer, and mirror each Cell
 
         (y, x) = yx
 
-        gy = y + 5 + row * 8  # todo: magic 6, magic 8
-        gx = x + 2 + col * 15  # todo: magic 4, magic 15
+        cycx = (-1, -1)
+        for (row, col), fresh in fresh_by_row_col.items():
+            assert fresh in ("X", "O", " ", ""), (fresh,)
 
-        x_masks = textwrap.dedent(x_glyph).strip().splitlines()
-        o_masks = textwrap.dedent(o_glyph).strip().splitlines()
-        xo_masks = textwrap.dedent(xo_glyph).strip().splitlines()
+            cells[row][col] = fresh
 
-        if fresh == "X":
-            masks = x_masks
-        elif fresh == "O":
-            masks = o_masks
-        else:
-            masks = xo_masks
+            gy = y + 5 + row * 8  # todo: magic 6, magic 8
+            gx = x + 2 + col * 15  # todo: magic 4, magic 15
 
-        # Write the Write
+            sprite = sprites[fresh] if fresh else blank_sprite
+            screen.write_sprite(gy, gx, sprite=sprite, sgr_by_ink={"": board_sgr})
 
-        for mask in masks:
-            stdio.write(f"\033[{gy};{gx}H")
-            gy += 1
+            cycx = (gy + sprite.high - 1, gx + sprite.wide)  # past the Glyph, as before
 
-            write = mask.replace("·", " ")
-            stdio.write(write)
+        # Write just the Tiles changed, and leave the Cursor past the last Glyph, as before
 
-        # Mirror the Write
+        text = screen.render()
+        stdio.write(text)
 
-        cells[row][col] = fresh
+        (cy, cx) = cycx
+        stdio.write(f"\033[{cy};{cx}H")
 
     def cells_to_flats(self) -> str:
         """Flatten the Cells into a Text"""
@@ -942,10 +1027,131 @@ class TicTacTuhGameboard:  # 31 Wide x 23 High
 
         return text
 
+    #
+    # Count the Bytes of Board Turns, to compare stamping all 9 Cells in full vs just the Cells changed
+    #
+
+    def _time_board_turns_(self) -> tuple[int, int]:
+        """Count the Bytes to turn the Board, by stamping all 9 Cells in full, vs by the Cells changed"""
+
+        with open(os.devnull, "w") as devnull:
+            mt = MouseTerminal()  # becomes the MouseTerminal of the Gameboard, for a while
+            try:
+                mt.stdio = TerminalWriter(devnull, mirror=mt.mirror_write)
+                (mt.y_high, mt.x_wide) = (40, 60)
+
+                (every_bytes, changed_bytes) = self._count_board_turn_bytes_()
+            finally:
+                mouse_terminals.remove(mt)
+
+        return (every_bytes, changed_bytes)
+
+    def _try_key_echo_(self) -> None:
+        """Require a Board Turn to write over a Keystroke echoed onto the Board"""
+
+        with open(os.devnull, "w") as devnull:
+            mt = MouseTerminal()  # becomes the MouseTerminal of the Gameboard, for a while
+            try:
+                mt.stdio = TerminalWriter(devnull, mirror=mt.mirror_write)
+                (mt.y_high, mt.x_wide, mt.row_y, mt.column_x) = (40, 60, 1, 1)
+
+                self.ttt_board_draw(theme_color=())
+                screen = self.screen
+
+                (y, x) = self.yx
+                (qy, qx) = (y + 5 + 8 + 3, x + 2 + 15 + 6)  # inside the Middle Cell
+
+                mt.stdio.write(f"\033[{qy};{qx}H")
+                self.key_echo("q")
+                assert screen.front_rows[qy - Y1][qx - X1][0] == "q", (screen.front_rows[qy - Y1],)
+
+                self.board_turn_left("", tytx=(-1, -1))
+                assert screen.front_rows[qy - Y1][qx - X1][0] != "q", (screen.front_rows[qy - Y1],)
+
+            finally:
+                mouse_terminals.remove(mt)
+
+    def _count_board_turn_bytes_(self) -> tuple[int, int]:
+        """Turn the Board each way, and count the Bytes, as written, and as if stamped in full"""
+
+        cells = self.cells
+        sprites = TicTacTuhGameboard.sprites
+
+        mt = mouse_terminal()
+        stdio = mt.stdio
+
+        # Draw a Board with some X O Glyphs on it
+
+        self.ttt_board_draw(theme_color=())
+        for row, col, fresh in [(0, 0, "X"), (1, 0, "O"), (2, 1, "X"), (0, 2, "O")]:
+            self.row_col_fresh_stamp(row, col=col, fresh=fresh)
+
+        stdio.flush()
+
+        board_sgr = "\033[m" + self.colors_board_back + self.colors_wall_front
+        (y, x) = self.yx
+
+        # Turn it each way, and count the Bytes written, and the Bytes to stamp every Cell in full
+
+        turns = [self.board_flip_wide, self.board_spin_high, self.board_turn_left]
+        turns.append(self.board_turn_right)
+
+        every_bytes = 0
+        changed_bytes = 0
+
+        for turn in turns:
+            bytes_written = stdio.bytes_written
+            turn("", (-1, -1))
+            stdio.flush()
+            changed_bytes += stdio.bytes_written - bytes_written
+
+            for row in range(3):  # todo: magic 3 Rows
+                for col in range(3):  # todo: magic 3 Cols
+                    fresh = cells[row][col]
+                    sprite = sprites[fresh] if fresh else sprites[" "]
+
+                    gy = y + 5 + row * 8  # todo: magic 6, magic 8
+                    gx = x + 2 + col * 15  # todo: magic 4, magic 15
+
+                    scratch = TerminalScreenBuffer(mt.y_high, x_wide=mt.x_wide)
+                    scratch.clear_screen(sgr="")  # differs from every Cell of the Glyph
+                    scratch.write_sprite(gy, gx, sprite=sprite, sgr_by_ink={"": board_sgr})
+
+                    text = scratch.render()
+                    text += f"\033[{gy + sprite.high - 1};{gx + sprite.wide}H"
+                    every_bytes += len(text.encode())
+
+        return (every_bytes, changed_bytes)
+
     #
     # Sketch out the Board and the X O Glyphs
     #
 
+    def sketches_to_sprites(self) -> dict[str, TerminalSprite]:
+        """Compile the Board and the X O Glyphs into Sprites"""
+
+        # Choose Glyphs and Inks for Tap/ Click Widgets
+
+        glyph_by_code = dict((_, "█") for _ in "+-<>|")
+        glyph_by_code.update((_, " ") for _ in "*." "12345678" "@" "abcdefgh")
+        glyph_by_code["_"] = ""  # writes no Tile
+
+        ink_by_code = dict((_, "keycap") for _ in "DF_n←↑→↓⇧⌃⌘")
+        ink_by_code["⌥"] = "⌥"
+
+        # Compile
+
+        blank_by_dot = {"·": " "}
+
+        sprites = {
+            "xo_board": art_to_sprite(self.xo_board, glyph_by_code, ink_by_code=ink_by_code),
+            "X": art_to_sprite(self.x_glyph, glyph_by_code=blank_by_dot),
+            "O": art_to_sprite(self.o_glyph, glyph_by_code=blank_by_dot),
+            " ": art_to_sprite(self.xo_glyph, glyph_by_code=blank_by_dot),
+        }
+
+        return sprites
+
     xo_board = """
 
                          .............
@@ -1031,13 +1237,88 @@ class TerminalScreenStudio:
         """Take Input, edit it, and write it back out"""
 
         mt = mouse_terminal()
+        stdio = mt.stdio
+
+        coalescer = TerminalInputCoalescer(arrows_merged=True)  # loops back ⎋[5A as ⎋[5A
 
         while True:
-            ti = mt.read_yxhw_terminal_input(timeout=None)
-            if not ti:
-                continue
+            frame = self.take_loopback_frame(coalescer)
+            for ti in frame:
+                self.try_one_loopback(ti)
+                if (ti.kbytes == b"\033[200~") and (mt.paste_y != -1):
+                    self.try_paste_loopback()
+
+            stdio.flush()  # writes out the Loop-Back of each Frame at once
+
+    def take_loopback_frame(self, coalescer: TerminalInputCoalescer) -> list[TerminalInput]:
+        """Read the Inputs of 1 Frame, and take them merged and capped, but not past a Paste Start"""
 
-            self.try_one_loopback(ti)
+        mt = mouse_terminal()
+        backlog = coalescer.backlog
+
+        tis: list[TerminalInput] = list()
+        if not (backlog and (backlog[-1].kbytes == b"\033[200~")):
+            timeout = 0.0 if backlog else None  # catches up, while Inputs wait
+            tis = mt.read_yxhw_terminal_inputs(timeout=timeout)
+
+        frame = coalescer.take_frame(tis)
+        return frame
+
+        # leaves the Body of a Bracketed Paste unread, for .try_paste_loopback to take in bulk
+
+    def _try_loopback_frames_(self) -> None:
+        """Require a Flood of Arrows to loop back as 1 Input, and a Paste Start to close the Frame"""
+
+        mt = MouseTerminal()  # becomes the MouseTerminal of the Studio, for a while
+        try:
+            (mt.y_high, mt.x_wide, mt.row_y, mt.column_x) = (24, 80, 1, 1)
+            (mt.yxhw_drift, mt.yxhw_synced) = (False, time.time())  # calls for no Replies
+
+            kbytes = 100 * b"\033[A" + b"\003" + b"\033[200~" + b"\033[A" + b"\033[201~"
+            mt.kbytearray.extend(kbytes)  # as if read, so without ⎋[5N Calls
+
+            coalescer = TerminalInputCoalescer(arrows_merged=True)
+            frame = self.take_loopback_frame(coalescer)
+
+            kbytes_list = list(_.kbytes for _ in frame)
+            assert kbytes_list == [b"\033[100A", b"\003", b"\033[200~"], (kbytes_list,)
+            assert bytes(mt.kbytearray) == b"\033[A\033[201~", (mt.kbytearray,)
+
+            assert mt.paste_y == 1, (mt.paste_y,)
+
+        finally:
+            mouse_terminals.remove(mt)
+
+    def try_paste_loopback(self) -> None:
+        """Loop back the Body of a Bracketed Paste in bulk, and break its Lines at each CR"""
+
+        mt = mouse_terminal()
+        stdio = mt.stdio
+
+        assert CR == "\r"
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        for chunk in mt.read_paste_chunks(timeout=None):
+            text = decoder.decode(chunk)  # holds back a Char split across Chunks
+
+            lines = text.split("\r")
+
+            texts = [lines[0]]
+            for line in lines[1:]:
+                texts.append(mt.paste_crlf_to_str())
+                texts.append(line)
+
+            mirror_start = 0
+            if (len(lines) > 1) and ("\033" not in text):
+                mirror_start = sum(len(_) for _ in texts[:-2])  # mirrors from the last ⎋[ ⇧H
+
+            stdio.write("".join(texts), mirror_start=mirror_start)
+
+        stdio.flush()  # after each Bracketed Paste of .try_paste_loopback
+
+        # writes 1 Str per Chunk of Paste, not 1 'os.write' per Byte or per Run of Text
+        # mirrors just the last Line, when no ⎋ Sequence pasted can move the Y X it lands at
 
     def try_one_loopback(self, ti: TerminalInput) -> None:
         """Convert some Inputs, and loop the rest back"""
@@ -1045,7 +1326,6 @@ class TerminalScreenStudio:
         mt = mouse_terminal()
 
         stdio = mt.stdio
-        fileno = mt.fileno
 
         kbytes = ti.kbytes
         caps = ti.caps
@@ -1078,11 +1358,7 @@ class TerminalScreenStudio:
 
         # Loop Input Bytes back, no matter if well known
 
-        stdio.flush()  # before each 'os.write' of .try_one_loopback
-
-        fd = fileno
-        data = kbytes
-        os.write(fd, data)
+        stdio.write_bytes(kbytes)
 
         # Quit on demand
 
@@ -1146,16 +1422,27 @@ class TerminalInputStudio:
 
         # Run till quit
 
+        tracker = MouseMotionTracker()
+
         tprint()
-        mt.row_y = min(mt.y_high, mt.row_y + 1)
         while True:
 
             # Prompt
 
             if mt.column_x == X1:
                 text = f"{mt.row_y};{mt.column_x}"
-                tprint(text, end=" ")
-                mt.column_x += len(text + " ")
+                tprint(text, end=" ")  # moves our Mirror of the Cursor
+
+            # Collapse each Run of Mouse Moves or Drags, when asked for them
+
+            if mt.motion_tracking:
+                tis = mt.read_frame_terminal_inputs()
+                self.frame_tprint(tracker, tis=tis)
+
+                if any((_.caps in ("⌃C", "⌃D", "⌃Z", "⌃\\")) for _ in tis):
+                    sys.exit()
+
+                continue
 
             # Flush and read, but trace each Byte as it comes
 
@@ -1178,6 +1465,27 @@ class TerminalInputStudio:
             if caps in ("⌃C", "⌃D", "⌃Z", "⌃\\"):
                 sys.exit()
 
+    def frame_tprint(self, tracker: MouseMotionTracker, tis: list[TerminalInput]) -> None:
+        """Print each Key Caps Text, and each Run of Mouse Motion, of 1 Frame"""
+
+        mt = mouse_terminal()
+
+        for ti in tis:
+            mt._ti_snoop_(ti)
+
+        events = tracker.track_frame(tis)
+        for event in events:
+            if isinstance(event, MouseEvent):
+                tprint(">", event)
+            else:
+                self.ti_tprint(event)
+
+        if tracker.frame_counts:
+            tprint(tracker)
+
+        # > MouseEvent(kind='drag', f=0, y=9, x=29, count=24)
+        # Mouse: 24 drag, 23 of 24 collapsed
+
     def kbyte_tprint(self, kbyte: bytes) -> int:
         """Print each Byte, as they come"""
 
@@ -1230,9 +1538,44 @@ class TerminalInputStudio:
                 else:
                     tprint(">", caps, kbytes)
 
-        if -1 not in (mt.y_high, mt.row_y, mt.column_x):
-            mt.row_y = min(mt.y_high, mt.row_y + 1)
-            mt.column_x = X1
+    def _size_terminal_inputs_(self) -> tuple[float, float]:
+        """Measure the Bytes held per Input, when holding Packs, and when holding just the Bytes"""
+
+        para = b"Hello\r\033[A\033[6;5R\033[<0;5;9M\033[<0;5;9m\033OP\033[8;40;100t\xc3\xa9\x7f"
+        data = 1000 * para  # a synthetic Session of 10K Inputs, 1 Paragraph of 10 repeated
+
+        kbytes_list = list()
+        for span in terminal_byte_scanner.split_packs(data):
+            (start, stop) = (span[0], span[-2])
+            kbytes_list.append(data[start:stop])
+
+        # Hold a Pack, its Back Tail, and its Key Caps per Input
+
+        tracemalloc.start()
+
+        packs = list()
+        for kbytes in kbytes_list:
+            pack = TerminalBytePack(kbytes)
+            pack.close()
+            caps = _kbytes_to_precise_kcaps_(kbytes)
+            face = _kbytes_to_concise_kcaps_if_(kbytes)
+            packs.append((pack, bytes(pack.back + pack.tail), kbytes, caps, face))
+
+        (pack_size, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Hold just the Bytes per Input, till its Pack is asked for
+
+        tracemalloc.start()
+
+        tis = list(TerminalInput(_) for _ in kbytes_list)
+
+        (ti_size, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(tis) == len(packs), (len(tis), len(packs))
+
+        return (pack_size / len(packs), ti_size / len(tis))
 
 
 #
@@ -1299,6 +1642,7 @@ class TerminalPokeStudio:
 
             rep = tp.to_sketch_text()
             tprint(rep)  # could be repr(tp) or str(tp)
+            tprint(mt.gap_stats)  # live, as each Poke retunes the Burst Gap and the Idle Gap
 
             if breaking:
                 break
@@ -1307,6 +1651,13 @@ class TerminalPokeStudio:
             # todo1: Quit at Emacs ⌃X ⌃C, ⌃X ⌃S
             # todo1: Quit at Vim ⇧Z ⇧Q, ⇧Z ⇧Z
 
+        read_syscalls = mt.read_syscalls
+        read_length = mt.read_length
+
+        per_kib = read_syscalls / max(1, read_length) * 1024
+        tprint()
+        tprint(f"Syscalls: {read_syscalls} to read {read_length} Bytes, {per_kib:.1f} per KiB")
+
         kcaps_list = list()
         for exit_data in mt.exits:
             kcaps = kbytes_to_precise_kcaps(exit_data)
@@ -1317,107 +1668,572 @@ class TerminalPokeStudio:
 
         # todo3: Decipher ⌥-Click encoding at Google Cloud Shell
 
+    #
+    # Time Keypress to Dispatch, to compare ways of closing each Poke
+    #
 
-#
-# Say Byte-for-Byte what we got for Input, without compressing and bundling
-#
+    def _time_poke_framings_(self, round_trip: float) -> tuple[float, float]:
+        """Time Keypress to Dispatch, while closing at the ⎋[0 N Reply, and at an Idle Gap"""
 
+        (master_fd, slave_fd) = os.openpty()
 
-class TerminalByteStudio:
+        replier = threading.Thread(target=self._reply_dsr_0_, args=(master_fd, round_trip))
+        replier.start()
 
-    def try_single_byte_times(self) -> None:  # ⎋F2
-        """Say Byte-for-Byte what we got for Input, without compressing and bundling"""
+        medians = list()
+        for idle_framing in (False, True):
+            mt = MouseTerminal(idle_framing=idle_framing)
+            mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
 
-        mt = mouse_terminal()
+            mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+            mt.fileno = slave_fd
 
-        # As late as now, trace the Writes of MouseTerminal.__enter__
+            lags = list()
+            with mt:
+                for kbytes in 10 * (b"a", b"\033[A", b"\033OP", b"\033"):
+                    t0 = time.time()
+                    os.write(master_fd, kbytes)
+                    tp = mt.read_terminal_poke(timeout=None)
+                    t1 = time.time()
 
-        tprint()
-        tprint("Setup:")
+                    assert tp.to_kbytes().startswith(kbytes), (tp, kbytes)
+                    lags.append(t1 - t0)
 
-        for entry_data in mt.entries:
-            for b in entry_data:
-                tprint(bytes([b]))
+            mt.stdio.close()
 
-        # Launch a wide Ruler
+            lags.sort()
+            medians.append(lags[len(lags) // 2])
 
-        tprint()
-        tprint(30 * "123456789 ")
+        os.close(slave_fd)  # makes the Replier quit
+        replier.join()
+        os.close(master_fd)
 
-        # Launch a fetch of Terminal Width x Height
+        (dsr_lag, idle_lag) = medians
 
-        for t in "\033[18t":
-            tprint(t.encode())
-        mt.stdio.write("\033[18t")
+        return (dsr_lag, idle_lag)
 
-        # Launch a fetch of Terminal Cursor Y X
+        # ⎋ still waits for the ⎋[0 N Reply while closing at an Idle Gap, so 1 of 4 stays slow
 
-        for t in "\033[6n":
-            tprint(t.encode())
-        mt.stdio.write("\033[6n")
+    def _try_read_deadlines_(self, round_trip: float) -> None:
+        """Return at each Deadline, while keeping Packs open, and dropping late ⎋[0 N Replies"""
 
-        # Run till Quit
+        (master_fd, slave_fd) = os.openpty()
 
-        tprint()
-        t0 = time.time()
-        while True:
+        replier = threading.Thread(target=self._reply_dsr_0_, args=(master_fd, round_trip))
+        replier.start()
 
-            mt.stdio.flush()  # before each 'os.read' of .try_single_byte_times
+        mt = MouseTerminal()
+        mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
 
-            read_list = list()
-            delay_list = list()
+        mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+        mt.fileno = slave_fd
 
-            fd = mt.fileno
-            length = 1
+        timeout = round_trip / 3
+        with mt:
 
-            read = os.read(fd, length)
+            # Return at the Deadline, when no Input comes
+
+            t0 = time.time()
+            tp = mt.read_terminal_poke(timeout=timeout)
+            ti = mt.read_terminal_input(timeout=timeout)
             t1 = time.time()
 
-            read_list.append(read)
-            delay_list.append(t1 - t0)
-            t0 = t1
+            assert not tp.reads, (tp,)
+            assert ti is None, (ti,)
+            assert (t1 - t0) < (3 * timeout), (t1 - t0, timeout)
 
-            while mt._kbhit_(timeout=0.000_001):
+            # Close the Poke at the Deadline, and drop its ⎋[0 N Reply when it comes late
 
-                read = os.read(fd, length)  # trust ._kbhit_ flush'es before 'os.read' here
-                t1 = time.time()
+            os.write(master_fd, b"\033")
+            tp = mt.read_terminal_poke(timeout=timeout)
+            assert tp.to_kbytes() == b"\033", (tp,)
+            assert mt.dsr_0_owed == 1, (mt.dsr_0_owed,)
 
-                read_list.append(read)
-                delay_list.append(t1 - t0)
-                t0 = t1
+            time.sleep(2 * round_trip)
+            os.write(master_fd, b"a")
+            tp = mt.read_terminal_poke(timeout=None)
+            assert tp.to_kbytes().removesuffix(b"\033[0n") == b"a", (tp,)
+            assert mt.dsr_0_owed == 0, (mt.dsr_0_owed,)
 
-            if read_list == [b"\r"]:
-                tprint()
-                continue
+            # Keep the Pack open across the Deadline
 
-            for read, delay in zip(read_list, delay_list):
-                tprint(f"{read!r} {sketch(delay, near=1e-3)}")
+            os.write(master_fd, b"\033[")
+            ti = mt.read_terminal_input(timeout=None)
+            assert ti is None, (ti,)
+            assert mt._pack_.to_bytes() == b"\033[", (mt._pack_,)
 
-            breaking = False
-            for read in read_list:
-                if read in (b"\x03", b"\x04", b"\x1a", b"\x1c"):  # ("⌃C", "⌃D", "⌃Z", "⌃\\"):
-                    breaking = True
+            ti = mt.read_terminal_input(timeout=timeout)
+            assert ti is None, (ti,)
 
-            if breaking:
-                break
+            os.write(master_fd, b"A")
+            ti = mt.read_terminal_input(timeout=None)
+            assert ti and (ti.pack.to_bytes() == b"\033[A"), (ti,)
 
+        mt.stdio.close()
 
-#
-# Amp up Import ArgParse
-#
+        os.close(slave_fd)  # makes the Replier quit
+        replier.join()
+        os.close(master_fd)
 
+    def _time_async_inputs_(self, round_trip: float) -> tuple[float, float]:
+        """Time Keypress to Terminal Input, when read sync, and when read by an Event Loop"""
 
-_ARGPARSE_3_10_ = (3, 10)  # Ubuntu 2022 Oct/2021 Python 3.10
+        (master_fd, slave_fd) = os.openpty()
 
+        replier = threading.Thread(target=self._reply_dsr_0_, args=(master_fd, round_trip))
+        replier.start()
 
-class ArgDocParser:
-    """Scrape out Prog & Description & Epilog from Doc to form an Argument Parser"""
+        kbytes_list = 10 * [b"a", b"\033[A", b"\033OP", b"\033[<0;5;9M"]
 
-    doc: str  # a copy of parser.format_help()
-    add_help: bool  # truthy to define '-h, --help', else not
+        medians = list()
+        for asyncing in (False, True):
+            mt = MouseTerminal()
+            mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
 
-    parser: argparse.ArgumentParser  # the inner standard ArgumentParser
-    text: str  # something like the __main__.__doc__, but dedented and stripped
+            mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+            mt.fileno = slave_fd
+
+            lags: list[float] = list()
+            with mt:
+                if not asyncing:
+                    for kbytes in kbytes_list:
+                        t0 = time.time()
+                        os.write(master_fd, kbytes)
+                        ti = mt.read_terminal_input(timeout=None)
+                        t1 = time.time()
+
+                        assert ti and (ti.pack.to_bytes() == kbytes), (ti, kbytes)
+                        lags.append(t1 - t0)
+                else:
+                    amt = AsyncMouseTerminal(mt)
+                    asyncio.run(self._time_async_lags_(amt, master_fd, kbytes_list, lags=lags))
+
+            mt.stdio.close()
+
+            lags.sort()
+            medians.append(lags[len(lags) // 2])
+
+        os.close(slave_fd)  # makes the Replier quit
+        replier.join()
+        os.close(master_fd)
+
+        (sync_lag, async_lag) = medians
+
+        return (sync_lag, async_lag)
+
+    def _try_async_stays_live_(self, round_trip: float) -> None:
+        """Require other Tasks to run while a split ⎋[0N Reply arrives, not stall till it completes"""
+
+        (master_fd, slave_fd) = os.openpty()
+
+        replier = threading.Thread(target=self._reply_dsr_0_, args=(master_fd, round_trip))
+        replier.start()
+
+        mt = MouseTerminal()
+        mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
+
+        mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+        mt.fileno = slave_fd
+
+        with mt:
+            mt.dsr_0_owed = 1  # as if a Poke had closed at its Deadline
+            amt = AsyncMouseTerminal(mt)
+            stall = asyncio.run(self._time_async_stall_(amt, fd=master_fd))
+
+        mt.stdio.close()
+
+        os.close(slave_fd)  # makes the Replier quit
+        replier.join()
+        os.close(master_fd)
+
+        assert stall < 0.015, (stall,)  # stalls about 0.030s, if the Reader blocks the Loop
+
+    async def _time_async_stall_(self, amt: AsyncMouseTerminal, fd: int) -> float:
+        """Time the longest Stall of a ticking Task, while a split ⎋[0N Reply arrives"""
+
+        ticks: list[float] = list()
+        ticker = asyncio.create_task(self._tick_forever_(ticks))
+
+        inputs = amt.inputs()
+        next_input = asyncio.ensure_future(anext(inputs))
+
+        await asyncio.sleep(0.010)
+        os.write(fd, b"\033[0")  # the Head of the late Reply
+        await asyncio.sleep(0.030)  # less than the IdleGapMax wait for the rest of it
+        os.write(fd, b"na")  # the Tail of the late Reply, and then a Keystroke
+
+        ti = await next_input
+        assert ti.kbytes == b"a", (ti,)
+
+        ticker.cancel()
+        await inputs.aclose()
+
+        stall = max((b - a) for (a, b) in zip(ticks, ticks[1:]))
+        return stall
+
+    async def _tick_forever_(self, ticks: list[float]) -> None:
+        """Note the Time of each Tick, about once per Millisecond"""
+
+        while True:
+            ticks.append(time.time())
+            await asyncio.sleep(0.001)
+
+    def _time_reader_thread_(self, round_trip: float, redraw: float) -> tuple[float, float]:
+        """Time Keypress to Arrival, while slow Redraws run, sync and then threaded"""
+
+        (master_fd, slave_fd) = os.openpty()
+
+        replier = threading.Thread(target=self._reply_dsr_0_, args=(master_fd, round_trip))
+        replier.start()
+
+        kbytes_list = 5 * [b"a", b"\033[A", b"\033OP", b"\033[<0;5;9M"]
+
+        medians = list()
+        for threaded in (False, True):
+            mt = MouseTerminal()
+            mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
+
+            mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+            mt.fileno = slave_fd
+
+            writes: list[float] = list()
+            typist = threading.Thread(
+                target=self._type_slowly_, args=(master_fd, kbytes_list, redraw / 5, writes)
+            )
+
+            arrivals = list()
+            with mt:
+                reader = TerminalInputReader(mt)
+                if threaded:
+                    reader.__enter__()
+
+                typist.start()
+                for kbytes in kbytes_list:
+                    if threaded:
+                        item = reader.read_timed_terminal_input(timeout=None)
+                        assert item, (item,)
+                        (arrival, ti) = item
+                    else:
+                        ti_if = mt.read_terminal_input(timeout=None)
+                        assert ti_if, (ti_if,)
+                        (arrival, ti) = (mt.poke_arrival, ti_if)
+
+                    assert ti.kbytes == kbytes, (ti, kbytes)
+                    arrivals.append(arrival)
+
+                    time.sleep(redraw)  # like a slow Redraw
+
+                typist.join()
+
+                if threaded:
+                    reader.__exit__()
+
+            mt.stdio.close()
+
+            skews = list((a - w) for (a, w) in zip(arrivals, writes))
+            skews.sort()
+            medians.append(skews[len(skews) // 2])
+
+        os.close(slave_fd)  # makes the Replier quit
+        replier.join()
+        os.close(master_fd)
+
+        (sync_skew, thread_skew) = medians
+
+        return (sync_skew, thread_skew)
+
+    def _try_reader_slow_round_trip_(self, round_trip: float) -> None:
+        """Close each Poke at its ⎋[0 N Reply, when the Round Trip runs past the ReaderTimeout"""
+
+        assert round_trip > ReaderTimeout, (round_trip, ReaderTimeout)
+
+        (master_fd, slave_fd) = os.openpty()
+
+        replier = threading.Thread(target=self._reply_dsr_0_, args=(master_fd, round_trip))
+        replier.start()
+
+        mt = MouseTerminal()
+        mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
+
+        mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+        mt.fileno = slave_fd
+
+        with mt:
+            reader = TerminalInputReader(mt)
+            with reader:
+
+                # Wait out the slow Round Trip, and owe no ⎋[0 N Reply after it
+
+                for kbytes in (b"a", b"\033[A", b"\033OP"):
+                    os.write(master_fd, kbytes)
+                    ti = reader.read_terminal_input(timeout=None)
+                    assert ti and (ti.kbytes == kbytes), (ti, kbytes)
+                    assert mt.dsr_0_owed == 0, (mt.dsr_0_owed,)
+
+                t0 = time.time()
+
+            # Stop the Thread at once, while it waits for Input with no Timeout
+
+            t1 = time.time()
+            assert (t1 - t0) < ReaderTimeout, (t1 - t0, ReaderTimeout)
+            assert mt.stop_fileno == -1, (mt.stop_fileno,)
+
+        mt.stdio.close()
+
+        os.close(slave_fd)  # makes the Replier quit
+        replier.join()
+        os.close(master_fd)
+
+    def _type_slowly_(
+        self, fd: int, kbytes_list: list[bytes], pause: float, writes: list[float]
+    ) -> None:
+        """Write each K Bytes after a Pause, and note when"""
+
+        for kbytes in kbytes_list:
+            time.sleep(pause)
+            writes.append(time.time())
+            os.write(fd, kbytes)
+
+    async def _time_async_lags_(
+        self, amt: AsyncMouseTerminal, fd: int, kbytes_list: list[bytes], lags: list[float]
+    ) -> None:
+        """Time Keypress to Terminal Input, inside an Event Loop"""
+
+        inputs = amt.inputs()
+        for kbytes in kbytes_list:
+            t0 = time.time()
+            os.write(fd, kbytes)
+            ti = await anext(inputs)
+            t1 = time.time()
+
+            assert ti.pack.to_bytes() == kbytes, (ti, kbytes)
+            lags.append(t1 - t0)
+
+        await inputs.aclose()
+
+    def _try_kitty_keyboard_(self, round_trip: float) -> None:
+        """Push Kitty Flags when answered, else fall back, and then frame without ⎋[5N Calls"""
+
+        for kitty_flags in (0, -1):
+            (master_fd, slave_fd) = os.openpty()
+
+            args = (master_fd, round_trip, kitty_flags)
+            replier = threading.Thread(target=self._reply_dsr_0_, args=args)
+            replier.start()
+
+            mt = MouseTerminal()
+            mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
+
+            mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+            mt.fileno = slave_fd
+
+            with mt:
+                os.write(master_fd, b"a")  # arrives while negotiating
+                flags = mt.negotiate_kitty_keyboard(timeout=KittyTimeout)
+                ti = mt.read_terminal_input(timeout=None)
+                assert ti and (ti.caps == "A"), (ti,)
+
+                if kitty_flags < 0:
+                    assert flags == 0, (flags,)  # falls back
+                else:
+                    assert flags == 1, (flags,)
+                    assert mt.exits[0] == b"\033[<u", (mt.exits,)
+
+                    os.write(master_fd, b"\033[27u")
+                    tp = mt.read_terminal_poke(timeout=None)
+                    assert tp.to_kbytes() == b"\033[27u", (tp,)  # without ⎋[0N
+
+                    os.write(master_fd, b"\033[100;5u")
+                    ti = mt.read_terminal_input(timeout=None)
+                    assert ti and (ti.caps == ti.face == "⌃D"), (ti,)
+
+                    for kbytes, face in ((b"\033[P", "F1"), (b"\033[13~", "F3")):
+                        os.write(master_fd, kbytes)  # as Kitty sends F1 F2 F3 F4
+                        ti = mt.read_terminal_input(timeout=None)
+                        assert ti and (ti.face == face), (ti, face)
+
+            mt.stdio.close()
+
+            os.close(slave_fd)  # makes the Replier quit
+            replier.join()
+            os.close(master_fd)
+
+    def _try_theme_reply_split_(self, split: float) -> None:
+        """Take the ⎋]11 and ⎋[0 N Replies, when split apart, by Idle Gap and by Kitty framing"""
+
+        for idle_framing, kitty_flags in ((True, 0), (False, 1)):
+            (master_fd, slave_fd) = os.openpty()
+
+            replier = threading.Thread(target=self._reply_theme_split_, args=(master_fd, split))
+            replier.start()
+
+            mt = MouseTerminal(idle_framing=idle_framing)
+            mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
+
+            mt.stdio = TerminalWriter(open(slave_fd, "w", closefd=False), mirror=mt.mirror_write)
+            mt.fileno = slave_fd
+            mt.kitty_flags = kitty_flags  # as if negotiated
+
+            with mt:
+                rgb = mt.read_appearance_theme_if(timeout=None)
+                assert rgb, (rgb,)
+
+                time.sleep(2 * split)  # reads no more Input till after the ⎋[0 N Reply arrives
+                os.write(master_fd, b"a")
+                ti = mt.read_terminal_input(timeout=None)
+                assert ti and (ti.kbytes == b"a"), (ti, idle_framing, kitty_flags)
+
+            mt.stdio.close()
+
+            os.close(slave_fd)  # makes the Replier quit
+            replier.join()
+            os.close(master_fd)
+
+    def _reply_theme_split_(self, fd: int, split: float) -> None:
+        """Reply to ⎋]11;? and to ⎋[5 N, but write the ⎋[0 N Reply some time later"""
+
+        while True:
+            try:
+                data = os.read(fd, 0x10000)
+            except OSError:
+                break  # quits when the Slave closes
+
+            if not data:
+                break
+
+            if b"\033]11;?" in data:
+                os.write(fd, b"\033]11;rgb:ffff/ffff/ffff\007")
+                time.sleep(split)
+
+            for _ in range(data.count(b"\033[5n")):
+                os.write(fd, b"\033[0n")
+
+    def _reply_dsr_0_(self, fd: int, round_trip: float, kitty_flags: int = -1) -> None:
+        """Reply to each ⎋[5 N Call with ⎋[0 N, after a Round Trip, like a far Terminal"""
+
+        while True:
+            try:
+                data = os.read(fd, 0x10000)
+            except OSError:
+                break  # quits when the Slave closes
+
+            if not data:
+                break
+
+            if (kitty_flags >= 0) and (b"\033[?u" in data):
+                os.write(fd, f"\033[?{kitty_flags}u".encode())  # before the ⎋[0N Reply
+
+            for _ in range(data.count(b"\033[5n")):
+                time.sleep(round_trip)
+                os.write(fd, b"\033[0n")
+
+
+#
+# Say Byte-for-Byte what we got for Input, without compressing and bundling
+#
+
+
+class TerminalByteStudio:
+
+    def try_single_byte_times(self) -> None:  # ⎋F2
+        """Say Byte-for-Byte what we got for Input, without compressing and bundling"""
+
+        mt = mouse_terminal()
+
+        # As late as now, trace the Writes of MouseTerminal.__enter__
+
+        tprint()
+        tprint("Setup:")
+
+        for entry_data in mt.entries:
+            for b in entry_data:
+                tprint(bytes([b]))
+
+        # Launch a wide Ruler
+
+        tprint()
+        tprint(30 * "123456789 ")
+
+        # Launch a fetch of Terminal Width x Height
+
+        for t in "\033[18t":
+            tprint(t.encode())
+        mt.stdio.write("\033[18t")
+
+        # Launch a fetch of Terminal Cursor Y X
+
+        for t in "\033[6n":
+            tprint(t.encode())
+        mt.stdio.write("\033[6n")
+
+        # Run till Quit
+
+        tprint()
+        t0 = time.time()
+        while True:
+
+            mt.stdio.flush()  # before each 'os.read' of .try_single_byte_times
+
+            read_list = list()
+            delay_list = list()
+
+            fd = mt.fileno
+            length = 1
+
+            read = os.read(fd, length)
+            t1 = time.time()
+
+            mt.read_syscalls += 1
+            mt.read_length += len(read)
+
+            read_list.append(read)
+            delay_list.append(t1 - t0)
+            t0 = t1
+
+            while mt._kbhit_(timeout=0.000_001):
+
+                read = os.read(fd, length)  # trust ._kbhit_ flush'es before 'os.read' here
+                t1 = time.time()
+
+                mt.read_syscalls += 1
+                mt.read_length += len(read)
+
+                read_list.append(read)
+                delay_list.append(t1 - t0)
+                t0 = t1
+
+            if read_list == [b"\r"]:
+                tprint()
+                continue
+
+            for read, delay in zip(read_list, delay_list):
+                tprint(f"{read!r} {sketch(delay, near=1e-3)}")
+
+            breaking = False
+            for read in read_list:
+                if read in (b"\x03", b"\x04", b"\x1a", b"\x1c"):  # ("⌃C", "⌃D", "⌃Z", "⌃\\"):
+                    breaking = True
+
+            if breaking:
+                break
+
+
+#
+# Amp up Import ArgParse
+#
+
+
+_ARGPARSE_3_10_ = (3, 10)  # Ubuntu 2022 Oct/2021 Python 3.10
+
+
+class ArgDocParser:
+    """Scrape out Prog & Description & Epilog from Doc to form an Argument Parser"""
+
+    doc: str  # a copy of parser.format_help()
+    add_help: bool  # truthy to define '-h, --help', else not
+
+    parser: argparse.ArgumentParser  # the inner standard ArgumentParser
+    text: str  # something like the __main__.__doc__, but dedented and stripped
     closing: str  # the last Graf of the Epilog, minus its Top Line
 
     add_argument: collections.abc.Callable[..., object]
@@ -1668,6 +2484,12 @@ def sketch(f: float, near: float) -> str:
 
 Immediately = 0.000_001
 
+IdleGapFirst = 0.010  # waits this long for more Bytes of 1 Poke, till Gaps measured
+IdleGapMin = 0.002  # waits at least this long for more Bytes of 1 Poke
+IdleGapMax = 0.050  # waits at most this long for more Bytes of 1 Poke
+
+# Immediately also is the Burst Gap, till Gaps measured
+
 Y1 = 1  # indexes Y Rows as Southbound across 1 .. Height
 X1 = 1  # indexes X Columns as Eastbound across 1 .. Width
 
@@ -1676,6 +2498,22 @@ PN_MAX_32100 = 32100  # a Numeric [Int] beyond the Counts of Rows & Columns at a
 
 PS0 = 0  # min Ps of Csi is 0
 
+FrameBytesAlloc = 0x4000  # preallocates 16 KiB per Frame of Output, and grows past it on demand
+
+ResyncPeriod = 10.0  # asks for H W Y X again this often, even while our Mirror of them holds
+
+KcapsLruMax = 256  # remembers the Key Caps of this many recent K Bytes outside the Key Cap Tables
+
+InputQueueMax = 256  # holds this many Terminal Inputs framed, before the Reader Thread stops reading
+ReaderTimeout = 0.050  # checks this often for a Stop or a Thread Exception, while a Queue waits
+
+KittyTimeout = 1.000  # falls back to legacy Keyboard Encodings, if no Reply by then
+
+FrameInputsMax = 64  # dispatches at most this many Terminal Inputs per Frame
+BacklogInputsMax = 1024  # drops the oldest Terminal Inputs past this many waiting for a Frame
+
+OscBytesMax = 0x10000  # drops each Osc Sequence longer than this, such as a 64 KiB ⎋]52 Clipboard
+
 
 mouse_terminals: list[MouseTerminal] = list()
 
@@ -1693,871 +2531,3479 @@ def mouse_terminal() -> MouseTerminal:
     return mt
 
 
-class MouseTerminal:
-    """Write/ Read Bytes at Screen/ Keyboard/ Click/ Tap of the Terminal"""
+class TerminalWriter:
+    """Gather the Str's of each Frame into 1 Bytearray, mirror each, and write out each Frame once"""
 
-    stdio: typing.TextIO  # for writes to Screen by 'print(file='
-    fileno: int  # for reads from Keyboard by 'os.read'
+    stdio: typing.TextIO  # for writes to Screen by 'print(file=', and the File Descriptor behind it
+    encoding: str  # encodes each Str as the Stdio would
+    errors: str  # encodes each Str as the Stdio would
+    mirror: collections.abc.Callable[[str], None]  # called with each Str written
+    lock: threading.Lock  # keeps Writes whole, while a TerminalInputReader writes ⎋[5N Calls
 
-    before: int  # for writing at Entry
-    tcgetattr: list[int | list[bytes | int]]  # replaced by Entry
-    entries: list[bytes]  # for writes at Entry
-    exits: list[bytes]  # for writes at Exit
-    after: int  # for writing at Exit  # todo1: Prefer .TCSAFLUSH vs large mess of Paste
+    frame_bytearray: bytearray  # holds the Bytes of the Frame, preallocated to grow in place
+    frame_length: int  # counts the Bytes held, not yet written out
 
-    kbytearray: bytearray  # cleared then formed by .read_key_caps_plus and .getch
-    _pack_: TerminalBytePack  # cleared then formed by .read_key_caps_plus
+    frames: int  # counts the Frames written out
+    frame_bytes: int  # counts the Bytes of the last Frame written out
+    frame_syscalls: int  # counts the 'os.write' Calls of the last Frame, past 1 when written in part
+    bytes_written: int  # counts the Bytes of all Frames written out
+    syscalls_made: int  # counts the 'os.write' Calls of all Frames
 
-    y_high: int  # Terminal Screen Pane Rows, else -1
-    x_wide: int  # Terminal Screen Pane Columns, else -1
-    row_y: int  # Terminal Cursor Y Row, else -1
-    column_x: int  # Terminal Cursor X Column, else -1
-    paste_y: int  # Bracketed Paste Cursor Y Row, else -1
-    paste_x: int  # Bracketed Paste Cursor X Column, else -1
+    def __init__(self, stdio: typing.TextIO, mirror: collections.abc.Callable[[str], None]) -> None:
+        self.stdio = stdio
+        self.encoding = stdio.encoding
+        self.errors = stdio.errors or "strict"
+        self.mirror = mirror
+        self.lock = threading.Lock()
 
-    _arrows_kbytes_lately_: bytes  # matched by .tp_from_startswith_mouse_arrow_kbytes
+        self.frame_bytearray = bytearray(FrameBytesAlloc)
+        self.frame_length = 0
 
-    yxhw_backtails: list[bytes]  # remember what .read_yxhw_terminal_input is waiting for
-    yxhw_terminal_inputs: list[TerminalInput]  # remember what .read_yxhw_terminal_input has read
+        self.frames = 0
+        self.frame_bytes = 0
+        self.frame_syscalls = 0
+        self.bytes_written = 0
+        self.syscalls_made = 0
 
-    #
-    # Init, enter, exit, and poll
-    #
+    def __str__(self) -> str:
+        frames = self.frames
+        s = f"{frames} Frames of {self.bytes_written} Bytes in {self.syscalls_made} Syscalls"
+        s += f", last {self.frame_bytes} Bytes in {self.frame_syscalls}"
+        return s  # '3 Frames of 2272 Bytes in 3 Syscalls, last 1930 Bytes in 1'
 
-    def __init__(self) -> None:
+    def write(self, text: str, mirror_start: int = 0) -> int:
+        """Gather the Str, and then mirror it, or mirror just its Tail, when the Head can't matter"""
 
-        mouse_terminals.append(self)
+        data = text.encode(self.encoding, errors=self.errors)
 
-        assert sys.__stderr__ is not None
-        stdio = sys.__stderr__
-        fileno = stdio.fileno()
+        with self.lock:
+            start = self.frame_length
+            stop = start + len(data)
+            if stop > len(self.frame_bytearray):
+                self._frame_grow_(stop)
 
-        self.stdio = stdio
-        self.fileno = fileno
+            self.frame_bytearray[start:stop] = data
+            self.frame_length = stop
 
-        self.before = termios.TCSADRAIN
-        self.tcgetattr = list()
-        self.entries = list()
-        self.exits = list()
-        self.after = termios.TCSADRAIN
+            self.mirror(text[mirror_start:] if mirror_start else text)
 
-        self.kbytearray = bytearray()
-        self._pack_ = TerminalBytePack(b"")
+        return len(text)
 
-        self.y_high = -1
-        self.x_wide = -1
-        self.row_y = -1
-        self.column_x = -1
-        self.paste_y = -1
-        self.paste_x = -1
+    def write_bytes(self, data: bytes) -> int:
+        """Gather the Bytes, and then mirror them as Str"""
 
-        self._arrows_kbytes_lately_ = b""
+        with self.lock:
+            start = self.frame_length
+            stop = start + len(data)
+            if stop > len(self.frame_bytearray):
+                self._frame_grow_(stop)
 
-        self.yxhw_backtails = list()
-        self.yxhw_terminal_inputs = list()
+            self.frame_bytearray[start:stop] = data
+            self.frame_length = stop
 
-    def __enter__(self) -> typing.Self:
-        r"""Stop line-buffering Input, stop replacing \n Output with \r\n, etc"""
+            self.mirror(data.decode(errors="replace"))
 
-        stdio = self.stdio
-        fileno = self.fileno
-        before = self.before
-        entries = self.entries
-        tcgetattr = self.tcgetattr
-        exits = self.exits
+        return len(data)
 
-        assert _SM_SGR_MOUSE_ == "\033[" "?1000;1006h"
-        assert _RM_SGR_MOUSE_ == "\033[" "?1000;1006l"
-        assert _SM_BRACKETED_PASTE_ == "\033[" "?2004h"
-        assert _RM_BRACKETED_PASTE_ == "\033[" "?2004l"
+    def _frame_grow_(self, stop: int) -> None:
+        """Grow the Frame to hold at least this many Bytes, by doubling it, or more"""
 
-        # Enter once
+        frame_bytearray = self.frame_bytearray
+        growth = max(stop - len(frame_bytearray), len(frame_bytearray))
+        frame_bytearray.extend(bytes(growth))
 
-        if tcgetattr:
-            return self
+    def flush(self) -> None:
+        """Write out the Frame by 1 'os.write', or by more when the Screen takes it in part"""
 
-        stdio.flush()  # before each 'tty.setraw' of MouseTerminal.__enter__
+        stdio = self.stdio
 
-        tcgetattr = termios.tcgetattr(fileno)  # replaces
-        assert tcgetattr, (tcgetattr,)
+        with self.lock:
+            stdio.flush()  # writes out what got past us, such as by 'stdio.write' from elsewhere
 
-        self.tcgetattr = tcgetattr  # replaces
+            length = self.frame_length
+            if not length:
+                return
 
-        assert before in (termios.TCSADRAIN, termios.TCSAFLUSH), (before,)
-        tty.setraw(fileno, when=before)  # Tty SetRaw defaults to TcsaFlush
-        # tty.setcbreak(fileno, when=termios.TCSAFLUSH)  # for ⌃C prints Py Traceback
+            fd = stdio.fileno()
 
-        # List the bits to write now, and the bits to clear at exit
+            syscalls = 0
+            with memoryview(self.frame_bytearray) as view:
+                start = 0
+                while start < length:
+                    try:
+                        count = os.write(fd, view[start:length])
+                    except BlockingIOError:
+                        select.select([], [fd], [])  # waits till the Screen takes more
+                        continue
 
-        entries.append(b"\033[?25l")  # shows/ hides Cursor  # commonly shown by default
-        exits.append(b"\033[?25h")
+                    syscalls += 1
+                    start += count
 
-        entries.append(b"\033[?2004h")  # does/doesn't code Paste Start/ End as ⎋[200~ and ⎋[201~
-        exits.append(b"\033[?2004l")
+            self.frame_length = 0
 
-        if flags.phone:
-            entries.append(b"\033[?1000;1006h")  # doesn't/does need ⌥ Option/ Alt on Taps/ Clicks
-            exits.append(b"\033[?1000;1006l")
+            self.frames += 1
+            self.frame_bytes = length
+            self.frame_syscalls = syscalls
+            self.bytes_written += length
+            self.syscalls_made += syscalls
 
-        # Write bits now to promise this Client will serve the Terminal well
+    def fileno(self) -> int:
+        fileno = self.stdio.fileno()
+        return fileno
 
-        stdio.flush()  # before each 'os.write' of MouseTerminal.__enter__
+    def close(self) -> None:
+        self.flush()
+        self.stdio.close()
 
-        fd = fileno
-        for entry_data in entries:
-            data = entry_data
-            os.write(fd, data)
 
-        os.write(fd, b"\033[?25h")  # todo3: stop showing by default for us
+class TerminalSgrTracker:
+    """Mirror the SGR Attributes written, and say briefly how to change them, else say nothing"""
 
-        # Succeed
+    sgr_now: str | None  # the SGR asked for last, else not yet known
+    slots_now: dict[str, str] | None  # the SGR Params written, by Slot, else not yet known
+    slots_by_sgr: dict[str, dict[str, str] | None]  # each SGR parsed, else None if not understood
 
-        return self
+    sgr_asks: int  # counts the Changes of SGR asked for
+    sgr_asked_bytes: int  # counts the Bytes of the SGR asked for
+    sgr_written_bytes: int  # counts the Bytes of SGR written in their place
 
-        # todo4: 'doesn't need ⌥ Option/ Alt on Taps/ Clicks' is wrong for every @ Esc-F
+    SetSlotByParam = {
+        **{str(_): "fg" for _ in (*range(30, 38), *range(90, 98))},  # 8 + 8 Foreground Colors
+        **{str(_): "bg" for _ in (*range(40, 48), *range(100, 108))},  # 8 + 8 Background Colors
+        **{_: _ for _ in "12345789"},  # Bold, Dim, Italic, Underline, Blink, Reverse, etc
+    }
 
-    def __exit__(self, *exc_info: object) -> None:
-        r"""Start line-buffering Input, start replacing \n Output with \r\n, etc"""
+    ResetSlotsByParam = {
+        "22": ("1", "2"),  # 22 resets both Bold and Dim
+        **{f"2{_}": (_,) for _ in "345789"},
+        "39": ("fg",),
+        "49": ("bg",),
+    }
 
-        stdio = self.stdio
-        fileno = self.fileno
-        tcgetattr = self.tcgetattr
-        exits = self.exits
-        after = self.after
+    ResetParamBySlot = {
+        "fg": "39",
+        "bg": "49",
+        "1": "22",
+        "2": "22",
+        **{_: f"2{_}" for _ in "345789"},
+    }
 
-        if not tcgetattr:
-            return
+    def __init__(self) -> None:
 
-        #
+        self.sgr_now = None
+        self.slots_now = None
+        self.slots_by_sgr = dict()
 
-        stdio.flush()  # before each 'os.write' of MouseTerminal.__exit__
+        self.sgr_asks = 0
+        self.sgr_asked_bytes = 0
+        self.sgr_written_bytes = 0
 
-        for exit_data in exits:
-            fd = fileno
-            data = exit_data
+    def __str__(self) -> str:
+        asked = self.sgr_asked_bytes
+        written = self.sgr_written_bytes
+        s = f"{self.sgr_asks} SGR Changes asked in {asked} Bytes, written in {written} Bytes"
+        return s  # '38 SGR Changes asked in 950 Bytes, written in 418 Bytes'
 
-            os.write(fd, data)
+    def choose_sgr(self, sgr: str) -> str:
+        """Say how to change the SGR written into the SGR asked for, briefly, else say nothing"""
 
-        #
+        if sgr == self.sgr_now:
+            return ""
 
-        self.tcgetattr = list()  # replaces
+        slots = self.sgr_to_slots_if(sgr)
+        slots_now = self.slots_now
 
-        stdio.flush()  # before each 'termios.tcsetattr' of MouseTerminal.__exit__
+        if slots is None:
+            text = sgr  # writes what we don't understand as it was, and then loses track
+        else:
+            text = self._slots_to_sgr_(slots_now, slots=slots)
 
-        assert after in (termios.TCSADRAIN, termios.TCSAFLUSH), (after,)
+        self.sgr_now = sgr
+        self.slots_now = slots
 
-        fd = fileno
-        when = after
-        attributes = tcgetattr
-        termios.tcsetattr(fd, when, attributes)
+        self.sgr_asks += 1
+        self.sgr_asked_bytes += len(sgr)
+        self.sgr_written_bytes += len(text)
 
-        return None
+        return text
 
-    def write_paste_crlf(self) -> None:
-        """Break Paste Line at Cursor"""
+        # '\033[m\033[48;5;232m\033[38;5;231m' from not known is '\033[0;48;5;232;38;5;231m'
+        # '\033[m\033[48;5;234m\033[38;5;231m' next is '\033[48;5;234m'
 
-        stdio = self.stdio
-        y_high = self.y_high
-        paste_y = self.paste_y
-        paste_x = self.paste_x
+    def _slots_to_sgr_(self, slots_now: dict[str, str] | None, slots: dict[str, str]) -> str:
+        """Say how to change the SGR Params by Slot, by Deltas, or by a Reset when shorter"""
 
-        assert CUP_Y_X == "\033[" "{};{}H"  # CSI 04/08 [Choose] Cursor Position
+        reset_param_by_slot = TerminalSgrTracker.ResetParamBySlot
 
-        if paste_y < y_high:
-            paste_y = paste_y + 1
-        else:
-            stdio.write("\n")
+        assert SGR_PS == "\033[" "{}m"  # CSI 06/13 Select Graphic Rendition
 
-        stdio.write(f"\033[{paste_y};{paste_x}H")  # todo: stop writing y == y
+        full_params = ["0", *slots.values()] if slots else [""]  # writes ⎋[M to reset all
+        if slots_now is None:
+            text = "\033[" + ";".join(full_params) + "m"
+            return text
 
-        self.paste_y = paste_y
+        # Reset the Slots dropped, and then write the Slots changed
 
-    def kbhit(self, timeout: float | None) -> bool:  # a la msvcrt.kbhit
-        """Block till next Input Byte, else till Timeout, else till forever"""
+        params: list[str] = list()
+        for slot in slots_now:
+            if slot not in slots:
+                reset = reset_param_by_slot[slot]
+                if reset not in params:
+                    params.append(reset)
 
-        kbytearray = self.kbytearray
-        if kbytearray:
-            return True
+        rebolding = "22" in params  # because 22 resets both Bold and Dim
+        for slot, value in slots.items():
+            if (slots_now.get(slot) != value) or (rebolding and (slot in ("1", "2"))):
+                params.append(value)
 
-        hit = self._kbhit_(timeout=timeout)
+        if not params:
+            return ""
 
-        return hit
+        join = ";".join(params)
+        full_join = ";".join(full_params)
+        if len(full_join) < len(join):
+            join = full_join
 
-    def _kbhit_(self, timeout: float | None) -> bool:  # a la msvcrt.kbhit
-        """Block till next Input Byte, else till Timeout, else till forever"""
+        text = "\033[" + join + "m"
+        return text
 
-        fileno = self.fileno
-        stdio = self.stdio
-        tcgetattr = self.tcgetattr
+    def sgr_to_slots_if(self, sgr: str) -> dict[str, str] | None:
+        """Parse the SGR into Params by Slot, else return None when not understood"""
+
+        slots_by_sgr = self.slots_by_sgr
+        set_slot_by_param = TerminalSgrTracker.SetSlotByParam
+        reset_slots_by_param = TerminalSgrTracker.ResetSlotsByParam
+
+        if sgr in slots_by_sgr:
+            return slots_by_sgr[sgr]
+
+        slots: dict[str, str] | None = None
+        if SGRS_REGEX.fullmatch(sgr):
+            slots = dict()
+
+            matches = SGR_PARAMS_REGEX.finditer(sgr)
+            params = ";".join((m.group(1) or "0") for m in matches).split(";")
+
+            i = 0
+            while i < len(params):
+                p = params[i]
+                width = 1
+
+                if p in ("", "0"):
+                    slots.clear()
+                elif p in set_slot_by_param:
+                    slots[set_slot_by_param[p]] = p
+                elif p in reset_slots_by_param:
+                    for slot in reset_slots_by_param[p]:
+                        slots.pop(slot, None)
+                elif (p in ("38", "48")) and (params[i + 1 :][:1] in (["2"], ["5"])):
+                    width = 3 if (params[i + 1] == "5") else 5  # 8-Bit Color, or 24-Bit Color
+                    if len(params) < (i + width):
+                        slots = None
+                        break
+                    slots["fg" if (p == "38") else "bg"] = ";".join(params[i:][:width])
+                else:
+                    slots = None  # doesn't understand the Param
+                    break
 
-        assert tcgetattr, (tcgetattr,)
+                i += width
 
-        stdio.flush()  # before 'select.select' of _kbhit_
+        slots_by_sgr[sgr] = slots
 
-        (r, w, x) = select.select([fileno], [], [], timeout)
-        fileno_hit = fileno in r
+        return slots
 
-        return fileno_hit
+    def forget(self) -> None:
+        """Say the Screen may no longer have the SGR written, so the next Change writes all"""
 
-        # 'timeout' is None for Never, 0 for Now, else a Float of Seconds
+        self.sgr_now = None
+        self.slots_now = None
 
     #
-    # Take next Input from a Y X in a High Wide Screen
+    # Tests, to run slowly and thoroughly
     #
 
-    def read_yxhw_terminal_input(self, timeout: float | None) -> TerminalInput | None:
-        """Take next Input from a Y X in a High Wide Screen"""
+    def _try_terminal_sgr_tracker_(self) -> None:
+        """Require the shortest SGR Deltas, and nothing written when nothing changes"""
 
-        stdio = self.stdio
-        yxhw_backtails = self.yxhw_backtails
-        yxhw_terminal_inputs = self.yxhw_terminal_inputs
+        board = "\033[m\033[48;5;232m\033[38;5;231m"
+        keycap = "\033[m\033[48;5;234m\033[38;5;231m"
 
-        assert CSI == "\033["
-        assert DCH_X == "\033[" "{}" "P"
-        assert DSR_6 == "\033[" "6n"
-        assert XTWINOPS_18 == "\033[" "18t"
+        pairs = [
+            (board, "\033[0;48;5;232;38;5;231m"),  # merges 3 SGR into 1, while not known
+            (board, ""),
+            ("\033[48;5;232;38;5;231m", ""),  # writes nothing for the same Params
+            (keycap, "\033[48;5;234m"),
+            (keycap + "\033[7m", "\033[7m"),
+            (board, "\033[27;48;5;232m"),
+            ("\033[1m\033[2m", "\033[0;1;2m"),
+            ("\033[2m", "\033[0;2m"),  # resets all, when shorter than ⎋[22;2M
+            ("\033[m", "\033[m"),
+            ("\033[38;2;255;0;0m", "\033[38;2;255;0;0m"),
+            ("\033[58;5;1m", "\033[58;5;1m"),  # writes Params not understood as they were
+            ("\033[m", "\033[m"),  # resets all, after Params not understood
+        ]
 
-        # Drain the Terminal-Input's fetched already
+        for sgr, want in pairs:
+            got = self.choose_sgr(sgr)
+            assert got == want, (sgr, got, want)
 
-        if yxhw_terminal_inputs:
-            ti = yxhw_terminal_inputs.pop(0)
-            return ti
+        self.forget()
+        got = self.choose_sgr("\033[m")
+        assert got == "\033[m", (got,)
 
-        # Ask for Height, Width, Cursor Y, Cursor X, and then also some other Input
 
-        if b"t" not in yxhw_backtails:
-            stdio.write("\033[18t")  # ⎋[18T call for reply ⎋[8;{rows};{columns}T
-            yxhw_backtails.append(b"t")
+class TerminalScreenBuffer:
+    """Hold the Cells to draw, mirror the Cells drawn, and write out just the Cells that differ"""
 
-        if b"R" not in yxhw_backtails:
-            stdio.write("\033[6n")  # ⎋[6N calls for reply ⎋[{y};{x}⇧R
-            yxhw_backtails.append(b"R")
+    y_high: int  # Terminal Screen Pane Rows
+    x_wide: int  # Terminal Screen Pane Columns
+    back_rows: list[list[tuple[str, int, str]]]  # the Cells to draw, as (Char, Width, SGR) per Y X
+    front_rows: list[list[tuple[str, int, str]]]  # the Cells drawn, else the Unknown Cell
+    dirty_ys: set[int]  # the Rows written into the Back, since the last Render
+    sgr_tracker: TerminalSgrTracker  # the SGR Attributes written, across Renders
 
-        if b"" not in yxhw_backtails:
-            yxhw_backtails.append(b"")  # waits for whatever other reply
+    UnknownCell = ("", -1, "")  # differs from every Cell drawn
+    BlankCell = (" ", 1, "")  # a Space, without SGR Attributes
 
-        # Take Inputs in whatever order  # todo: Log if Input ever comes out of order
+    def __init__(self, y_high: int, x_wide: int) -> None:
 
-        assert timeout is None, timeout  # todo: test non-none timeouts
-        while yxhw_backtails:  # todo3: count .yxhw_backtails per second
+        blank_cell = TerminalScreenBuffer.BlankCell
+        unknown_cell = TerminalScreenBuffer.UnknownCell
 
-            # Hang invisibly while Multibyte Sequences arrive slowly  # todo3: Do better
+        self.y_high = y_high
+        self.x_wide = x_wide
+        self.back_rows = list(list(x_wide * [blank_cell]) for _ in range(y_high))
+        self.front_rows = list(list(x_wide * [unknown_cell]) for _ in range(y_high))
+        self.dirty_ys = set(range(Y1, y_high + Y1))
+        self.sgr_tracker = TerminalSgrTracker()
 
-            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=timeout)
+    def clear_screen(self, sgr: str) -> str:
+        """Fill the Back and the Front with Blanks, and say how to erase the Screen to match"""
 
-            if not kbytes:
-                continue
+        y_high = self.y_high
+        x_wide = self.x_wide
 
-            # Form 1 more TerminalInput per each burst of K Bytes
+        assert ED_PS == "\033[" "{}J"  # CSI 04/10 Erase in Display
 
-            kbytes_ti = TerminalInput(kbytes)
-            assert kbytes_ti is not None, (kbytes_ti,)
-            assert kbytes_ti, (kbytes,)
+        blank_cell = (" ", 1, sgr)
 
-            self._ti_snoop_(kbytes_ti)
+        self.back_rows = list(list(x_wide * [blank_cell]) for _ in range(y_high))
+        self.front_rows = list(list(x_wide * [blank_cell]) for _ in range(y_high))
+        self.dirty_ys.clear()
 
-            caps = kbytes_ti.caps
-            pack = kbytes_ti.pack
+        text = self.sgr_tracker.choose_sgr(sgr) + "\033[2J"  # erases with the SGR Background Color
+        return text
 
-            # Take Csi Inputs
+    def write_text(self, y: int, x: int, text: str, sgr: str) -> None:
+        """Write the Text into the Back at Y X, and clip it at the Right Edge"""
 
-            if caps.startswith("⎋["):
-                backtail = bytes(pack.back + pack.tail)
-                if backtail and (backtail in yxhw_backtails):
-                    ints = kbytes_ti.to_csi_ints_if(backtail, start=b"", default=-1)
-                    if ints:
+        x_wide = self.x_wide
+        if not (Y1 <= y <= self.y_high):
+            return
 
-                        yxhw_backtails.remove(backtail)
-                        continue
+        row = self.back_rows[y - Y1]
 
-            # Take Input other than the first Height, Width, Cursor Y, Cursor X
+        for ch in text:
+            width = 2 if (unicodedata.east_asian_width(ch) in "FW") else 1
+            if not (X1 <= x <= (x_wide + 1 - width)):
+                break
 
-            if b"" in yxhw_backtails:
-                yxhw_backtails.remove(b"")
+            for x_ in (x, x + width - 1):  # blanks the other Half of a Wide Char written over
+                (old_ch, old_width, old_sgr) = row[x_ - X1]
+                if old_width == 0:
+                    row[x_ - X1 - 1] = (" ", 1, old_sgr)
+                elif old_width == 2:
+                    row[x_ - X1 + 1] = (" ", 1, old_sgr)
 
-                yxhw_terminal_inputs.append(kbytes_ti)
-                continue
+            row[x - X1] = (ch, width, sgr)
+            if width == 2:
+                row[x] = ("", 0, sgr)  # marks the Right Half of a Wide Char
 
-            yxhw_terminal_inputs.append(kbytes_ti)
+            x += width
 
-        assert yxhw_terminal_inputs, (yxhw_terminal_inputs,)
-        ti = yxhw_terminal_inputs.pop(0)
+        self.dirty_ys.add(y)
 
-        # Snoop
+    def write_cells(self, y: int, x: int, cells: tuple[tuple[str, int], ...], sgr: str) -> None:
+        """Write Cells measured before into the Back at Y X, by 1 Slice, else clip them as Text"""
 
-        self._ti_snoop_(ti)  # todo3: we so often bypass this snoop - and nothing breaks??
+        x_wide = self.x_wide
 
-        # Succeed
+        stop_x = x + len(cells)
+        if not ((Y1 <= y <= self.y_high) and (X1 <= x) and (stop_x <= (x_wide + 1))):
+            text = "".join(_[0] for _ in cells)
+            self.write_text(y, x, text=text, sgr=sgr)
+            return
 
-        return ti
+        row = self.back_rows[y - Y1]
 
-        # todo: write to refresh H W Y X again after evalling other Input vs H W Y X?
-        # todo: listen for signals of H W changing? (and show no signals come from Y X changing?)
+        (_, width, old_sgr) = row[x - X1]
+        if width == 0:  # blanks the Left Half of a Wide Char written over
+            row[x - X1 - 1] = (" ", 1, old_sgr)
 
-    def read_appearance_theme_if(self) -> tuple[int, int, int] | tuple[()]:
+        (_, width, old_sgr) = row[stop_x - X1 - 1]
+        if width == 2:  # blanks the Right Half of a Wide Char written over
+            row[stop_x - X1] = (" ", 1, old_sgr)
 
-        stdio = self.stdio
+        row[(x - X1) : (stop_x - X1)] = list((ch, width, sgr) for (ch, width) in cells)
 
-        assert BEL == "\007"  # 07/07 Bell
-        assert OSC == "\033]"  # ⎋]
-        assert ST == "\033\134" == "\033\\"
+        self.dirty_ys.add(y)
 
-        stdio.write("\033]11;?\a")  # tests our non-reply Code while commented out
-        stdio.write("\033[5n")  # asks for ⎋[0N in place of a missing ⎋ ] 1 1 ; R G B ⇧: Osc Reply
+    def write_sprite(
+        self, y: int, x: int, sprite: TerminalSprite, sgr_by_ink: dict[str, str]
+    ) -> None:
+        """Stamp the Sprite into the Back with its Origin at Y X, by 1 Slice per Run"""
 
-        kbytes = b""
-        while not kbytes:
-            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=None)
+        for run in sprite.runs:
+            sgr = sgr_by_ink[run.ink]
+            self.write_cells(y + run.dy, x + run.dx, cells=run.cells, sgr=sgr)
 
-        if kbytes == b"\033[0n":  # injectable at test via stdio.write("\033[5n")
-            return ()
+    def render(self) -> str:
+        """Say how to change the Front into the Back, with few Cursor Moves and SGR Changes"""
 
-        m = re.fullmatch(
-            rb"\033]11;rgb:"
-            rb"([0-9A-Fa-f]{4})/([0-9A-Fa-f]{4})/([0-9A-Fa-f]{4})"
-            rb"(\007|\033\134)",
-            string=kbytes,
-        )
+        back_rows = self.back_rows
+        front_rows = self.front_rows
+        x_wide = self.x_wide
+        sgr_tracker = self.sgr_tracker
 
-        assert m, (kbytes,)
+        assert CUF_X == "\033[" "{}C"  # CSI 04/03 Cursor Forward
+        assert CUP_Y_X == "\033[" "{};{}H"  # CSI 04/08 [Choose] Cursor Position
 
-        rgb = (int(m.group(1), 0x10), int(m.group(2), 0x10), int(m.group(3), 0x10))
-        return rgb
+        texts: list[str] = list()
+        (cy, cx) = (-1, -1)  # the Y X Cursor, else not yet known
 
-    #
-    # Read a parsed Terminal Input, or just Framed Bytes, from Keyboard, Mouse, and Touch
-    #
+        for y in sorted(self.dirty_ys):
+            back_row = back_rows[y - Y1]
+            front_row = front_rows[y - Y1]
+            if back_row == front_row:
+                continue
 
-    def read_terminal_input(self, timeout: float | None) -> TerminalInput | None:
-        """Read the next 1 Terminal Input"""
+            x = X1
+            while x <= x_wide:
+                cell = back_row[x - X1]
+                if cell == front_row[x - X1]:
+                    x += 1
+                    continue
 
-        (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=timeout)
-        if not kbytes:
-            return None
+                if (cell[1] == 0) and (x > X1):  # backs up to the Left Half of a Wide Char
+                    x -= 1
+                    cell = back_row[x - X1]
 
-        ti = TerminalInput(kbytes)
-        return ti
+                # Move the Cursor, by rewriting a short Gap, or by ⎋[ ⇧C, or by ⎋[ ⇧H
 
-    def read_kbyte_kbytes(self, timeout: float | None) -> tuple[bytes, bytes]:
-        """Read 0 Bytes at Timeout, or 1 Byte into the Pack, and close the Pack or not"""
+                if (cy, cx) != (y, x):
+                    cup = f"\033[{y};{x}H"
+                    gap_cells = back_row[(cx - X1) : (x - X1)] if (cy == y < x) else list()
 
-        kbytearray = self.kbytearray
-        _pack_ = self._pack_
+                    if gap_cells and (len(gap_cells) < len(cup)):
+                        sgr_now = sgr_tracker.sgr_now
+                        if all(((_[1] == 1) and (_[-1] == sgr_now)) for _ in gap_cells):
+                            cup = "".join(_[0] for _ in gap_cells)  # rewrites the Gap as it was
 
-        pack_kbytes = _pack_.to_bytes()  # maybe not .closed
+                    cuf = f"\033[{x - cx}C" if ((x - cx) > 1) else "\033[C"
+                    if gap_cells and (len(cup) > len(cuf)):
+                        cup = cuf
 
-        # Accept the ⌥`` encoded as an Immediate Pair of b"``"
+                    texts.append(cup)
 
-        if not _pack_.closed:  # if closing out taking the ⌥`` encoded as bundled b"``"
-            if pack_kbytes == b"``":
-                poke_kbyte = b"`"
-                _pack_.close()
-                return (poke_kbyte, pack_kbytes)
+                # Write the Cell, after just the SGR Params changed
 
-        # Fetch one Poke, unless Input Bytes already fetched
+                (ch, width, sgr) = cell
+                if sgr != sgr_tracker.sgr_now:
+                    texts.append(sgr_tracker.choose_sgr(sgr))
 
-        if not kbytearray:
-            tp = self._fill_kbytearray_(timeout=timeout)
-            if not kbytearray:
-                return (b"", b"")
+                texts.append(ch)
 
-            self._kbytearray_take_arrow_burst_if_(tp)
+                front_row[x - X1] = cell
+                if width == 2:
+                    front_row[x] = back_row[x]
 
-        poke_kbytes = bytes(kbytearray)
-        poke_kbyte = poke_kbytes[:1]  # does peek, doesn't pop
+                x += max(1, width)
+                (cy, cx) = (y, x) if (x <= x_wide) else (-1, -1)  # loses track at Pending Wrap
 
-        # Add the next one or two Bytes into the Pack, or don't, and close the Pack, or don't
+        self.dirty_ys.clear()
 
-        n = self._take_enough_bytes_if_()
+        text = "".join(texts)
+        return text
 
-        # Pass back just the first Byte taken, if not closed yet
+        # costs Time and Bytes in proportion to the Rows written and the Cells changed
 
-        if not _pack_.closed:
-            assert n, (n, poke_kbyte, poke_kbytes, _pack_)
-            return (poke_kbyte, b"")
+    def forget_front(self) -> None:
+        """Say the Screen may no longer match the Front, so the next Render writes every Cell"""
 
-        # Read & clear each closed Pack
+        unknown_cell = TerminalScreenBuffer.UnknownCell
+        y_high = self.y_high
+        x_wide = self.x_wide
 
-        kbytes = _pack_.to_bytes()
-        assert kbytes, (kbytes, poke_kbyte, poke_kbytes)
+        self.front_rows = list(list(x_wide * [unknown_cell]) for _ in range(y_high))
+        self.dirty_ys = set(range(Y1, y_high + Y1))
+        self.sgr_tracker.forget()
 
-        _pack_.clear_pack()
+    #
+    # Tests, to run slowly and thoroughly
+    #
 
-        # Return the Bytes of the closed Pack
+    def _try_terminal_screen_buffer_(self) -> None:
+        """Require a Render to land the same Cells, and the next Render to write just the Diff"""
 
-        return (poke_kbyte if n else b"", kbytes)
+        blank = "\033[m"
+        red = "\033[m\033[31m"
 
-    def _kbytearray_take_arrow_burst_if_(self, tp: TerminalPoke) -> None:
-        """Collapse an Arrow Burst down into a Mouse Release, if present"""
+        text = self.clear_screen(blank)
+        assert text == "\033[m\033[2J", (text,)
 
-        kbytearray = self.kbytearray
+        self.write_text(2, 3, "ab日c", sgr=blank)
+        text = self.render()
+        assert text == "\033[2;3Hab日c", (text,)  # writes no SGR, when ⎋[2J wrote it
 
-        y_high = self.y_high
-        x_wide = self.x_wide
-        row_y = self.row_y
-        column_x = self.column_x
+        text = self.render()
+        assert not text, (text,)
 
-        if -1 in (y_high, x_wide, row_y, column_x):
-            return
+        self.write_text(2, 3, "xb日C", sgr=blank)  # changes 2 Cells, 4 Columns apart
+        self.write_text(2, 1, "z", sgr=red)
+        text = self.render()
+        assert text == "\033[2;1H\033[31mz\033[C\033[mx\033[3CC", (text,)
 
-        (mouse_kbytes, arrow_kbytes) = self.tp_from_startswith_mouse_arrow_kbytes(tp)
-        assert bool(mouse_kbytes) == bool(arrow_kbytes), (mouse_kbytes, arrow_kbytes, tp)
-        if mouse_kbytes:
-            self._arrows_kbytes_lately_ = arrows_kbytes_pn_compress(arrow_kbytes)
+        self.write_text(2, 3, "xbcdC", sgr=blank)  # overwrites the Wide Char
+        text = self.render()
+        assert text == "\033[2;5Hcd", (text,)
 
-            if len(arrow_kbytes) >= (4 * 3):  # if not much like a single Arrow Repeated
-                del kbytearray[: len(arrow_kbytes)]
-                kbytearray[0:0] = mouse_kbytes
+        self.write_text(1, self.x_wide - 1, "pq", sgr=blank)
+        self.write_text(1, self.x_wide, "Q", sgr=blank)  # writes past the Pending Wrap
+        text = self.render()
+        assert text == f"\033[1;{self.x_wide - 1}HpQ", (text,)
 
-    def _take_enough_bytes_if_(self) -> int:
-        """Add the next one or two Bytes into the Pack, or don't, and close the Pack, or don't"""
+        self.forget_front()
+        assert len(self.render()) > (self.y_high * self.x_wide), (self,)
 
-        kbytearray = self.kbytearray
-        poke_kbytes = bytes(kbytearray)
-        poke_kbyte = bytes(poke_kbytes[:1])  # does peek, doesn't pop
+        sketch = """
+            ab_日
+             ·c
+        """
 
-        _pack_ = self._pack_
-        pack_kbytes = _pack_.to_bytes()  # maybe not .closed
+        sprite = art_to_sprite(sketch, glyph_by_code={"_": "", "·": " "}, ink_by_code={"c": "c"})
+        runs = list((_.dy, _.dx, _.ink, _.text) for _ in sprite.runs)
+        want = [(0, 0, "", "ab"), (0, 3, "", "日"), (1, 1, "", " "), (1, 2, "c", "c")]
+        assert runs == want, (runs, want)
+        assert (sprite.high, sprite.wide, len(sprite.hits)) == (2, 4, 6), (sprite,)
 
-        paste_y = self.paste_y
+        self.clear_screen(blank)
+        self.write_sprite(2, 3, sprite=sprite, sgr_by_ink={"": blank, "c": red})
+        text = self.render()
+        assert text == "\033[2;3Hab 日\033[3;5H\033[31mc", (text,)
 
-        # Take 2 Bytes into the Pack as Text and leave the Pack open, sometimes
 
-        if self._take_two_bytes_if_():  # like if opening up taking the ⌥`` encoded as bundled b"``"
-            return 1  # 2 into the Pack, 1 back to the Caller
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
+class TerminalSpriteRun:
+    """Say which Cells to write at 1 Offset of 1 Row of a Sprite, measured once, and in which Ink"""
 
-        # Take 0 Bytes and close the Pack abruptly, sometimes
+    dy: int  # the Rows South of the Sprite Origin
+    dx: int  # the Columns East of the Sprite Origin
+    ink: str  # names the SGR to write the Cells with, such as "" for the Default
+    text: str  # the Chars to write
+    cells: tuple[tuple[str, int], ...]  # each (Char, Width), and ("", 0) after each Wide Char
 
-        if self._take_no_bytes_if_():
-            assert _pack_.closed, (_pack_.closed, _pack_, poke_kbytes)
-            return 0
 
-        # Try taking 1 Byte into the Pack
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
+class TerminalSprite:
+    """Say how to stamp a Sketch onto a Screen, and which Code of the Sketch lands at each Y X"""
 
-        extra = _pack_.take_one_if(poke_kbyte)  # truthy at ⎋ [ ⇧! 9, etc
-        if not extra:
-            kbytearray.pop(0)
+    high: int  # the Rows of the Sketch
+    wide: int  # the Columns of the widest Row of the Sketch
+    runs: tuple[TerminalSpriteRun, ...]  # the Cells to write, as Runs of 1 Ink in 1 Row
+    hits: tuple[tuple[int, int, str], ...]  # the Code at each DY DX, for Taps and Clicks
 
-        n = int(not extra)
 
-        pack_kbytes = _pack_.to_bytes()  # replaces  # maybe .closed, maybe not
-        six_byte_mouse_auth = (paste_y == -1) and (len(poke_kbytes) > 1)
-        if (pack_kbytes == b"\033[M") and not six_byte_mouse_auth:  # ⎋[M
-            ok = _pack_.close_if_csi_shift_m()
-            assert ok, (ok, _pack_, pack_kbytes)
+def art_to_sprite(
+    art: str, glyph_by_code: dict[str, str], ink_by_code: dict[str, str] | None = None
+) -> TerminalSprite:
+    """Compile a Sketch once, into Runs of Cells to stamp, and into Codes to hit"""
 
-        # Close abruptly, if taking 1 Byte made Text, or if taking 0 Bytes
+    ink_by_code = ink_by_code or dict()
 
-        if _pack_.text or extra:
-            _pack_.close()
+    rows = list(_ for _ in textwrap.dedent(art).splitlines() if _)
+    high = len(rows)
+    wide = max(len(_) for _ in rows)
 
-        return n
+    spans: list[tuple[int, int, str, list[str]]] = list()  # each DY DX Ink and Glyphs
+    hits: list[tuple[int, int, str]] = list()
 
-        # todo2: merge ._take_enough_bytes_if_ into TerminalBytePack
-        # todo1: Think more about accepting more than ⎋ as a prefix for whatever
+    for dy, row in enumerate(rows):
+        assert row == row.rstrip(), (row, row.rstrip())
 
-    def _take_two_bytes_if_(self) -> bool:
-        """Take 2 Bytes into the Pack as Text and leave the Pack open, sometimes"""
+        codes = row.lstrip()
+        indent = len(row) - len(codes)
 
-        kbytearray = self.kbytearray
-        poke_kbytes = bytes(kbytearray)
+        ink = ""  # restarts each Row in the Default Ink
+        for i, code in enumerate(codes):
+            dx = indent + i
+            hits.append((dy, dx, code))
 
+            ink = ink_by_code.get(code, ink)  # colors the Codes after it in this Row too
+            glyph = glyph_by_code.get(code, code)
+            if not glyph:
+                continue  # writes no Cell where the Glyph is empty
+
+            if spans and (spans[-1][:3] == (dy, dx - len(spans[-1][-1]), ink)):
+                spans[-1][-1].append(glyph)  # extends the Run
+            else:
+                spans.append((dy, dx, ink, [glyph]))  # starts a Run
+
+    runs: list[TerminalSpriteRun] = list()
+    for dy, dx, ink, glyphs in spans:
+        text = "".join(glyphs)
+        cells = text_to_cells(text)
+        runs.append(TerminalSpriteRun(dy, dx=dx, ink=ink, text=text, cells=cells))
+
+    sprite = TerminalSprite(high, wide=wide, runs=tuple(runs), hits=tuple(hits))
+    return sprite
+
+    # costs Time once per Sketch, not once per Stamp
+
+
+def text_to_cells(text: str) -> tuple[tuple[str, int], ...]:
+    """Measure each Char as 1 or 2 Columns wide, and mark the Right Half of each Wide Char"""
+
+    cells: list[tuple[str, int]] = list()
+    for ch in text:
+        if unicodedata.east_asian_width(ch) in "FW":
+            cells.append((ch, 2))
+            cells.append(("", 0))
+        else:
+            cells.append((ch, 1))
+
+    return tuple(cells)
+
+    # (('a', 1), ('日', 2), ('', 0)) from 'a日'
+
+
+class MouseTerminal:
+    """Write/ Read Bytes at Screen/ Keyboard/ Click/ Tap of the Terminal"""
+
+    stdio: TerminalWriter  # for writes to Screen by 'print(file=', mirrored into .row_y .column_x
+    fileno: int  # for reads from Keyboard by 'os.read'
+    stop_fileno: int  # wakes each 'select.select' of Input, when a Reader Thread stops, else -1
+
+    before: int  # for writing at Entry
+    tcgetattr: list[int | list[bytes | int]]  # replaced by Entry
+    entries: list[bytes]  # for writes at Entry
+    exits: list[bytes]  # for writes at Exit
+    after: int  # for writing at Exit  # todo1: Prefer .TCSAFLUSH vs large mess of Paste
+
+    read_bytearray: bytearray  # reused by each Burst of 'os.readv'
+    read_syscalls: int  # counts the 'os.readv' and 'select.select' Calls made to read Input
+    read_length: int  # counts the Bytes of Input read
+    dsr_0_owed: int  # counts the ⎋[0N Replies still owed to Pokes closed at their Deadline
+    dsr_0_carry: bytes  # the Head of a ⎋[0N Reply owed, held till the rest of it arrives
+    poke_arrival: float  # when the first Burst of the latest Poke arrived
+
+    idle_framing: bool  # closes each Poke at an Idle Gap, else at the ⎋[0N Reply to ⎋[5N
+    kitty_flags: int  # the Kitty Keyboard Flags pushed, else 0 for legacy Keyboard Encodings
+    motion_tracking: bool  # asks for Mouse Moves and Drags too, not only Press and Release
+    gap_stats: TerminalGapStats  # estimates the Burst Gap and the Idle Gap from each Poke
+
+    kbytearray: TerminalByteQueue  # cleared then formed by .read_key_caps_plus and .getch
+    _pack_: TerminalBytePack  # cleared then formed by .read_key_caps_plus
+
+    osc_bytearray: bytearray  # the Bytes of an Osc Sequence fetched so far, else empty
+    osc_bytes_max: int  # drops each Osc Sequence longer than this
+    osc_dropping: bool  # says to drop the rest of the Osc Sequence open, for growing too long
+    osc_drops: int  # counts the Osc Sequences dropped for growing too long
+
+    y_high: int  # Terminal Screen Pane Rows, else -1
+    x_wide: int  # Terminal Screen Pane Columns, else -1
+    row_y: int  # Terminal Cursor Y Row, else -1
+    column_x: int  # Terminal Cursor X Column, else -1
+    paste_y: int  # Bracketed Paste Cursor Y Row, else -1
+    paste_x: int  # Bracketed Paste Cursor X Column, else -1
+
+    wrap_pending: bool  # says the next Printable Char wraps to the next Row, before it lands
+    saved_y_x: tuple[int, int]  # the Y X checkpointed by ⎋7, else (-1, -1)
+    yxhw_drift: bool  # says to ask for H W Y X again, because we can't trust our Mirror of them
+    yxhw_synced: float  # when we last read back H W Y X
+    # the SigWinch Handler replaced by Entry, restored by Exit
+    sigwinch_before: collections.abc.Callable[[int, types.FrameType | None], typing.Any] | int | None
+
+    _arrows_kbytes_lately_: bytes  # matched by .tp_from_startswith_mouse_arrow_kbytes
+
+    yxhw_backtails: list[bytes]  # remember what .read_yxhw_terminal_input is waiting for
+    yxhw_terminal_inputs: list[TerminalInput]  # remember what .read_yxhw_terminal_input has read
+
+    #
+    # Init, enter, exit, and poll
+    #
+
+    def __init__(self, idle_framing: bool = False, motion_tracking: bool = False) -> None:
+
+        mouse_terminals.append(self)
+
+        assert sys.__stderr__ is not None
+        stdio = sys.__stderr__
+        fileno = stdio.fileno()
+
+        self.stdio = TerminalWriter(stdio, mirror=self.mirror_write)
+        self.fileno = fileno
+        self.stop_fileno = -1
+
+        self.before = termios.TCSADRAIN
+        self.tcgetattr = list()
+        self.entries = list()
+        self.exits = list()
+        self.after = termios.TCSADRAIN
+
+        self.read_bytearray = bytearray(0x10000)  # 64 KiB
+        self.read_syscalls = 0
+        self.read_length = 0
+        self.dsr_0_owed = 0
+        self.dsr_0_carry = b""
+        self.poke_arrival = -1.0
+
+        self.idle_framing = idle_framing
+        self.kitty_flags = 0
+        self.motion_tracking = motion_tracking
+        self.gap_stats = TerminalGapStats()
+
+        self.kbytearray = TerminalByteQueue()
+        self._pack_ = TerminalBytePack(b"")
+
+        self.osc_bytearray = bytearray()
+        self.osc_bytes_max = OscBytesMax
+        self.osc_dropping = False
+        self.osc_drops = 0
+
+        self.y_high = -1
+        self.x_wide = -1
+        self.row_y = -1
+        self.column_x = -1
+        self.paste_y = -1
+        self.paste_x = -1
+
+        self.wrap_pending = False
+        self.saved_y_x = (-1, -1)
+        self.yxhw_drift = True
+        self.yxhw_synced = 0.0
+        self.sigwinch_before = None
+
+        self._arrows_kbytes_lately_ = b""
+
+        self.yxhw_backtails = list()
+        self.yxhw_terminal_inputs = list()
+
+    def __enter__(self) -> typing.Self:
+        r"""Stop line-buffering Input, stop replacing \n Output with \r\n, etc"""
+
+        stdio = self.stdio
+        fileno = self.fileno
+        before = self.before
+        entries = self.entries
+        tcgetattr = self.tcgetattr
+        exits = self.exits
+
+        assert _SM_SGR_MOUSE_ == "\033[" "?1000;1006h"
+        assert _RM_SGR_MOUSE_ == "\033[" "?1000;1006l"
+        assert _SM_SGR_MOTION_ == "\033[" "?1003;1006h"
+        assert _RM_SGR_MOTION_ == "\033[" "?1003;1006l"
+        assert _SM_BRACKETED_PASTE_ == "\033[" "?2004h"
+        assert _RM_BRACKETED_PASTE_ == "\033[" "?2004l"
+
+        # Enter once
+
+        if tcgetattr:
+            return self
+
+        stdio.flush()  # before each 'tty.setraw' of MouseTerminal.__enter__
+
+        tcgetattr = termios.tcgetattr(fileno)  # replaces
+        assert tcgetattr, (tcgetattr,)
+
+        self.tcgetattr = tcgetattr  # replaces
+
+        assert before in (termios.TCSADRAIN, termios.TCSAFLUSH), (before,)
+        tty.setraw(fileno, when=before)  # Tty SetRaw defaults to TcsaFlush
+        # tty.setcbreak(fileno, when=termios.TCSAFLUSH)  # for ⌃C prints Py Traceback
+
+        # List the bits to write now, and the bits to clear at exit
+
+        entries.append(b"\033[?25l")  # shows/ hides Cursor  # commonly shown by default
+        exits.append(b"\033[?25h")
+
+        entries.append(b"\033[?2004h")  # does/doesn't code Paste Start/ End as ⎋[200~ and ⎋[201~
+        exits.append(b"\033[?2004l")
+
+        if self.motion_tracking:
+            entries.append(b"\033[?1003;1006h")  # does/doesn't code Moves & Drags, Press & Release
+            exits.append(b"\033[?1003;1006l")
+        elif flags.phone:
+            entries.append(b"\033[?1000;1006h")  # doesn't/does need ⌥ Option/ Alt on Taps/ Clicks
+            exits.append(b"\033[?1000;1006l")
+
+        # Write bits now to promise this Client will serve the Terminal well
+
+        stdio.flush()  # before each 'os.write' of MouseTerminal.__enter__
+
+        fd = fileno
+        for entry_data in entries:
+            data = entry_data
+            os.write(fd, data)
+
+        os.write(fd, b"\033[?25h")  # todo3: stop showing by default for us
+
+        # Ask for H W Y X again, after each Resize of the Terminal Window Pane
+
+        self.sigwinch_before = signal.signal(signal.SIGWINCH, self._on_sigwinch_)
+
+        # Succeed
+
+        return self
+
+        # todo4: 'doesn't need ⌥ Option/ Alt on Taps/ Clicks' is wrong for every @ Esc-F
+
+    def __exit__(self, *exc_info: object) -> None:
+        r"""Start line-buffering Input, start replacing \n Output with \r\n, etc"""
+
+        stdio = self.stdio
+        fileno = self.fileno
+        tcgetattr = self.tcgetattr
+        exits = self.exits
+        after = self.after
+
+        if not tcgetattr:
+            return
+
+        #
+
+        sigwinch_before = self.sigwinch_before
+        if sigwinch_before is not None:
+            signal.signal(signal.SIGWINCH, sigwinch_before)
+            self.sigwinch_before = None
+
+        #
+
+        stdio.flush()  # before each 'os.write' of MouseTerminal.__exit__
+
+        for exit_data in exits:
+            fd = fileno
+            data = exit_data
+
+            os.write(fd, data)
+
+        #
+
+        self.tcgetattr = list()  # replaces
+
+        stdio.flush()  # before each 'termios.tcsetattr' of MouseTerminal.__exit__
+
+        assert after in (termios.TCSADRAIN, termios.TCSAFLUSH), (after,)
+
+        fd = fileno
+        when = after
+        attributes = tcgetattr
+        termios.tcsetattr(fd, when, attributes)
+
+        return None
+
+    def _on_sigwinch_(self, signum: int, frame: types.FrameType | None) -> None:
+        """Ask for H W Y X again, after a Resize of the Terminal Window Pane"""
+
+        self.yxhw_drift = True
+
+    #
+    # Mirror where the Cursor lands, after each Write
+    #
+
+    def mirror_write(self, text: str) -> None:
+        """Mirror where the Cursor lands, after writing this Str"""
+
+        mirror_token_regex = MIRROR_TOKEN_REGEX
+
+        if -1 in (self.y_high, self.x_wide, self.row_y, self.column_x):
+            return
+
+        for m in mirror_token_regex.finditer(text):
+            token = m.group()
+            if token.startswith("\033["):
+                self._mirror_csi_(m.group(1), final=m.group(2))
+            elif token.startswith("\033]"):
+                pass  # moves no Cursor, at Osc
+            elif token in ("\0337", "\0338"):
+                self._mirror_save_restore_(token)
+            elif token.startswith("\033"):
+                self.yxhw_drift = True  # todo: Mirror more Esc Sequences
+            elif (len(token) == 1) and not token.isprintable():
+                self._mirror_control_(token)
+            else:
+                self._mirror_text_(token)
+
+    def _mirror_save_restore_(self, token: str) -> None:
+        """Mirror the ⎋7 Checkpoint of Y X, or the ⎋8 Revert of it"""
+
+        if token == "\0337":
+            self.saved_y_x = (self.row_y, self.column_x)
+        else:
+            if self.saved_y_x == (-1, -1):
+                self.yxhw_drift = True
+                return
+
+            (self.row_y, self.column_x) = self.saved_y_x
+            self.wrap_pending = False
+
+    def _mirror_text_(self, text: str) -> None:
+        """Mirror the Cursor moving past Printable Text, and wrapping into the Rows below"""
+
+        x_wide = self.x_wide
+
+        width = len(text)
+        if not text.isascii():
+            for m in NON_ASCII_REGEX.finditer(text):
+                if unicodedata.east_asian_width(m.group()) in "FW":
+                    width += 1
+
+        x = (x_wide + 1) if self.wrap_pending else self.column_x
+        cells = (x - 1) + width
+
+        dy = (cells - 1) // x_wide
+        landing_x = (cells - 1) % x_wide + X1
+
+        self.row_y = min(self.row_y + dy, self.y_high)  # scrolls at the Bottom
+        self.column_x = min(landing_x + 1, x_wide)
+        self.wrap_pending = landing_x == x_wide
+
+        # lands where Char by Char would, because each Char adds its Width to the same Count
+        # todo: Mirror wrapping early, when a Wide Char lands at the last Column
+
+    def _mirror_control_(self, token: str) -> None:
+        """Mirror the Cursor moving at a Control Byte"""
+
+        if token == "\r":
+            self.column_x = X1
+        elif token == "\n":
+            self.row_y = min(self.row_y + 1, self.y_high)  # scrolls at the Bottom
+        elif token == "\b":
+            self.column_x = max(X1, self.column_x - 1)
+        elif token == "\t":
+            self.column_x = min(((self.column_x - X1) // 8 + 1) * 8 + X1, self.x_wide)
+        else:
+            return  # moves no Cursor, at \a BEL and such
+
+        self.wrap_pending = False
+
+    def _mirror_csi_(self, params: str, final: str) -> None:
+        """Mirror the Cursor moving at 1 Csi Escape Sequence"""
+
+        if final in "@JKPSTXhlmnqt":
+            return  # moves no Cursor, at ⎋[P and ⎋[2J and ⎋[?25l and such
+
+        if (not re.fullmatch(r"[0-9;]*", string=params)) or (final not in "ABCDEFGHd`f"):
+            self.yxhw_drift = True  # todo: Mirror more Csi Escape Sequences
+            return
+
+        ints = list((int(_) if _ else 0) for _ in params.split(";"))
+        pn = max(PN1, ints[0])
+
+        (y, x) = (self.row_y, self.column_x)
+        if final in "Hf":
+            (y, x) = (pn, max(PN1, ints[1]) if (len(ints) >= 2) else X1)
+        elif final in "ABCD":
+            (dy, dx) = DY_DX_BY_ARROW_KBYTES[f"\033[{final}".encode()]
+            (y, x) = (y + pn * dy, x + pn * dx)
+        elif final in "EF":
+            (y, x) = (y + (pn if (final == "E") else -pn), X1)
+        elif final in "G`":
+            x = pn
+        else:
+            y = pn
+
+        self.row_y = max(Y1, min(y, self.y_high))
+        self.column_x = max(X1, min(x, self.x_wide))
+        self.wrap_pending = False
+
+    def _try_mirror_write_(self) -> None:
+        """Require our Mirror to land the Cursor where a Terminal would"""
+
+        cases = [
+            ((1, 1), "abc", (1, 4)),
+            ((1, 1), "0123456789", (1, 10)),
+            ((1, 1), "0123456789x", (2, 2)),
+            ((1, 8), "0123456789" "0123", (3, 2)),
+            ((5, 3), "\r\n", (5, 1)),
+            ((5, 3), "\b\b\b", (5, 1)),
+            ((2, 3), "\t", (2, 9)),
+            ((2, 2), "\033[3;7H", (3, 7)),
+            ((2, 2), "\033[H", (1, 1)),
+            ((3, 7), "\033[2A\033[9C", (1, 10)),
+            ((3, 7), "\033[E", (4, 1)),
+            ((3, 7), "\0337\033[5;5Hxyz\0338", (3, 7)),
+            ((3, 7), "\033]11;?\a\033[?25l\033[38;5;31m\033[2P", (3, 7)),
+            ((1, 1), "日本", (1, 5)),
+        ]
+
+        for before, text, after in cases:
+            (self.y_high, self.x_wide) = (5, 10)
+            (self.row_y, self.column_x) = before
+            self.wrap_pending = False
+            self.yxhw_drift = False
+
+            self.mirror_write(text)
+
+            got = (self.row_y, self.column_x)
+            assert got == after, (got, after, before, text)
+            assert not self.yxhw_drift, (before, text)
+
+        self.mirror_write("\033[r")
+        assert self.yxhw_drift, (self.yxhw_drift,)
+
+    #
+    # Break Paste Lines
+    #
+
+    def write_paste_crlf(self) -> None:
+        """Break Paste Line at Cursor"""
+
+        stdio = self.stdio
+
+        text = self.paste_crlf_to_str()
+        stdio.write(text)
+
+    def paste_crlf_to_str(self) -> str:
+        """Say how to break the Paste Line at the Cursor, and move the Paste Y X to match"""
+
+        y_high = self.y_high
+        paste_y = self.paste_y
+        paste_x = self.paste_x
+
+        assert CUP_Y_X == "\033[" "{};{}H"  # CSI 04/08 [Choose] Cursor Position
+
+        text = ""
+        if paste_y < y_high:
+            paste_y = paste_y + 1
+        else:
+            text += "\n"
+
+        text += f"\033[{paste_y};{paste_x}H"  # todo: stop writing y == y
+
+        self.paste_y = paste_y
+
+        return text
+
+    def read_paste_chunks(self, timeout: float | None) -> collections.abc.Iterator[memoryview]:
+        """Yield the Bytes of the Paste before its ⎋[201~ End, in as few Chunks as fetched"""
+
+        kbytearray = self.kbytearray
         _pack_ = self._pack_
-        if not _pack_:
+        yxhw_terminal_inputs = self.yxhw_terminal_inputs
+
+        assert _END_PASTE_ == "\033[" "201~"
+        end = b"\033[201~"
+
+        t0 = time.time()
+        deadline = self._deadline_(timeout, t0=t0)
+
+        # Yield the Terminal Inputs framed already, and give back the Bytes of an open Pack
+
+        while yxhw_terminal_inputs:
+            if yxhw_terminal_inputs[0].kbytes == end:
+                return
+
+            ti = yxhw_terminal_inputs.pop(0)
+            yield memoryview(ti.kbytes)
+
+        if _pack_:
+            kbytearray.unread(_pack_.to_bytes())
+            _pack_.clear_pack()
+
+        # Search each Fetch once for the End, and yield every Byte before it
+
+        while True:
+            index = kbytearray.find(end)
+            if index >= 0:
+                if index:
+                    yield memoryview(kbytearray.take(index))
+
+                return  # leaves the ⎋[201~ End, to frame as a Terminal Input
+
+            keep = 0  # holds back a Tail that may start the End
+            for count in range(len(end) - 1, 0, -1):
+                if kbytearray.endswith(end[:count]):
+                    keep = count
+                    break
+
+            if len(kbytearray) > keep:
+                yield memoryview(kbytearray.take(len(kbytearray) - keep))
+
+            if self._deadline_passed_(deadline):
+                return  # keeps the Tail not yet taken, for the next Read to take
+
+            tail = kbytearray.take(keep) if keep else b""
+            self._fill_kbytearray_(timeout=self._timeout_till_(deadline))
+            kbytearray.unread(tail)
+
+        # yields Chunks as large as each Poke, not 1 Terminal Input per Byte or per Run of Text
+
+    def kbhit(self, timeout: float | None) -> bool:  # a la msvcrt.kbhit
+        """Block till next Input Byte, else till Timeout, else till forever"""
+
+        kbytearray = self.kbytearray
+        if kbytearray:
+            return True
+
+        hit = self._kbhit_(timeout=timeout)
+
+        return hit
+
+    def _kbhit_(self, timeout: float | None) -> bool:  # a la msvcrt.kbhit
+        """Block till next Input Byte, else till Timeout, else till forever"""
+
+        stdio = self.stdio
+        tcgetattr = self.tcgetattr
+
+        assert tcgetattr, (tcgetattr,)
+
+        stdio.flush()  # before 'select.select' of _kbhit_
+
+        fileno_hit = self._select_hit_(timeout=timeout)
+
+        return fileno_hit
+
+        # 'timeout' is None for Never, 0 for Now, else a Float of Seconds
+
+    def _deadline_(self, timeout: float | None, t0: float) -> float | None:
+        """Say when the Timeout ends, else None to wait forever"""
+
+        if timeout is None:
+            return None
+
+        deadline = t0 + timeout
+        return deadline
+
+    def _timeout_till_(self, deadline: float | None) -> float | None:
+        """Say how long till the Deadline, else None to wait forever"""
+
+        if deadline is None:
+            return None
+
+        timeout = max(0.0, deadline - time.time())
+        return timeout
+
+    def _deadline_passed_(self, deadline: float | None) -> bool:
+        """Say if the Deadline has come and gone"""
+
+        if deadline is None:
+            return False
+
+        passed = time.time() >= deadline
+        return passed
+
+    def _select_hit_(self, timeout: float | None) -> bool:
+        """Block till next Input Byte, else till Timeout, else till forever, but don't flush"""
+
+        fileno = self.fileno
+        stop_fileno = self.stop_fileno
+
+        filenos = [fileno] if (stop_fileno < 0) else [fileno, stop_fileno]
+
+        (r, w, x) = select.select(filenos, [], [], timeout)
+        self.read_syscalls += 1
+
+        fileno_hit = fileno in r
+
+        return fileno_hit
+
+    def _read_burst_(self) -> bytes:
+        """Block till 1 or more Bytes arrive, drain every Byte waiting, and drop late ⎋[0N Replies"""
+
+        read = self._drop_late_dsr_0_(self._read_kernel_burst_())
+
+        while self.dsr_0_carry:  # waits a while for the rest of a ⎋[0 N Reply split across Bursts
+            if not self._select_hit_(timeout=IdleGapMax):
+                read += self.dsr_0_carry  # takes the Bytes as Input, when no Reply completes them
+                self.dsr_0_carry = b""
+                break
+
+            read += self._drop_late_dsr_0_(self._read_kernel_burst_())
+
+        return read
+
+    def _drop_late_dsr_0_(self, read: bytes) -> bytes:
+        """Drop the late ⎋[0N Replies owed at the Head of the Burst, and carry a partial Reply over"""
+
+        dsr_0 = b"\033[0n"
+
+        read = self.dsr_0_carry + read
+        self.dsr_0_carry = b""
+
+        while self.dsr_0_owed and read.startswith(dsr_0):
+            read = read[len(dsr_0) :]
+            self.dsr_0_owed -= 1
+
+        if self.dsr_0_owed and read and dsr_0.startswith(read):
+            self.dsr_0_carry = read
+            return b""
+
+        return read
+
+        # keeps each ⎋[0 N typed or pasted, when it comes after other Bytes of the Burst
+
+    def _read_kernel_burst_(self) -> bytes:
+        """Block till 1 or more Bytes arrive, and then drain every Byte waiting in the Kernel"""
+
+        fileno = self.fileno
+        read_bytearray = self.read_bytearray
+
+        burst_gap = self.gap_stats.burst_gap()  # starts as Immediately
+
+        # Read into 1 reused Buffer, and grow it only when a Burst overflows it
+
+        fd = fileno
+        length = 0
+        while True:
+            if length == len(read_bytearray):
+                read_bytearray.extend(bytes(len(read_bytearray)))  # doubles
+
+            with memoryview(read_bytearray) as view:
+                count = os.readv(fd, [view[length:]])  # trust the Caller to flush before here
+
+            self.read_syscalls += 1
+            length += count
+
+            if not count:
+                break  # todo: Log if End-of-Input ever comes
+
+            # Quit as soon as the Kernel stops holding more Bytes for us
+
+            if not self._select_hit_(timeout=burst_gap):
+                break
+
+        # Copy the Bytes out once, and leave the Buffer in place to reuse
+
+        with memoryview(read_bytearray) as view:
+            read = view[:length].tobytes()
+
+        self.read_length += length
+
+        return read
+
+        # 1 'os.readv' and 1 'select.select' per Keystroke, or per KiB of Paste, or less
+        # todo: Log if the Burst Gap ever merges 2 Keystrokes into 1 Burst
+
+    #
+    # Take next Input from a Y X in a High Wide Screen
+    #
+
+    def read_yxhw_terminal_input(self, timeout: float | None) -> TerminalInput | None:
+        """Take next Input from a Y X in a High Wide Screen"""
+
+        stdio = self.stdio
+        yxhw_backtails = self.yxhw_backtails
+        yxhw_terminal_inputs = self.yxhw_terminal_inputs
+
+        assert CSI == "\033["
+        assert DCH_X == "\033[" "{}" "P"
+        assert DSR_6 == "\033[" "6n"
+        assert XTWINOPS_18 == "\033[" "18t"
+
+        # Drain the Terminal-Input's fetched already
+
+        if yxhw_terminal_inputs:
+            ti = yxhw_terminal_inputs.pop(0)
+            return ti
+
+        # Ask for Height, Width, Cursor Y, Cursor X, but only when our Mirror of them drifts,
+        # and then also take some other Input
+
+        if self._yxhw_drifting_():
+            self.yxhw_drift = False  # till the next Resize, or Write we can't mirror
+            self.yxhw_synced = time.time()
+
+            if b"t" not in yxhw_backtails:
+                stdio.write("\033[18t")  # ⎋[18T call for reply ⎋[8;{rows};{columns}T
+                yxhw_backtails.append(b"t")
+
+            if b"R" not in yxhw_backtails:
+                stdio.write("\033[6n")  # ⎋[6N calls for reply ⎋[{y};{x}⇧R
+                yxhw_backtails.append(b"R")
+
+        if b"" not in yxhw_backtails:
+            yxhw_backtails.append(b"")  # waits for whatever other reply
+
+        # Take Inputs in whatever order  # todo: Log if Input ever comes out of order
+
+        t0 = time.time()
+        deadline = self._deadline_(timeout, t0=t0)
+
+        while yxhw_backtails:  # todo3: count .yxhw_backtails per second
+
+            # Hang invisibly while Multibyte Sequences arrive slowly  # todo3: Do better
+
+            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=self._timeout_till_(deadline))
+
+            if not kbytes:
+                if self._deadline_passed_(deadline):
+                    break  # keeps the .yxhw_backtails still owed, and any Pack not yet closed
+                continue
+
+            # Form 1 more TerminalInput per each burst of K Bytes
+
+            kbytes_ti = TerminalInput(kbytes)
+            assert kbytes_ti is not None, (kbytes_ti,)
+            assert kbytes_ti, (kbytes,)
+
+            self._ti_snoop_(kbytes_ti)
+
+            caps = kbytes_ti.caps
+
+            # Take Csi Inputs
+
+            if caps.startswith("⎋["):
+                backtail = kbytes_ti.backtail
+                if backtail and (backtail in yxhw_backtails):
+                    ints = kbytes_ti.to_csi_ints_if(backtail, start=b"", default=-1)
+                    if ints:
+
+                        yxhw_backtails.remove(backtail)
+                        continue
+
+            # Take Input other than the first Height, Width, Cursor Y, Cursor X
+
+            if b"" in yxhw_backtails:
+                yxhw_backtails.remove(b"")
+
+                yxhw_terminal_inputs.append(kbytes_ti)
+                continue
+
+            yxhw_terminal_inputs.append(kbytes_ti)
+
+        if not yxhw_terminal_inputs:
+            return None
+
+        ti = yxhw_terminal_inputs.pop(0)
+
+        # Snoop
+
+        self._ti_snoop_(ti)  # todo3: we so often bypass this snoop - and nothing breaks??
+
+        # Succeed
+
+        return ti
+
+        # todo: write to refresh H W Y X again after evalling other Input vs H W Y X?
+        # todo: listen for signals of H W changing? (and show no signals come from Y X changing?)
+
+    def read_yxhw_terminal_inputs(self, timeout: float | None) -> list[TerminalInput]:
+        """Take next Input from a Y X in a High Wide Screen, and the Inputs of its Frame read already"""
+
+        kbytearray = self.kbytearray
+        yxhw_terminal_inputs = self.yxhw_terminal_inputs
+
+        tis: list[TerminalInput] = list()
+
+        ti = self.read_yxhw_terminal_input(timeout=timeout)
+        if ti:
+            tis.append(ti)
+
+        while kbytearray or yxhw_terminal_inputs:
+            if tis and (tis[-1].kbytes == b"\033[200~"):
+                break  # leaves the Body of a Bracketed Paste for .read_paste_chunks
+
+            ti = self.read_yxhw_terminal_input(timeout=0.0)  # takes 1 Byte or more
+            if ti:
+                tis.append(ti)
+
+        return tis
+
+        # keeps the Pack of a split Input open, for the next Frame to close
+
+    def _yxhw_drifting_(self) -> bool:
+        """Say if our Mirror of H W Y X may have drifted from the Terminal"""
+
+        if -1 in (self.y_high, self.x_wide, self.row_y, self.column_x):
+            return True
+
+        if self.yxhw_drift:
+            return True
+
+        if (time.time() - self.yxhw_synced) >= ResyncPeriod:
+            return True
+
+        return False
+
+    def negotiate_kitty_keyboard(self, timeout: float | None) -> int:
+        """Push the Kitty Keyboard Flags, if the Terminal answers ⎋[?U, else fall back"""
+
+        stdio = self.stdio
+        exits = self.exits
+        kbytearray = self.kbytearray
+
+        assert DSR_5 == "\033[" "5n"
+
+        stdio.write("\033[?u")  # ⎋[?U calls for reply ⎋[?{flags}U, if Kitty Keyboard Protocol
+        stdio.write("\033[5n")  # ⎋[5N calls for reply ⎋[0N, from every Terminal
+
+        t0 = time.time()
+        deadline = self._deadline_(timeout, t0=t0)
+
+        # Take the Replies, but put back other Inputs
+
+        flags_if = -1
+        other_kbytes = b""
+        while True:
+            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=self._timeout_till_(deadline))
+            if not kbytes:
+                if self._deadline_passed_(deadline):
+                    self.dsr_0_owed += 1  # drops the ⎋[0 N Reply when it does arrive
+                    break
+                continue
+
+            if kbytes == b"\033[0n":
+                break
+
+            m = KITTY_FLAGS_REGEX.fullmatch(kbytes)
+            if m:
+                flags_if = int(m.group(1) or b"0")
+                continue
+
+            other_kbytes += kbytes
+
+        kbytearray.unread(other_kbytes)
+
+        # Fall back to legacy Keyboard Encodings, else push the Flag to Disambiguate Escape Codes
+
+        if flags_if < 0:
+            return 0
+
+        stdio.write("\033[>1u")  # ⎋[>1U pushes Flags 1 to disambiguate ⎋ ⌃ ⌥ Keys
+        exits.insert(0, b"\033[<u")  # ⎋[<U pops the Flags at Exit
+
+        self.kitty_flags = 1
+
+        return self.kitty_flags
+
+    def read_appearance_theme_if(self, timeout: float | None) -> tuple[int, int, int] | tuple[()]:
+        """Ask for the Background Color, and take it, else the ⎋[0 N Reply, else the Deadline"""
+
+        stdio = self.stdio
+
+        assert BEL == "\007"  # 07/07 Bell
+        assert OSC == "\033]"  # ⎋]
+        assert ST == "\033\134" == "\033\\"
+
+        stdio.write("\033]11;?\a")  # tests our non-reply Code while commented out
+        stdio.write("\033[5n")  # asks for ⎋[0N in place of a missing ⎋ ] 1 1 ; R G B ⇧: Osc Reply
+
+        t0 = time.time()
+        deadline = self._deadline_(timeout, t0=t0)
+
+        kbytes = b""
+        while not kbytes:
+            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=self._timeout_till_(deadline))
+            if (not kbytes) and self._deadline_passed_(deadline):
+                self.dsr_0_owed += 1  # drops the ⎋[0 N Reply when it does arrive
+                return ()  # todo3: drop a late ⎋]11 Reply too
+
+        if kbytes == b"\033[0n":  # injectable at test via stdio.write("\033[5n")
+            return ()
+
+        reply = osc_kbytes_to_reply_if(kbytes)
+        assert isinstance(reply, OscColorReply) and (reply.ps == 11), (reply, kbytes)
+
+        # Take the ⎋[0 N Reply too, even when it comes later, split off from the ⎋]11 Reply
+
+        self._read_dsr_0_reply_(deadline)
+
+        return reply.rgb
+
+    def _read_dsr_0_reply_(self, deadline: float | None) -> None:
+        """Take the ⎋[0 N Reply, else count it as owed at the Deadline, and give back other Input"""
+
+        kbytearray = self.kbytearray
+
+        other_kbytes = b""
+        while True:
+            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=self._timeout_till_(deadline))
+            if not kbytes:
+                if self._deadline_passed_(deadline):
+                    self.dsr_0_owed += 1  # drops the ⎋[0 N Reply when it does arrive
+                    break
+                continue
+
+            if kbytes == b"\033[0n":
+                break
+
+            other_kbytes += kbytes
+
+        kbytearray.unread(other_kbytes)
+
+    #
+    # Read a parsed Terminal Input, or just Framed Bytes, from Keyboard, Mouse, and Touch
+    #
+
+    def read_terminal_input(self, timeout: float | None) -> TerminalInput | None:
+        """Read the next 1 Terminal Input, else None at Deadline or while a Pack stays open"""
+
+        kbytearray = self.kbytearray
+
+        t0 = time.time()
+        deadline = self._deadline_(timeout, t0=t0)
+
+        while True:
+            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=self._timeout_till_(deadline))
+            if kbytes:
+                break
+
+            if (not kbytearray) or self._deadline_passed_(deadline):
+                return None  # keeps the Pack not yet closed, for the next Read to close
+
+        ti = TerminalInput(kbytes)
+        return ti
+
+    def read_frame_terminal_inputs(self) -> list[TerminalInput]:
+        """Read 1 Terminal Input or more, till no more Bytes of this Frame wait to be taken"""
+
+        kbytearray = self.kbytearray
+
+        tis: list[TerminalInput] = list()
+        while True:
+            timeout = 0.0 if tis else None
+            ti = self.read_terminal_input(timeout=timeout)
+            if ti:
+                tis.append(ti)
+
+            if tis and not kbytearray:
+                break
+
+        return tis
+
+        # keeps the Pack of a split Input open, for the next Frame to close
+
+    def read_kbyte_kbytes(self, timeout: float | None) -> tuple[bytes, bytes]:
+        """Read 0 Bytes at Timeout, or 1 Byte or 1 Run of Text into the Pack, and close it or not"""
+
+        kbytearray = self.kbytearray
+        _pack_ = self._pack_
+
+        pack_kbytes = _pack_.to_bytes()  # maybe not .closed
+
+        # Accept the ⌥`` encoded as an Immediate Pair of b"``"
+
+        if self._pack_closes_alone_():  # if closing out taking the ⌥`` encoded as bundled b"``"
+            poke_kbyte = b"`"
+            _pack_.close()
+            return (poke_kbyte, pack_kbytes)
+
+        # Fetch one Poke, unless Input Bytes already fetched
+
+        if not kbytearray:
+            tp = self._fill_kbytearray_(timeout=timeout)
+            if not kbytearray:
+                return (b"", b"")
+
+            self._kbytearray_take_arrow_burst_if_(tp)
+
+        # Take a whole Osc Sequence in 1 Step per Fetch, not 1 Step per Byte
+
+        osc_kbytes = self._take_osc_if_()
+        if osc_kbytes:
+            return (osc_kbytes[:1], osc_kbytes)
+
+        if self.osc_bytearray or not kbytearray:
+            return (b"", b"")  # leaves the Osc Sequence open, or dropped it for growing too long
+
+        # Take a whole SGR Mouse Report in 1 Step, not 1 Step per Byte
+
+        mouse_kbytes = self._take_mouse_report_if_()
+        if mouse_kbytes:
+            return (mouse_kbytes[:1], mouse_kbytes)
+
+        # Take a whole Run of Printable Text into the Pack, and close the Pack, sometimes
+
+        text_kbytes = self._take_text_run_if_()
+        if text_kbytes:
+            kbytes = _pack_.to_bytes()
+            _pack_.clear_pack()
+
+            return (text_kbytes, kbytes)
+
+        poke_kbyte = kbytearray.peek(1)  # does peek, doesn't pop
+
+        # Add the next one or two Bytes into the Pack, or don't, and close the Pack, or don't
+
+        n = self._take_enough_bytes_if_()
+
+        # Pass back just the first Byte taken, if not closed yet
+
+        if not _pack_.closed:
+            assert n, (n, poke_kbyte, kbytearray, _pack_)
+            return (poke_kbyte, b"")
+
+        # Read & clear each closed Pack
+
+        kbytes = _pack_.to_bytes()
+        assert kbytes, (kbytes, poke_kbyte, kbytearray)
+
+        _pack_.clear_pack()
+
+        # Return the Bytes of the closed Pack
+
+        return (poke_kbyte if n else b"", kbytes)
+
+    def _pack_closes_alone_(self) -> bool:
+        """Say if the Pack closes without waiting for more Input"""
+
+        _pack_ = self._pack_
+
+        if not _pack_.closed:
+            if _pack_.to_bytes() == b"``":
+                return True
+
+        return False
+
+    def _kbytearray_take_arrow_burst_if_(self, tp: TerminalPoke) -> None:
+        """Collapse an Arrow Burst down into a Mouse Release, if present"""
+
+        kbytearray = self.kbytearray
+
+        y_high = self.y_high
+        x_wide = self.x_wide
+        row_y = self.row_y
+        column_x = self.column_x
+
+        if -1 in (y_high, x_wide, row_y, column_x):
+            return
+
+        (mouse_kbytes, arrow_kbytes) = self.tp_from_startswith_mouse_arrow_kbytes(tp)
+        assert bool(mouse_kbytes) == bool(arrow_kbytes), (mouse_kbytes, arrow_kbytes, tp)
+        if mouse_kbytes:
+            self._arrows_kbytes_lately_ = arrows_kbytes_pn_compress(arrow_kbytes)
+
+            if len(arrow_kbytes) >= (4 * 3):  # if not much like a single Arrow Repeated
+                kbytearray.advance(len(arrow_kbytes))
+                kbytearray.unread(mouse_kbytes)
+
+    def _take_osc_if_(self) -> bytes:
+        """Take a whole Osc Sequence, else take what's fetched of it, else take 0 Bytes"""
+
+        kbytearray = self.kbytearray
+        _pack_ = self._pack_
+        osc_bytearray = self.osc_bytearray
+
+        assert BEL == "\007"  # 07/07 Bell
+        assert OSC == "\033]"  # ⎋]
+        assert ST == "\033\134" == "\033\\"
+
+        if not osc_bytearray:
+            if _pack_ or not kbytearray.startswith(b"\033]"):
+                return b""
+
+            osc_bytearray.extend(kbytearray.take(2))
+
+        # Take the Printable Payload fetched so far, in 1 Match
+
+        if not osc_bytearray.endswith(b"\033"):
+            m = kbytearray.match_if(OSC_PAYLOAD_REGEX)
+            assert m, (m, kbytearray)  # matches 0 or more Bytes
+
+            count = m.end() - m.start()
+            if count:
+                payload = kbytearray.take(count)
+                if not self.osc_dropping:
+                    osc_bytearray.extend(payload)
+
+            if (len(osc_bytearray) - 2) > self.osc_bytes_max:
+                del osc_bytearray[2:]
+                self.osc_dropping = True  # drops the rest, but still looks for the End
+
+            if not kbytearray:
+                return b""  # leaves the Osc Sequence open, for the next Fetch
+
+            if kbytearray.startswith(b"\007"):
+                osc_bytearray.extend(kbytearray.take(1))
+                return self._osc_close_()  # closes at \007 BEL
+
+            if not kbytearray.startswith(b"\033"):
+                self._osc_fall_back_()
+                return b""
+
+            empty = (osc_bytearray == b"\033]") and not self.osc_dropping
+            if empty and not kbytearray.startswith(b"\033\\"):
+                self._osc_fall_back_()
+                return b""  # closes the ⎋] alone, at a ⎋ not fetched with its \ of ST
+
+            osc_bytearray.extend(kbytearray.take(1))
+
+        # Close at the ⎋\ String Terminator (ST), even when split across Fetches
+
+        if not kbytearray:
+            return b""  # leaves the Osc Sequence open, for the next Fetch
+
+        if not kbytearray.startswith(b"\\"):
+            self._osc_fall_back_()
+            return b""
+
+        osc_bytearray.extend(kbytearray.take(1))
+        return self._osc_close_()
+
+        # takes the Payload of 1 Fetch in 1 Match, not 1 Step per Byte
+        # keeps no more than .osc_bytes_max Bytes, no matter how long the Payload runs
+
+    def _osc_close_(self) -> bytes:
+        """Take the Bytes of the Osc Sequence closed, else take 0 Bytes if dropped"""
+
+        osc_bytearray = self.osc_bytearray
+
+        kbytes = bytes(osc_bytearray)
+        osc_bytearray.clear()
+
+        if self.osc_dropping:
+            self.osc_dropping = False
+            self.osc_drops += 1
+            return b""
+
+        return kbytes
+
+    def _osc_fall_back_(self) -> None:
+        """Give back the Osc Sequence not closed by \007 BEL nor ⎋\\ ST, to frame Byte by Byte"""
+
+        kbytearray = self.kbytearray
+        _pack_ = self._pack_
+        osc_bytearray = self.osc_bytearray
+
+        kbytes = bytes(osc_bytearray)
+        osc_bytearray.clear()
+
+        if self.osc_dropping:
+            self.osc_dropping = False
+            self.osc_drops += 1
+            kbytes = kbytes[:2]  # gives back just the ⎋] of the Osc Sequence dropped
+
+        kbytearray.unread(kbytes[2:])
+
+        for kbyte in (b"\033", b"]"):  # takes the ⎋] Head into the Pack, as the Pack would
+            extras = _pack_.take_one_if(kbyte)
+            assert not extras, (extras, kbyte, _pack_)
+
+        # frames an Osc Sequence of Unprintable or Multi-Byte Chars, as before
+
+    def _take_mouse_report_if_(self) -> bytes:
+        """Take a whole SGR Mouse Report, if the Pack is empty, else take 0 Bytes"""
+
+        kbytearray = self.kbytearray
+        _pack_ = self._pack_
+
+        if _pack_ or not kbytearray.startswith(b"\033[<"):
+            return b""
+
+        m = kbytearray.match_if(MOUSE_SGR_REGEX)
+        if not m:
+            return b""  # leaves a Report not yet whole to ._take_enough_bytes_if_
+
+        kbytes = m.group(0)
+        kbytearray.advance(len(kbytes))
+
+        return kbytes
+
+        # frames each of a Flood of ⎋[?1003H Motion Reports by 1 Regex Match
+
+    def _take_text_run_if_(self) -> bytes:
+        """Take a whole Run of Printable Text into the Pack, and close the Pack, sometimes"""
+
+        kbytearray = self.kbytearray
+        _pack_ = self._pack_
+
+        if _pack_:
+            return b""  # leaves Text after a Head to ._take_enough_bytes_if_
+
+        if (len(kbytearray) == 2) and kbytearray.startswith(b"``"):
+            return b""  # leaves the ⌥`` encoded as bundled b"``" to ._take_two_bytes_if_
+
+        text_kbytes = kbytearray.take_text_if()
+        if not text_kbytes:
+            return b""
+
+        extras = _pack_.take_some_if(text_kbytes)
+        assert not extras, (extras, text_kbytes, _pack_)
+        assert _pack_.text, (_pack_, text_kbytes)
+
+        _pack_.close()
+
+        return text_kbytes
+
+        # takes a Paste of Text between Control Bytes in 1 Step, not 1 Step per Byte
+
+    def _take_enough_bytes_if_(self) -> int:
+        """Add the next one or two Bytes into the Pack, or don't, and close the Pack, or don't"""
+
+        kbytearray = self.kbytearray
+        poke_length = len(kbytearray)
+        poke_kbyte = kbytearray.peek(1)  # does peek, doesn't pop
+
+        _pack_ = self._pack_
+
+        paste_y = self.paste_y
+
+        # Take 2 Bytes into the Pack as Text and leave the Pack open, sometimes
+
+        if self._take_two_bytes_if_():  # like if opening up taking the ⌥`` encoded as bundled b"``"
+            return 1  # 2 into the Pack, 1 back to the Caller
+
+        # Take 0 Bytes and close the Pack abruptly, sometimes
+
+        if self._take_no_bytes_if_():
+            assert _pack_.closed, (_pack_.closed, _pack_, kbytearray)
+            return 0
+
+        # Try taking 1 Byte into the Pack
+
+        extra = _pack_.take_one_if(poke_kbyte)  # truthy at ⎋ [ ⇧! 9, etc
+        if not extra:
+            kbytearray.advance(1)
+
+        n = int(not extra)
+
+        pack_kbytes = _pack_.to_bytes()  # replaces  # maybe .closed, maybe not
+        six_byte_mouse_auth = (paste_y == -1) and (poke_length > 1)
+        if (pack_kbytes == b"\033[M") and not six_byte_mouse_auth:  # ⎋[M
+            ok = _pack_.close_if_csi_shift_m()
+            assert ok, (ok, _pack_, pack_kbytes)
+
+        # Close abruptly, if taking 1 Byte made Text, or if taking 0 Bytes
+
+        if _pack_.text or extra:
+            _pack_.close()
+
+        return n
+
+        # todo2: merge ._take_enough_bytes_if_ into TerminalBytePack
+        # todo1: Think more about accepting more than ⎋ as a prefix for whatever
+
+    def _take_two_bytes_if_(self) -> bool:
+        """Take 2 Bytes into the Pack as Text and leave the Pack open, sometimes"""
+
+        kbytearray = self.kbytearray
+
+        _pack_ = self._pack_
+        if not _pack_:
+
+            if (len(kbytearray) == 2) and kbytearray.startswith(b"``"):
+
+                kbytearray.clear()
+                _pack_.take_one(b"`")  # once
+                _pack_.take_one(b"`")  # twice
+
+                assert not _pack_.closed, (_pack_, kbytearray)
+
+                return True
+
+        return False
+
+    def _take_no_bytes_if_(self) -> bool:
+        """Take 0 Bytes and close the Pack abruptly, sometimes"""
+
+        kbytearray = self.kbytearray
+        _pack_ = self._pack_
+
+        pack_kbytes = _pack_.to_bytes()  # maybe not .closed
+        pack_startswith_osc = pack_kbytes.startswith(b"\033]")
+        pack_endswith_esc = pack_kbytes.endswith(b"\033")
+
+        poke_kbyte = kbytearray.peek(1)  # does peek, doesn't pop
+
+        headbook = (b"\033", b"\033\033", b"\033\033O", b"\033\033[", b"\033O", b"\033[", b"\033]")
+        assert TerminalBytePack.Headbook == headbook
+
+        poke_decode_if = ""  # decodes only the next 1 Char, not every Byte not yet taken
+        (need, lo, hi, code) = UTF8_LEAD_BY_BYTE[poke_kbyte[0]]
+        if need >= 0:
+            try:
+                poke_decode_if = kbytearray.peek(1 + need).decode()
+            except UnicodeDecodeError:
+                pass
+
+        # Do take unprintable Bytes after the Head Bytes when taking to close an Osc Sequence
+
+        if pack_startswith_osc and (poke_kbyte == b"\007"):
+            return False  # \007 BEL
+        elif pack_startswith_osc and kbytearray.startswith(b"\033\134"):
+            return False  # \033 \134 Esc \ String Terminator (ST)
+        elif pack_startswith_osc and pack_endswith_esc and (poke_kbyte == b"\134"):
+            return False  # \033 \134 Esc \ String Terminator (ST)
+
+        # Generally do Not take unprintable Bytes after the Head Bytes
+
+        if (not poke_decode_if) or (not poke_decode_if[:1].isprintable()):
+            if pack_kbytes in headbook:
+                if pack_kbytes != b"\033":  # ⎋
+
+                    _pack_.close()
+
+                    return True  # ⎋⎋ ⎋⎋O ⎋⎋[ ⎋O ⎋[
+
+        # Generally do take printable Bytes after the Head Bytes
+
+        return False
+
+    def _ti_snoop_(self, ti: TerminalInput) -> None:
+        """Mirror updates to Height, Width, Y, and X, as they fly by"""
+
+        if ti.backtail == b"R":
+            self._ti_snoop_row_y_column_x_(ti)
+        elif ti.backtail == b"t":
+            self._ti_snoop_y_high_x_wide_(ti)
+        elif ti.backtail == b"~":
+            self._ti_snoop_paste_start_end_(ti)
+
+    def _ti_snoop_row_y_column_x_(self, ti: TerminalInput) -> None:
+        """Snoop ⎋[ ⇧R Cursor-Position-Report (CSR) of Terminal Cursor Y X"""
+
+        assert CPR_Y_X == "\033[" "{};{}R"
+
+        yx_ints = ti.to_csi_ints_if(b"R", start=b"", default=PN1)  # ⎋[ ⇧R
+        if len(yx_ints) == 2:
+            self.row_y = yx_ints[0]
+            self.column_x = yx_ints[-1]
+            self.wrap_pending = False  # todo: Mirror a Pending Wrap reported as the last Column
+
+    def _ti_snoop_y_high_x_wide_(self, ti: TerminalInput) -> None:
+        """Snoop ⎋[8 T Terminal Window Pane > Y-Height x X-Width Report"""
+
+        assert XTWINOPS_8_H_W == "\033[" "8;{};{}t"
+
+        nhw_ints = ti.to_csi_ints_if(b"t", start=b"", default=PN1)  # ⎋[8 T
+        if len(nhw_ints) == 3:
+            assert nhw_ints[0] == 8, (nhw_ints[0], nhw_ints)
+            self.y_high = nhw_ints[1]
+            self.x_wide = nhw_ints[2]
+
+    def _ti_snoop_paste_start_end_(self, ti: TerminalInput) -> None:
+        """Snoop ⎋[200~ ⎋[201~ Start/ End of Bracketed Paste"""
+
+        assert _SM_BRACKETED_PASTE_ == "\033[" "?2004h"
+        assert _RM_BRACKETED_PASTE_ == "\033[" "?2004l"
+
+        se_ints = ti.to_csi_ints_if(b"~", start=b"", default=PS0)  # ⎋[ ⇧~
+        if len(se_ints) == 1:
+            ps = se_ints[-1]
+
+            if ps == 200:
+
+                assert -1 not in (self.row_y, self.column_x), (self.row_y, self.column_x)
+
+                self.paste_y = self.row_y
+                self.paste_x = self.column_x
+
+            if ps == 201:
+
+                assert -1 not in (self.row_y, self.column_x), (self.row_y, self.column_x)
+
+                if -1 not in (self.paste_y, self.paste_x):
+                    if self.column_x != self.paste_x:
+                        self.write_paste_crlf()
+
+                self.paste_y = -1
+                self.paste_x = -1
+
+                # todo3: Paste lands vertically only  while .row_y .column_x mirrors accurate
+
+    #
+    # Read a single Byte from Keyboard, Mouse, and Touch
+    #
+
+    def getch(self, timeout: float | None) -> bytes:  # a la msvcrt.getch
+        """Read next Byte of Keyboard Chord, Mouse Arrow Burst, Mouse Click, or Touch Tap"""
+
+        kbytearray = self.kbytearray
+
+        # Fetch more Bytes, when needed
+
+        if not kbytearray:
+            self._fill_kbytearray_(timeout=timeout)
+            if not kbytearray:
+                return b""
+
+        # Pass back the first Byte
+
+        kord = kbytearray.pop0()
+        kbytes = bytes([kord])
+
+        return kbytes
+
+        # todo: more test of .getch
+
+    def _fill_kbytearray_(self, timeout: float | None) -> TerminalPoke:
+        """Fetch Bytes into Self, and return their Timing and simple ⎋[0 N Closing separately"""
+
+        tp = self.read_terminal_poke(timeout=timeout)
+        tp = self._kbytearray_take_poke_(tp)
+
+        return tp
+
+    def _kbytearray_take_poke_(self, tp: TerminalPoke) -> TerminalPoke:
+        """Take the Bytes of the Poke, less its simple ⎋[0 N Closing, into Self"""
+
+        kbytearray = self.kbytearray
+        assert not kbytearray, (kbytearray,)
+
+        assert DSR_0 == "\033[" "0n"
+
+        kbytes = tp.to_kbytes()  # can be '\033[0n\033[0n'
+
+        if tp.reads and not self._frames_at_dsr_0_(tp.reads[0]):
+            kbytearray.extend(kbytes)  # keeps each ⎋[0 N, as no ⎋[5 N Call closed this Poke
+            return tp
+
+        if tp.reads and tp.reads[-1].endswith(b"\033[0n"):
+            tp_reads_n1 = tp.reads[-1].removesuffix(b"\033[0n")
+            tp_reads = tp.reads[:-1] + (tp_reads_n1,)
+
+            tp = dataclasses.replace(tp, reads=tp_reads)
+            kbytes = tp.to_kbytes()  # todo: Log if ⎋[0 N ever comes as KByte Fill when unexpected?
+
+        kbytearray.extend(kbytes)
+
+        return tp
+
+    #
+    # Read one Keyboard Chord, Mouse Arrow Burst, Mouse Click, or Touch Tap
+    # And fabricate the Key Caps and Bytes of a Mouse Release, when encoded as an Arrow Burst
+    #
+
+    def read_terminal_poke(self, timeout: float | None) -> TerminalPoke:
+        """Read one Keyboard Chord, Mouse Arrow Burst, Mouse Click, or Touch Tap"""
+
+        stdio = self.stdio
+
+        assert Immediately == 0.000_001
+        assert DSR_5 == "\033[" "5n"
+        assert DSR_0 == "\033[" "0n"
+
+        # Wait for Input, but not past the Deadline
+
+        t0 = time.time()
+        deadline = self._deadline_(timeout, t0=t0)
+
+        while True:
+            kbhit = self._kbhit_(timeout=self._timeout_till_(deadline))
+            t1 = time.time()
+
+            hit = t1 - t0
+            if not kbhit:
+                tp = TerminalPoke(hit=hit, delays=tuple(), reads=tuple(), extra=b"")
+                return tp
+
+            # Read the first Burst of Bytes
+
+            stdio.flush()  # before the first Burst of 'os.readv' of .read_terminal_poke
+
+            read_length = self.read_length
+            read = self._read_burst_()
+            t2 = time.time()
+
+            if read or (self.read_length == read_length):
+                break  # takes Input, or End-of-Input, but not only late ⎋[0 N Replies
+
+        self.poke_arrival = t1
+
+        delay_list: list[float] = [t2 - t1]
+        read_list: list[bytes] = [read]
+
+        # Close at an Idle Gap, except wait for the ⎋[0 N Reply after a lone ⎋ or ` or ``
+
+        extra = b""
+        idle_gap = 0.0
+        if self.kitty_flags:
+            self._read_kitty_bursts_(delay_list, read_list=read_list, t=t2, deadline=deadline)
+        elif not self._frames_at_dsr_0_(read):
+            idle_gap = self._read_idle_bursts_(delay_list, read_list, t=t2, deadline=deadline)
+        else:
+            stdio.write("\033[5n")
+            extra = self._read_dsr_0_bursts_(delay_list, read_list, t=t2, deadline=deadline)
+
+            # todo: Try calling for different Replies to close Input
+
+        # Succeed
+
+        tp = self._close_terminal_poke_(hit, delay_list, read_list, extra=extra, idle_gap=idle_gap)
+
+        return tp
+
+    def _frames_at_dsr_0_(self, read: bytes) -> bool:
+        """Say if a Poke opened by this Burst closes at the ⎋[0 N Reply to its own ⎋[5 N Call"""
+
+        if self.kitty_flags:
+            return False
+
+        if self.idle_framing and (read not in (b"\033", b"`", b"``")):
+            return False
+
+        return True
+
+    def _close_terminal_poke_(
+        self,
+        hit: float,
+        delay_list: list[float],
+        read_list: list[bytes],
+        extra: bytes,
+        idle_gap: float = 0.0,
+    ) -> TerminalPoke:
+        """Form the TerminalPoke of the Bursts read, and count its Gaps"""
+
+        kbytes = b"".join(read_list)
+        if kbytes == b"``" b"\033[0n":
+            assert len(read_list) >= 2, (read_list,)
+            read_list[::] = (b"``", b"\033[0n")
+            delay_list[::] = (sum(delay_list[:1]), delay_list[-1])
+
+        reads = tuple(read_list)
+        delays = tuple(delay_list)
+
+        tp = TerminalPoke(hit=hit, delays=delays, reads=reads, extra=extra)
+        self.gap_stats.take_poke(tp, arrival=self.poke_arrival, idle_gap=idle_gap)
+
+        return tp
+
+        # 'idle_gap' is the Idle Gap that closed the Poke, else 0 when a Deadline or Reply did
+
+    def _read_dsr_0_bursts_(
+        self, delay_list: list[float], read_list: list[bytes], t: float, deadline: float | None
+    ) -> bytes:
+        """Take quick and slow Inputs till the closing ⎋[0 N Reply does arrive, or the Deadline"""
+
+        stdio = self.stdio
+
+        assert DSR_0 == "\033[" "0n"
+
+        extra = b""
+
+        m = None
+        while not m:
+
+            stdio.flush()  # before each Burst of 'os.readv' of ._read_dsr_0_bursts_
+
+            if not self._select_hit_(timeout=self._timeout_till_(deadline)):
+                self.dsr_0_owed += 1  # drops the ⎋[0 N Reply when it does arrive
+                break
+
+            read_length = self.read_length
+            read_plus = self._read_burst_()
+            t2 = time.time()
+
+            if (not read_plus) and (self.read_length > read_length):
+                continue  # drops a Burst of nothing but late ⎋[0 N Replies
+
+            (read, extra, m) = self._split_dsr_0_(read_plus)
+
+            delay_list.append(t2 - t)
+            read_list.append(read)
+            t = t2
+
+        return extra
+
+    def _read_kitty_bursts_(
+        self, delay_list: list[float], read_list: list[bytes], t: float, deadline: float | None
+    ) -> None:
+        """Take quick Inputs till they end with a whole Pack, as Kitty Keys delimit themselves"""
+
+        stdio = self.stdio
+
+        while not terminal_byte_scanner.ends_whole(b"".join(read_list)):
+            timeout = IdleGapMax
+            till = self._timeout_till_(deadline)
+            if till is not None:
+                timeout = min(timeout, till)
+
+            if not self._select_hit_(timeout=timeout):
+                break  # closes a Pack cut short, such as a Paste that ends with ⎋
+
+            stdio.flush()  # before each Burst of 'os.readv' of ._read_kitty_bursts_
+
+            read_length = self.read_length
+            read = self._read_burst_()
+            t2 = time.time()
+
+            if (not read) and (self.read_length > read_length):
+                continue  # drops a Burst of nothing but late ⎋[0 N Replies
+
+            delay_list.append(t2 - t)
+            read_list.append(read)
+            t = t2
+
+        # Kitty encodes ⎋ as ⎋[27U, so no Key starts by looking like the Head of another
+
+    def _split_dsr_0_(self, read_plus: bytes) -> tuple[bytes, bytes, re.Match[bytes] | None]:
+        """Split a Burst at the end of its closing ⎋[0 N Reply, if present"""
+
+        read = read_plus
+        extra = b""
+
+        m = re.search(rb"\033\[0n", string=read_plus)
+        if m and (m.end() > 0):
+            extra = read_plus[m.end() :]
+            read = read_plus[: m.end()]
+
+            # todo: Stop finding ⎋[0 N Closing Reply out of context
+
+        return (read, extra, m)
+
+    def _read_idle_bursts_(
+        self, delay_list: list[float], read_list: list[bytes], t: float, deadline: float | None
+    ) -> float:
+        """Take quick Inputs till no more Bytes arrive for an Idle Gap, or till the Deadline"""
+
+        stdio = self.stdio
+        gap_stats = self.gap_stats
+
+        idle_gap = gap_stats.idle_gap()  # holds still across 1 Poke
+        while True:
+            timeout = idle_gap
+            till = self._timeout_till_(deadline)
+            if till is not None:
+                timeout = min(timeout, till)
+
+            if not self._select_hit_(timeout=timeout):
+                break
+
+            stdio.flush()  # before each Burst of 'os.readv' of ._read_idle_bursts_
+
+            read_length = self.read_length
+            read = self._read_burst_()
+            t2 = time.time()
+
+            if (not read) and (self.read_length > read_length):
+                continue  # drops a Burst of nothing but late ⎋[0 N Replies
+
+            delay_list.append(t2 - t)
+            read_list.append(read)
+            t = t2
+
+        if timeout < idle_gap:
+            return 0.0
+
+        return idle_gap
+
+        # returns 0 when the Deadline came first, so the Gap past it isn't counted as Idle
+
+    def tp_from_startswith_mouse_arrow_kbytes(self, tp: TerminalPoke) -> tuple[bytes, bytes]:
+        """Fabricate the Key Caps and Bytes of a Mouse Release, when encoded as an Arrow Burst"""
+
+        kbytes = tp.to_kbytes()
+
+        y_high = self.y_high
+        x_wide = self.x_wide
+        row_y = self.row_y
+        column_x = self.column_x
+
+        assert Y1 <= row_y <= y_high, (row_y, y_high)
+        assert X1 <= column_x <= x_wide, (column_x, x_wide)
+
+        # Visit each Run of Arrows
+
+        runs = arrow_kbytes_to_runs(kbytes)
+        (y, x) = self._arrow_runs_move_y_x_(runs, y=row_y, x=column_x)
+
+        # Give up here, if no Arrow Burst found
+
+        if not runs:
+            return (b"", b"")
+
+        # Encode the Arrow Burst as an ⌥-Click Release of the Mouse
+
+        arrow_kbytes = kbytes[: 3 * sum(count for (arrow, count) in runs)]
+
+        f8 = int("0b01000", base=0)  # f = ⌥ of 0b⌃⌥⇧00
+        kcaps = f"\033[<{f8};{x};{y}m"  # f x y, not f y x  # 'm' for Release  # not 'M' for Press
+        mouse_kbytes = kcaps.encode()
+
+        # Succeed (but trust the Caller to distinguish Single Arrows from Longer Bursts as needed)
+
+        return (mouse_kbytes, arrow_kbytes)
+
+        # ('\033[<8;25;80m', b'\033[C',)  # Down Arrow into the Southeast Corner
+
+    def _arrow_runs_move_y_x_(
+        self, runs: list[tuple[bytes, int]], y: int, x: int
+    ) -> tuple[int, int]:
+        """Move a virtual Arrow Cursor by whole Runs of Arrows, not Arrow by Arrow"""
+
+        y_high = self.y_high
+        x_wide = self.x_wide
+
+        dy_dx_by_arrow_kbytes = DY_DX_BY_ARROW_KBYTES
+
+        for arrow, count in runs:
+            (dy, dx) = dy_dx_by_arrow_kbytes[arrow]
+
+            assert count >= 1, (count, arrow)
+            assert Y1 <= y <= y_high, (y, y_high)
+            assert X1 <= x <= (x_wide + 1), (x, x_wide)  # x_wide + 1 while the Wrap is pending
+
+            # Take the pending Wrap, if any, before moving
+
+            if dx <= 0:
+                if x > x_wide:
+                    x = X1
+                    y = min(y + 1, y_high)
+
+            # Stop moving up and down at the Top and Bottom Rows
+
+            if dy:
+                y = max(Y1, min(y + count * dy, y_high))
+
+            # Wrap moving right into the Row below, with each Wrap pending till the next Arrow
+
+            elif dx > 0:
+                till_wrap = x_wide + 1 - x
+                if count <= till_wrap:
+                    x += count
+                else:
+                    after_wrap = count - till_wrap
+                    wraps = (after_wrap + x_wide - 1) // x_wide
+                    x = X1 + 1 + (after_wrap - 1) % x_wide
+                    y = min(y + wraps, y_high)
+
+            # Wrap moving left into the Row above
+
+            else:
+                x0 = x - X1 - count
+                wraps = -(x0 // x_wide)
+                x = X1 + (x0 % x_wide)
+                y = max(Y1, y - wraps)
+
+        if x > x_wide:
+            x = x_wide  # caps differently at end of Arrow Burst
+
+        return (y, x)
+
+        # (5, 80) from 3 x ⎋[C at (4, 79) on an 80 Column Screen, not (5, 2)
+
+    def _try_arrow_runs_move_y_x_(self) -> None:
+        """Require the same Y X from whole Runs of Arrows, as from moving Arrow by Arrow"""
+
+        dy_dx_by_arrow_kbytes = DY_DX_BY_ARROW_KBYTES
+        arrows = list(dy_dx_by_arrow_kbytes.keys())
+
+        (self.y_high, self.x_wide) = (5, 7)
+        (y_high, x_wide) = (self.y_high, self.x_wide)
+
+        for index in range(4**5):
+            kbytes = b""
+            for arrow in arrows:
+                count = (index + 3 * arrows.index(arrow)) % 17
+                kbytes = (arrow * count) + kbytes if (index % 2) else kbytes + (arrow * count)
+
+            y = Y1 + index % y_high
+            x = X1 + index % x_wide
+
+            runs = arrow_kbytes_to_runs(kbytes)
+            fast_y_x = self._arrow_runs_move_y_x_(runs, y=y, x=x)
+
+            for index3 in range(0, len(kbytes), 3):
+                (dy, dx) = dy_dx_by_arrow_kbytes[kbytes[index3:][:3]]
+
+                if x > x_wide:
+                    x = X1
+                    y = min(y + 1, y_high)
+
+                y = max(Y1, min(y + dy, y_high))
+                x += dx
+
+                if x < X1:
+                    x = x_wide
+                    y = max(Y1, y - 1)
+
+            slow_y_x = (y, min(x, x_wide))
+
+            assert fast_y_x == slow_y_x, (fast_y_x, slow_y_x, runs)
+
+    def _try_read_paste_chunks_(self) -> None:
+        """Require each Byte of Paste once, in order, up to an End arriving split across Fetches"""
+
+        kbytearray = self.kbytearray
+        yxhw_terminal_inputs = self.yxhw_terminal_inputs
+
+        yxhw_terminal_inputs.append(TerminalInput(b"Hello,"))  # as if framed already
+
+        kbytearray.extend(b"\033")
+        (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=0.0)
+        assert (kbyte, kbytes) == (b"\033", b""), (kbyte, kbytes)  # leaves a Pack open
+
+        kbytearray.extend(b"\r World \xc3\xa9\r\033[20")
+        chunks = list(bytes(_) for _ in self.read_paste_chunks(timeout=0.0))
+        assert chunks == [b"Hello,", b"\033\r World \xc3\xa9\r"], (chunks,)
+
+        kbytearray.extend(b"1~a")
+        chunks = list(bytes(_) for _ in self.read_paste_chunks(timeout=0.0))
+        assert not chunks, (chunks,)
+
+        ti = self.read_terminal_input(timeout=None)  # closes before the 'a', so fetches nothing
+        assert ti and (ti.kbytes == b"\033[201~"), (ti,)
+        assert bytes(kbytearray) == b"a", (kbytearray,)
+
+        kbytearray.clear()
+
+    def _try_frame_writes_(self) -> None:
+        """Require each Frame written out whole, in order, even when the Screen takes it in part"""
+
+        (read_fd, write_fd) = os.pipe()
+        os.set_blocking(write_fd, False)  # takes a Frame in part, past the Pipe Buffer
+
+        texts: list[str] = list()
+        tw = TerminalWriter(open(write_fd, "w", closefd=False), mirror=texts.append)
+
+        tw.write("\033[H")
+        tw.write("Hello, World é", mirror_start=7)
+        tw.write_bytes(b"\r\n")
+        assert tw.frame_length == 20, (tw.frame_length,)
+        tw.flush()
+
+        data = os.read(read_fd, 0x100)
+        assert data == "\033[HHello, World é\r\n".encode(), (data,)
+        assert texts == ["\033[H", "World é", "\r\n"], (texts,)
+        assert (tw.frames, tw.frame_bytes, tw.frame_syscalls) == (1, 20, 1), str(tw)
+
+        tw.flush()
+        assert tw.frames == 1, str(tw)  # writes out no empty Frames
+
+        frame = bytes(range(0x100)) * 0x400  # 256 KiB, past the Pipe Buffer and Frame Alloc
+        for i in range(0, len(frame), 0x1000):
+            tw.write_bytes(frame[i:][:0x1000])
+
+        flusher = threading.Thread(target=tw.flush)
+        flusher.start()
+
+        readback = bytearray()
+        while len(readback) < len(frame):
+            readback.extend(os.read(read_fd, 0x10000))
+
+        flusher.join()
+
+        assert readback == frame, (len(readback), len(frame))
+        assert (tw.frames, tw.frame_bytes) == (2, len(frame)), str(tw)
+        assert tw.frame_syscalls > 1, str(tw)  # as the Pipe took the Frame in part
+
+        os.close(read_fd)
+        os.close(write_fd)
+
+    def _try_drop_late_dsr_0_(self) -> None:
+        """Require late ⎋[0N Replies dropped at the Head of a Burst only, even when split"""
+
+        self.dsr_0_owed = 2
+
+        read = self._drop_late_dsr_0_(b"\033[0")
+        assert (read, self.dsr_0_carry) == (b"", b"\033[0"), (read, self.dsr_0_carry)
+
+        read = self._drop_late_dsr_0_(b"n\033[0nab\033[0n")
+        assert read == b"ab\033[0n", (read,)  # keeps the ⎋[0 N typed after the 'ab'
+        assert (self.dsr_0_owed, self.dsr_0_carry) == (0, b""), (self.dsr_0_owed, self.dsr_0_carry)
+
+        self.dsr_0_owed = 1
+
+        read = self._drop_late_dsr_0_(b"a\033[0n")
+        assert (read, self.dsr_0_owed) == (b"a\033[0n", 1), (read, self.dsr_0_owed)
+
+        read = self._drop_late_dsr_0_(b"\033[0nb")
+        assert (read, self.dsr_0_owed) == (b"b", 0), (read, self.dsr_0_owed)
+
+        read = self._drop_late_dsr_0_(b"\033[0")
+        assert read == b"\033[0", (read,)  # carries nothing over, while no Reply is owed
+
+    def _try_take_osc_(self) -> None:
+        """Require whole Osc Replies across Fetches, the Drop of the too long, and their Parse"""
+
+        kbytearray = self.kbytearray
+
+        kbytes_list: list[bytes] = list()
+        chunks = [b"\033]11;rgb:ffff/0/88\007a\033]4;1;rgb:0", b"0/ff/0\033", b"\\"]
+        chunks += [b"\033]52;c;", 3 * b"QUJD", b"\033\\\033]\001", b"\033]52;c;?\007"]
+
+        for chunk in chunks:
+            kbytearray.extend(chunk)  # as if fetched, so without ⎋[5N Calls
+            while kbytearray:
+                (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=0.0)
+                if kbytes:
+                    kbytes_list.append(kbytes)
+
+        assert kbytes_list == [
+            b"\033]11;rgb:ffff/0/88\007",
+            b"a",
+            b"\033]4;1;rgb:00/ff/0\033\\",
+            b"\033]52;c;QUJDQUJDQUJD\033\\",
+            b"\033]",  # closes at an Unprintable Char, as before
+            b"\001",
+            b"\033]52;c;?\007",
+        ], (kbytes_list,)
+
+        replies = list(osc_kbytes_to_reply_if(_) for _ in kbytes_list)
+        assert replies == [
+            OscColorReply(11, index=-1, rgb=(0xFFFF, 0, 0x8888)),
+            None,
+            OscColorReply(4, index=1, rgb=(0, 0xFFFF, 0)),
+            OscClipboardReply("c", data=b"ABCABCABC"),
+            None,
+            None,
+            None,
+        ], (replies,)
+
+        self.osc_bytes_max = 8
+        for chunk in (b"\033]52;c;QUJD", b"QUJD", b"QUJD\007b"):
+            kbytearray.extend(chunk)
+            (kbyte, kbytes) = self.read_kbyte_kbytes(timeout=0.0)
+
+        assert (kbyte, kbytes) == (b"b", b"b"), (kbyte, kbytes)  # after dropping the Osc
+        assert self.osc_drops == 1, (self.osc_drops,)
+
+        self.osc_bytes_max = OscBytesMax
+        self.osc_drops = 0
+
+
+class AsyncMouseTerminal:
+    """Read Terminal Inputs of a MouseTerminal from an 'asyncio' Event Loop"""
+
+    mt: MouseTerminal  # frames the Bytes and forms the Terminal Inputs, same as when sync
+
+    poke_queue: asyncio.Queue[TerminalPoke | None]  # each Poke closed, else None at End-of-Input
+    dsr_0_waiting: bool  # says the Poke closes at the ⎋[0N Reply, not at an Idle Gap
+    idle_handle: asyncio.TimerHandle | None  # closes the Poke at an Idle Gap, if not cancelled
+
+    burst_bytearray: bytearray  # the Bytes of the Burst read so far
+    burst_t1: float  # when the Burst started arriving
+    burst_handle: asyncio.TimerHandle | None  # closes the Burst at a Burst Gap, if not cancelled
+    carry_handle: asyncio.TimerHandle | None  # gives up on a split ⎋[0N Reply, if not cancelled
+
+    t0: float  # when the last Poke closed
+    t: float  # when the last Burst of the Poke arrived
+    hit: float  # time spent waiting for the Poke to start arriving
+    delay_list: list[float]  # time till each Burst of the Poke ended
+    read_list: list[bytes]  # each Burst of the Poke
+
+    def __init__(self, mt: MouseTerminal) -> None:
+
+        self.mt = mt
+
+        self.poke_queue = asyncio.Queue()
+        self.dsr_0_waiting = False
+        self.idle_handle = None
+
+        self.burst_bytearray = bytearray()
+        self.burst_t1 = 0.0
+        self.burst_handle = None
+        self.carry_handle = None
+
+        self.t0 = time.time()
+        self.t = self.t0
+        self.hit = 0.0
+        self.delay_list = list()
+        self.read_list = list()
+
+    async def inputs(self) -> collections.abc.AsyncGenerator[TerminalInput, None]:
+        """Yield each Terminal Input, while other Tasks run in between"""
+
+        mt = self.mt
+        kbytearray = mt.kbytearray
+        poke_queue = self.poke_queue
+
+        loop = asyncio.get_running_loop()
+        loop.add_reader(mt.fileno, self._on_readable_)
+        try:
+            while True:
+
+                # Take each Terminal Input framed by the Bytes already fetched
+
+                if kbytearray or mt._pack_closes_alone_():
+                    (kbyte, kbytes) = mt.read_kbyte_kbytes(timeout=0)  # doesn't fetch
+                    if kbytes:
+                        yield TerminalInput(kbytes)
+                    continue
+
+                # Else wait for the next Poke, while other Tasks run
+
+                tp = await poke_queue.get()
+                if tp is None:
+                    break
+
+                tp = mt._kbytearray_take_poke_(tp)
+                if kbytearray:
+                    mt._kbytearray_take_arrow_burst_if_(tp)
+
+        finally:
+            loop.remove_reader(mt.fileno)
+            for handle in (self.idle_handle, self.burst_handle, self.carry_handle):
+                if handle:
+                    handle.cancel()
+
+        # todo: yield the Pack left open at End-of-Input
+
+    def _on_readable_(self) -> None:
+        """Read the Bytes waiting, without blocking, and close the Burst after a Burst Gap"""
+
+        mt = self.mt
+        fd = mt.fileno
+        burst_bytearray = self.burst_bytearray
+
+        loop = asyncio.get_running_loop()
+
+        # Read once, because the Kernel holds 1 or more Bytes for us
+
+        t1 = time.time()
+        data = os.read(fd, len(mt.read_bytearray))
+        mt.read_syscalls += 1
+        mt.read_length += len(data)
+
+        if not data:
+            loop.remove_reader(fd)
+            if self.burst_handle:
+                self.burst_handle.cancel()
+                self._on_burst_gap_()
+            self.poke_queue.put_nowait(None)  # End-of-Input
+            return
+
+        # Wait a Burst Gap for more Bytes, by Timer, while other Tasks run
+
+        if not burst_bytearray:
+            self.burst_t1 = t1
+        burst_bytearray.extend(data)
+
+        if self.burst_handle:
+            self.burst_handle.cancel()
+
+        burst_gap = mt.gap_stats.burst_gap()
+        self.burst_handle = loop.call_later(burst_gap, self._on_burst_gap_)
+
+    def _on_burst_gap_(self) -> None:
+        """Close the Burst, drop its late ⎋[0N Replies, and take the rest into the Poke"""
+
+        mt = self.mt
+        burst_bytearray = self.burst_bytearray
+
+        self.burst_handle = None
+
+        t1 = self.burst_t1
+        t2 = time.time()
+
+        burst = bytes(burst_bytearray)
+        burst_bytearray.clear()
+
+        if self.carry_handle:
+            self.carry_handle.cancel()
+            self.carry_handle = None
+
+        read_plus = mt._drop_late_dsr_0_(burst)
+        if mt.dsr_0_carry:
+            loop = asyncio.get_running_loop()
+            self.carry_handle = loop.call_later(IdleGapMax, self._on_carry_gap_)
+
+        if read_plus:  # drops a Burst of nothing but late ⎋[0 N Replies
+            self._take_burst_(read_plus, t1=t1, t2=t2)
+
+    def _on_carry_gap_(self) -> None:
+        """Take the Head of a ⎋[0N Reply as Input, when no Reply completes it"""
+
+        mt = self.mt
+
+        self.carry_handle = None
+
+        read_plus = mt.dsr_0_carry
+        mt.dsr_0_carry = b""
+
+        t2 = time.time()
+        self._take_burst_(read_plus, t1=t2, t2=t2)
+
+    def _take_burst_(self, read_plus: bytes, t1: float, t2: float) -> None:
+        """Take 1 Burst of Bytes into the Poke, and close the Poke, or don't"""
+
+        mt = self.mt
+        stdio = mt.stdio
+        read_list = self.read_list
+
+        assert DSR_5 == "\033[" "5n"
+
+        # Open the Poke with the first Burst
+
+        if not read_list:
+            mt.poke_arrival = t1
+            self.hit = t1 - self.t0
+            self.delay_list.append(t2 - t1)
+            read_list.append(read_plus)
+            self.t = t2
+
+            if not mt._frames_at_dsr_0_(read_plus):
+                self._close_at_idle_gap_()
+            else:
+                self.dsr_0_waiting = True
+                stdio.write("\033[5n")
+                stdio.flush()
+
+            return
 
-            if poke_kbytes == b"``":
+        # Add each later Burst, and close at the ⎋[0 N Reply, else wait again for an Idle Gap
 
-                kbytearray.clear()
-                _pack_.take_one(b"`")  # once
-                _pack_.take_one(b"`")  # twice
+        self.delay_list.append(t2 - self.t)
+        self.t = t2
 
-                assert not _pack_.closed, (_pack_, poke_kbytes)
+        if not self.dsr_0_waiting:
+            read_list.append(read_plus)
+            self._close_at_idle_gap_()
+            return
 
-                return True
+        (read, extra, m) = mt._split_dsr_0_(read_plus)
+        read_list.append(read)
+        if m:
+            self._close_poke_(extra)
 
-        return False
+    def _close_at_idle_gap_(self) -> None:
+        """Close the Poke when no more Bytes arrive for an Idle Gap"""
 
-    def _take_no_bytes_if_(self) -> bool:
-        """Take 0 Bytes and close the Pack abruptly, sometimes"""
+        idle_gap = self.mt.gap_stats.idle_gap()
 
-        kbytearray = self.kbytearray
-        _pack_ = self._pack_
+        if self.idle_handle:
+            self.idle_handle.cancel()
 
-        pack_kbytes = _pack_.to_bytes()  # maybe not .closed
-        pack_startswith_osc = pack_kbytes.startswith(b"\033]")
-        pack_endswith_esc = pack_kbytes.endswith(b"\033")
+        loop = asyncio.get_running_loop()
+        self.idle_handle = loop.call_later(idle_gap, self._close_poke_, b"", idle_gap)
 
-        poke_kbytes = bytes(kbytearray)
-        poke_kbyte = bytes(poke_kbytes[:1])  # does peek, doesn't pop
+    def _close_poke_(self, extra: bytes, idle_gap: float = 0.0) -> None:
+        """Pass on the Poke, and start the next"""
 
-        headbook = (b"\033", b"\033\033", b"\033\033O", b"\033\033[", b"\033O", b"\033[", b"\033]")
-        assert TerminalBytePack.Headbook == headbook
+        mt = self.mt
+
+        tp = mt._close_terminal_poke_(
+            self.hit, self.delay_list, self.read_list, extra=extra, idle_gap=idle_gap
+        )
+        self.poke_queue.put_nowait(tp)
+
+        self.dsr_0_waiting = False
+        self.idle_handle = None
+
+        self.t0 = time.time()
+        self.delay_list = list()
+        self.read_list = list()
+
+
+class TerminalInputReader:
+    """Read Terminal Inputs of a MouseTerminal in a Thread, and hand them over in a Queue"""
+
+    mt: MouseTerminal  # frames the Bytes and forms the Terminal Inputs, same as when not threaded
+
+    input_queue: queue.Queue[tuple[float, TerminalInput]]  # each Input with its Arrival Time
+    stopping: threading.Event  # asks the Thread to quit
+    stop_fds: tuple[int, int]  # a Pipe written to wake the Thread, while it waits for Input
+    thread: threading.Thread  # runs .read_till_stopped
+    exception: BaseException | None  # raised by the Thread, raised again to the Caller
+
+    def __init__(self, mt: MouseTerminal) -> None:
+
+        self.mt = mt
+
+        self.input_queue = queue.Queue(maxsize=InputQueueMax)
+        self.stopping = threading.Event()
+        self.stop_fds = (-1, -1)
+        self.thread = threading.Thread(target=self.read_till_stopped, daemon=True)
+        self.exception = None
+
+    def __enter__(self) -> typing.Self:
+
+        mt = self.mt
+
+        self.stop_fds = os.pipe()
+        mt.stop_fileno = self.stop_fds[0]
+
+        self.thread.start()
+
+        return self
+
+    def __exit__(self, *args: object) -> None:
+
+        mt = self.mt
+        (stop_read_fd, stop_write_fd) = self.stop_fds
+
+        self.stopping.set()
+        os.write(stop_write_fd, b"\0")  # wakes the Thread, while it waits for Input
+        self.thread.join()
+
+        mt.stop_fileno = -1
+        os.close(stop_read_fd)
+        os.close(stop_write_fd)
+
+    def read_till_stopped(self) -> None:
+        """Read, frame, and hand over each Terminal Input, with the Time its first Byte arrived"""
+
+        mt = self.mt
+        input_queue = self.input_queue
+        stopping = self.stopping
 
         try:
-            poke_decode_if = poke_kbytes.decode()
-        except UnicodeDecodeError:
-            poke_decode_if = ""
+            while not stopping.is_set():
+                ti = mt.read_terminal_input(timeout=None)  # waits as long as a Round Trip takes
+                if not ti:
+                    continue
 
-        # Do take unprintable Bytes after the Head Bytes when taking to close an Osc Sequence
+                item = (mt.poke_arrival, ti)
+                while not stopping.is_set():
+                    try:
+                        input_queue.put(item, timeout=ReaderTimeout)  # waits while Queue full
+                        break
+                    except queue.Full:
+                        pass
 
-        if pack_startswith_osc and (poke_kbyte == b"\007"):
-            return False  # \007 BEL
-        elif pack_startswith_osc and (poke_kbytes.startswith(b"\033\134")):
-            return False  # \033 \134 Esc \ String Terminator (ST)
-        elif pack_startswith_osc and pack_endswith_esc and (poke_kbyte == b"\134"):
-            return False  # \033 \134 Esc \ String Terminator (ST)
+        except BaseException as exc:
+            self.exception = exc
 
-        # Generally do Not take unprintable Bytes after the Head Bytes
+        # Stops reading while the Queue is full, so the Bytes wait in the Terminal, not dropped
 
-        if (not poke_decode_if) or (not poke_decode_if[:1].isprintable()):
-            if pack_kbytes in headbook:
-                if pack_kbytes != b"\033":  # ⎋
+    def read_timed_terminal_input(self, timeout: float | None) -> tuple[float, TerminalInput] | None:
+        """Take the next Terminal Input with the Time its first Byte arrived, else None at Timeout"""
 
-                    _pack_.close()
+        mt = self.mt
+        input_queue = self.input_queue
 
-                    return True  # ⎋⎋ ⎋⎋O ⎋⎋[ ⎋O ⎋[
+        t0 = time.time()
+        deadline = mt._deadline_(timeout, t0=t0)
 
-        # Generally do take printable Bytes after the Head Bytes
+        while True:
+            till = mt._timeout_till_(deadline)
+            wait = ReaderTimeout if (till is None) else min(ReaderTimeout, till)
 
-        return False
+            try:
+                item = input_queue.get(timeout=wait)
+                return item
+            except queue.Empty:
+                pass
 
-    def _ti_snoop_(self, ti: TerminalInput) -> None:
-        """Mirror updates to Height, Width, Y, and X, as they fly by"""
+            if self.exception:
+                raise self.exception  # raises again what the Thread raised
 
-        if ti.backtail == b"R":
-            self._ti_snoop_row_y_column_x_(ti)
-        elif ti.backtail == b"t":
-            self._ti_snoop_y_high_x_wide_(ti)
-        elif ti.backtail == b"~":
-            self._ti_snoop_paste_start_end_(ti)
+            if mt._deadline_passed_(deadline):
+                return None
 
-    def _ti_snoop_row_y_column_x_(self, ti: TerminalInput) -> None:
-        """Snoop ⎋[ ⇧R Cursor-Position-Report (CSR) of Terminal Cursor Y X"""
+    def read_terminal_input(self, timeout: float | None) -> TerminalInput | None:
+        """Take the next Terminal Input, else None at Timeout"""
 
-        assert CPR_Y_X == "\033[" "{};{}R"
+        item = self.read_timed_terminal_input(timeout=timeout)
+        if item is None:
+            return None
 
-        yx_ints = ti.to_csi_ints_if(b"R", start=b"", default=PN1)  # ⎋[ ⇧R
-        if len(yx_ints) == 2:
-            self.row_y = yx_ints[0]
-            self.column_x = yx_ints[-1]
+        (arrival, ti) = item
+        return ti
 
-    def _ti_snoop_y_high_x_wide_(self, ti: TerminalInput) -> None:
-        """Snoop ⎋[8 T Terminal Window Pane > Y-Height x X-Width Report"""
 
-        assert XTWINOPS_8_H_W == "\033[" "8;{};{}t"
+class TerminalInputCoalescer:
+    """Merge redundant Terminal Inputs, and cap the Inputs per Frame, when the Reader falls behind"""
 
-        nhw_ints = ti.to_csi_ints_if(b"t", start=b"", default=PN1)  # ⎋[8 T
-        if len(nhw_ints) == 3:
-            assert nhw_ints[0] == 8, (nhw_ints[0], nhw_ints)
-            self.y_high = nhw_ints[1]
-            self.x_wide = nhw_ints[2]
+    arrows_merged: bool  # merges ⎋[A ⎋[A to ⎋[2A, which has no .face, so not for Dispatch by .face
+    backlog: list[TerminalInput]  # the Terminal Inputs read, but not yet dispatched
+    pastings: list[bool]  # says which Inputs of the Backlog are Paste Brackets, or come between
+    pasting: bool  # says the latest Input of the Backlog comes after ⎋[200~, before ⎋[201~
+    merged: int  # counts the Terminal Inputs merged into the Input before them
+    dropped: int  # counts the Terminal Inputs dropped, past the BacklogInputsMax
 
-    def _ti_snoop_paste_start_end_(self, ti: TerminalInput) -> None:
-        """Snoop ⎋[200~ ⎋[201~ Start/ End of Bracketed Paste"""
+    def __init__(self, arrows_merged: bool = False) -> None:
+        self.arrows_merged = arrows_merged
+        self.backlog = list()
+        self.pastings = list()
+        self.pasting = False
+        self.merged = 0
+        self.dropped = 0
 
-        assert _SM_BRACKETED_PASTE_ == "\033[" "?2004h"
-        assert _RM_BRACKETED_PASTE_ == "\033[" "?2004l"
+    def __str__(self) -> str:
 
-        se_ints = ti.to_csi_ints_if(b"~", start=b"", default=PS0)  # ⎋[ ⇧~
-        if len(se_ints) == 1:
-            ps = se_ints[-1]
+        s = f"Inputs: {len(self.backlog)} waiting, {self.merged} merged, {self.dropped} dropped"
+        return s
 
-            if ps == 200:
+        # 'Inputs: 0 waiting, 1 merged, 0 dropped'
 
-                assert -1 not in (self.row_y, self.column_x), (self.row_y, self.column_x)
+    def take_frame(self, tis: list[TerminalInput]) -> list[TerminalInput]:
+        """Add the Terminal Inputs read, and take the Inputs of 1 Frame, merged, capped, and in order"""
 
-                self.paste_y = self.row_y
-                self.paste_x = self.column_x
+        backlog = self.backlog
+        pastings = self.pastings
 
-            if ps == 201:
+        self.coalesce_inputs(tis)
 
-                assert -1 not in (self.row_y, self.column_x), (self.row_y, self.column_x)
+        # Take at most the FrameInputsMax, but take all the rest of a Paste begun in the Frame
 
-                if -1 not in (self.paste_y, self.paste_x):
-                    if self.column_x != self.paste_x:
-                        self.write_paste_crlf()
+        stop = min(len(backlog), FrameInputsMax)
+        while (stop < len(backlog)) and pastings[stop - 1]:
+            if backlog[stop - 1].kbytes == b"\033[201~":
+                break
+            stop += 1
 
-                self.paste_y = -1
-                self.paste_x = -1
+        frame = backlog[:stop]
+        del backlog[:stop]
+        del pastings[:stop]
 
-                # todo3: Paste lands vertically only  while .row_y .column_x mirrors accurate
+        return frame
+
+        # streams each Paste out, so the Backlog holds Paste only till the Frame reaches its Start
+
+    def coalesce_inputs(self, tis: list[TerminalInput]) -> None:
+        """Merge the Inputs read into the Backlog, and drop the oldest past the BacklogInputsMax"""
+
+        backlog = self.backlog
+        pastings = self.pastings
+
+        # Merge each Terminal Input into the one before it, if redundant, but never inside a Paste
+
+        for ti in tis:
+            kbytes = ti.kbytes
+            if kbytes == b"\033[200~":
+                self.pasting = True
+
+            pasting = self.pasting
+            if kbytes == b"\033[201~":
+                self.pasting = False
+
+            if backlog and not pasting:
+                merged_ti = self._merge_if_(backlog[-1], ti)
+                if merged_ti:
+                    backlog[-1] = merged_ti
+                    self.merged += 1
+                    continue
+
+            backlog.append(ti)
+            pastings.append(pasting)
+
+        # Drop the oldest Terminal Inputs, but never the Replies, nor the Quits, nor any of a Paste
+
+        drops = len(backlog) - BacklogInputsMax
+        if drops > 0:
+            kept: list[TerminalInput] = list()
+            kept_pastings: list[bool] = list()
+            for ti, pasting in zip(backlog, pastings):
+                if (drops > 0) and not pasting and not self._ti_is_reply_or_quit_(ti):
+                    drops -= 1
+                    self.dropped += 1
+                    continue
+
+                kept.append(ti)
+                kept_pastings.append(pasting)
+
+            backlog[::] = kept
+            pastings[::] = kept_pastings
+
+        # merges only the Inputs just read, so as not to scan the whole Backlog again per Frame
+
+    def _merge_if_(self, ti0: TerminalInput, ti1: TerminalInput) -> TerminalInput | None:
+        """Merge 2 Terminal Inputs into 1, if redundant, else return None"""
+
+        kbytes0 = ti0.kbytes
+        kbytes1 = ti1.kbytes
+
+        # Count Arrows repeated, as 1 Arrow with a Pn
+
+        m0 = ARROW_PN_REGEX.fullmatch(kbytes0)
+        m1 = ARROW_PN_REGEX.fullmatch(kbytes1)
+        if self.arrows_merged and m0 and m1 and (m0.group(2) == m1.group(2)):
+            pn = int(m0.group(1) or b"1") + int(m1.group(1) or b"1")
+            merged_ti = TerminalInput(b"\033[" + str(pn).encode() + m0.group(2))
+            return merged_ti
+
+        # Take only the latest of a Reply repeated
+
+        for regex in (CPR_Y_X_REGEX, XTWINOPS_8_H_W_REGEX, DSR_0_REGEX):
+            if regex.fullmatch(kbytes0) and regex.fullmatch(kbytes1):
+                return ti1
+
+        # Take only 1 of a Mouse Press repeated at the same Cell
+
+        if (kbytes0 == kbytes1) and MOUSE_PRESS_REGEX.fullmatch(kbytes0):
+            return ti1
+
+        return None
+
+    def _ti_is_reply_or_quit_(self, ti: TerminalInput) -> bool:
+        """Say if the Terminal Input is a Reply, or a Quit, and so never to drop"""
+
+        kbytes = ti.kbytes
+
+        for regex in (CPR_Y_X_REGEX, XTWINOPS_8_H_W_REGEX, DSR_0_REGEX):
+            if regex.fullmatch(kbytes):
+                return True
+
+        if ti.caps in ("⌃C", "⌃D", "⌃Z", "⌃\\"):
+            return True
+
+        return False
 
     #
-    # Read a single Byte from Keyboard, Mouse, and Touch
+    # Tests, to run slowly and thoroughly
     #
 
-    def getch(self, timeout: float | None) -> bytes:  # a la msvcrt.getch
-        """Read next Byte of Keyboard Chord, Mouse Arrow Burst, Mouse Click, or Touch Tap"""
+    def _try_terminal_input_coalescer_(self) -> None:
+        """Require the Merges, the Drops, the Cap per Frame, and the Stream of each Paste"""
 
-        kbytearray = self.kbytearray
+        backlog = self.backlog
+        pastings = self.pastings
 
-        # Fetch more Bytes, when needed
+        assert not self.arrows_merged, (self.arrows_merged,)
 
-        if not kbytearray:
-            self._fill_kbytearray_(timeout=timeout)
-            if not kbytearray:
-                return b""
+        kbytes_list = [b"\033[A", b"\033[A", b"\033[3A", b"\033[B", b"a", b"a"]
+        kbytes_list.extend([b"\033[<0;5;9M", b"\033[<0;5;9M", b"\033[<0;5;9m"])
+        kbytes_list.extend([b"\033[5;1R", b"\033[6;2R", b"\033[0n", b"\033[0n"])
 
-        # Pass back the first Byte
+        self.coalesce_inputs(list(TerminalInput(_) for _ in kbytes_list))
 
-        kord = kbytearray.pop(0)
-        kbytes = bytes([kord])
+        kbytes_list = list(_.kbytes for _ in backlog)
+        assert kbytes_list == [
+            b"\033[A",
+            b"\033[A",
+            b"\033[3A",
+            b"\033[B",
+            b"a",
+            b"a",
+            b"\033[<0;5;9M",
+            b"\033[<0;5;9m",
+            b"\033[6;2R",
+            b"\033[0n",
+        ], (kbytes_list,)
 
-        return kbytes
+        assert self.merged == 3, (self.merged,)
 
-        # todo: more test of .getch
+        # Merge Arrows only when asked, and never inside a Paste, but across Reads
 
-    def _fill_kbytearray_(self, timeout: float | None) -> TerminalPoke:
-        """Fetch Bytes into Self, and return their Timing and simple ⎋[0 N Closing separately"""
+        self.arrows_merged = True
 
-        kbytearray = self.kbytearray
-        assert not kbytearray, (kbytearray,)
+        pasted_kbytes_list = [b"\033[200~", b"\033[A", b"\033[A"] + (10 * [b"x"]) + [b"\033[201~"]
 
-        assert DSR_0 == "\033[" "0n"
+        backlog.clear()
+        pastings.clear()
 
-        tp = self.read_terminal_poke(timeout=timeout)
-        kbytes = tp.to_kbytes()  # can be '\033[0n\033[0n'
+        self.coalesce_inputs([TerminalInput(b"\033[A")])
+        kbytes_list = [b"\033[A", b"\033[3A", b"\033[B"] + pasted_kbytes_list
+        self.coalesce_inputs(list(TerminalInput(_) for _ in kbytes_list))
 
-        assert kbytes != b"\033[0n", (kbytes, tp)  # todo: Log if ⎋[0 N ever comes alone (as Paste?)
+        kbytes_list = list(_.kbytes for _ in backlog)
+        assert kbytes_list == [b"\033[5A", b"\033[B"] + pasted_kbytes_list, (kbytes_list,)
+        assert self.merged == 5, (self.merged,)
 
-        if tp.reads and tp.reads[-1].endswith(b"\033[0n"):
-            tp_reads_n1 = tp.reads[-1].removesuffix(b"\033[0n")
-            tp_reads = tp.reads[:-1] + (tp_reads_n1,)
+        # Drop the oldest, but never a Quit, nor any of a Paste
 
-            tp = dataclasses.replace(tp, reads=tp_reads)
-            kbytes = tp.to_kbytes()  # todo: Log if ⎋[0 N ever comes as KByte Fill when unexpected?
+        backlog.clear()
+        pastings.clear()
 
-        kbytearray.extend(kbytes)
+        kbytes_list = [b"\003"] + pasted_kbytes_list
+        kbytes_list.extend(_.encode() for _ in (BacklogInputsMax * "ab"))
+        self.coalesce_inputs(list(TerminalInput(_) for _ in kbytes_list))
+
+        drops = len(kbytes_list) - BacklogInputsMax
+
+        assert len(backlog) == len(pastings) == BacklogInputsMax, (len(backlog), len(pastings))
+        assert backlog[0].caps == "⌃C", (backlog[0],)
+        kbytes_list = list(_.kbytes for _ in backlog[1:][: len(pasted_kbytes_list)])
+        assert kbytes_list == pasted_kbytes_list, (kbytes_list,)
+        assert self.dropped == drops, (self.dropped, drops)
+
+        # Cap each Frame, but stream all of a Paste out with the Frame that reaches its Start
+
+        backlog.clear()
+        pastings.clear()
+
+        kbytes_list = (FrameInputsMax - 1) * [b"a"] + [b"\033[200~"]
+        kbytes_list.extend(2 * FrameInputsMax * [b"x"])
+        frame = self.take_frame(list(TerminalInput(_) for _ in kbytes_list))
+
+        assert len(frame) == len(kbytes_list), (len(frame), len(kbytes_list))
+        assert (not backlog) and self.pasting, (backlog, self.pasting)
+
+        kbytes_list = [b"x", b"\033[201~"] + (2 * FrameInputsMax * [b"b"])
+        frame = self.take_frame(list(TerminalInput(_) for _ in kbytes_list))
+
+        assert len(frame) == FrameInputsMax, (len(frame),)
+        assert len(backlog) == (len(kbytes_list) - FrameInputsMax), (len(backlog),)
+        assert not self.pasting, (self.pasting,)
+
+    def _time_terminal_input_coalescer_(self) -> tuple[int, int]:
+        """Count the Inputs of a Flood read, vs the Inputs dispatched after merging and dropping"""
+
+        backlog = self.backlog
+
+        self.arrows_merged = True
+
+        # Read 200 Inputs per Frame, of 4000 Arrows held down, and then of 4000 Keystrokes
+
+        reads = list(200 * [TerminalInput(b"\033[A")] for _ in range(20))
+        reads.extend(list(TerminalInput(_.encode()) for _ in (100 * "ab")) for _ in range(20))
+
+        dispatched = 0
+        for tis in reads:
+            frame = self.take_frame(tis)
+            dispatched += len(frame)
+
+        while backlog:
+            frame = self.take_frame([])
+            dispatched += len(frame)
+
+        read = sum(len(_) for _ in reads)
+        assert read == (dispatched + self.merged + self.dropped), (read, dispatched, self)
+
+        return (read, dispatched)
+
+        # (8000, 2260) with 3980 merged, and 1760 dropped
+
+
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
+class MouseEvent:
+    """Say where 1 Mouse Press, Drag, Move, Release, or Wheel landed, and how many Reports it holds"""
+
+    kind: str  # "press", "drag", "move", "release", or "wheel"
+    f: int  # the Button and ⌃ ⌥ ⇧ Shifts, coded as 0b⌃⌥⇧BB, less the Motion and Wheel Bits
+    y: int  # the Terminal Screen Pane Row, counted up from 1
+    x: int  # the Terminal Screen Pane Column, counted up from 1
+    count: int  # the Reports collapsed into this Event, often 1
 
-        return tp
+
+class MouseMotionTracker:
+    """Decode the SGR Mouse Reports of each Frame, and collapse each Run of Moves or Drags"""
+
+    frame_counts: dict[str, int]  # counts the Reports of the latest Frame, by Kind
+    reports: int  # counts the Reports decoded
+    collapsed: int  # counts the Reports collapsed into the Report before them
+
+    def __init__(self) -> None:
+        self.frame_counts = dict()
+        self.reports = 0
+        self.collapsed = 0
+
+    def __str__(self) -> str:
+
+        frame_counts = self.frame_counts
+
+        counts = ", ".join(f"{v} {k}" for (k, v) in frame_counts.items())
+        s = f"Mouse: {counts or 'quiet'}, {self.collapsed} of {self.reports} collapsed"
+        return s
+
+        # 'Mouse: 1 press, 24 drag, 1 release, 23 of 26 collapsed'
+
+    def track_frame(self, tis: list[TerminalInput]) -> list[TerminalInput | MouseEvent]:
+        """Decode the Mouse Reports of 1 Frame, and keep only the latest of each Run of Motion"""
+
+        frame_counts = self.frame_counts
+
+        frame_counts.clear()
+
+        events: list[TerminalInput | MouseEvent] = list()
+        for ti in tis:
+            event = self.ti_to_mouse_event_if(ti)
+            if not event:
+                events.append(ti)
+                continue
+
+            kind = event.kind
+            frame_counts[kind] = frame_counts.get(kind, 0) + 1
+            self.reports += 1
+
+            # Keep only the latest Y X of each Run of Moves or Drags
+
+            if events and (kind in ("drag", "move")):
+                last = events[-1]
+                if isinstance(last, MouseEvent) and (last.kind, last.f) == (kind, event.f):
+                    count = last.count + 1
+                    events[-1] = MouseEvent(kind, f=event.f, y=event.y, x=event.x, count=count)
+                    self.collapsed += 1
+                    continue
+
+            events.append(event)
+
+        return events
+
+        # keeps each Press and Release, so a Drag still starts and stops where it did
+
+    def ti_to_mouse_event_if(self, ti: TerminalInput) -> MouseEvent | None:
+        """Decode 1 SGR Mouse Report, else return None"""
+
+        m = MOUSE_SGR_REGEX.fullmatch(ti.kbytes)
+        if not m:
+            return None
+
+        (f_, x_, y_, final) = m.groups()
+        (f, x, y) = (int(f_), int(x_), int(y_))  # f x y, not f y x
+
+        motion_bit = int("0b0100000", base=0)
+        wheel_bit = int("0b1000000", base=0)
+
+        if f & motion_bit:
+            kind = "move" if ((f & 0b11) == 0b11) else "drag"
+        elif f & wheel_bit:
+            kind = "wheel"
+        elif final == b"m":
+            kind = "release"
+        else:
+            kind = "press"
+
+        event = MouseEvent(kind, f=(f & ~motion_bit & ~wheel_bit), y=y, x=x, count=1)
+        return event
+
+        # MouseEvent(kind='drag', f=0, y=9, x=6, count=1) from b'\033[<32;6;9M'
 
     #
-    # Read one Keyboard Chord, Mouse Arrow Burst, Mouse Click, or Touch Tap
-    # And fabricate the Key Caps and Bytes of a Mouse Release, when encoded as an Arrow Burst
+    # Tests, to run slowly and thoroughly
     #
 
-    def read_terminal_poke(self, timeout: float | None) -> TerminalPoke:
-        """Read one Keyboard Chord, Mouse Arrow Burst, Mouse Click, or Touch Tap"""
+    def _try_mouse_motion_tracker_(self) -> None:
+        """Require the Kinds, the Collapse of each Run of Motion, and the Framing in 1 Step"""
 
-        fileno = self.fileno
-        stdio = self.stdio
+        mt = MouseTerminal(motion_tracking=True)
+        mouse_terminals.remove(mt)  # doesn't become the MouseTerminal of the Studios
 
-        assert Immediately == 0.000_001
-        assert DSR_5 == "\033[" "5n"
-        assert DSR_0 == "\033[" "0n"
+        kbytes = b"\033[<0;5;9M"
+        kbytes += b"".join(f"\033[<32;{x};9M".encode() for x in range(6, 30))
+        kbytes += b"\033[<0;29;9m" + b"\033[<35;1;1M" + b"\033[<35;2;1M" + b"\033[<65;3;4M" + b"a"
 
-        # Wait for Input
+        mt.kbytearray.extend(kbytes)  # as if read, so without ⎋[5N Calls
 
-        t0 = time.time()
-        kbhit = self._kbhit_(timeout=timeout)
-        t1 = time.time()
+        tis = mt.read_frame_terminal_inputs()
 
-        hit = t1 - t0
-        if not kbhit:
-            tp = TerminalPoke(hit=hit, delays=tuple(), reads=tuple(), extra=b"")
-            return tp
+        assert b"".join(_.kbytes for _ in tis) == kbytes, (tis,)
+        assert len(tis) == 30, (len(tis), tis)
 
-        # Read Bursts of Bytes
+        events = self.track_frame(tis)
+        assert events == [
+            MouseEvent("press", f=0, y=9, x=5, count=1),
+            MouseEvent("drag", f=0, y=9, x=29, count=24),
+            MouseEvent("release", f=0, y=9, x=29, count=1),
+            MouseEvent("move", f=3, y=1, x=2, count=2),
+            MouseEvent("wheel", f=1, y=4, x=3, count=1),
+            tis[-1],
+        ], (events,)
 
-        delay_list: list[float] = list()
-        read_list: list[bytes] = list()
-        extra: bytes = b""
+        assert self.frame_counts == dict(press=1, drag=24, release=1, move=2, wheel=1), (self,)
+        assert (self.reports, self.collapsed) == (29, 24), (self,)
 
-        t = t1
-        m = None
-        while not m:
 
-            stdio.flush()  # before 'os.read' of .read_terminal_poke
+class TerminalByteQueue:
+    """Hold the Bytes read but not yet taken, behind a Read Cursor"""
+
+    bytearray_: bytearray  # the Bytes taken and not yet taken, till compacted
+    start: int  # the Read Cursor, the Index of the next Byte to take
+
+    #
+    # Init, Bool, Len, Bytes, and Clear
+    #
+
+    def __init__(self) -> None:
+        self.bytearray_ = bytearray()
+        self.start = 0
+
+    def __bool__(self) -> bool:
+        truthy = self.start < len(self.bytearray_)
+        return truthy
+
+    def __len__(self) -> int:
+        length = len(self.bytearray_) - self.start
+        return length
+
+    def __bytes__(self) -> bytes:
+        kbytes = bytes(self.bytearray_[self.start :])
+        return kbytes
+
+    def __repr__(self) -> str:
+        s = f"TerminalByteQueue({bytes(self)!r})"
+        return s
+
+    def clear(self) -> None:
+        """Drop every Byte not yet taken"""
+
+        self.bytearray_.clear()
+        self.start = 0
+
+    #
+    # Take Bytes in at the End, and out at the Read Cursor
+    #
 
-            fd = fileno
-            length = 1
+    def extend(self, data: bytes) -> None:
+        """Add Bytes at the End"""
 
-            read = os.read(fd, length)
-            read_plus = read
+        self._compact_if_()
+        self.bytearray_.extend(data)
 
-            while self._kbhit_(timeout=0.000_001):
-                read = os.read(fd, length)  # trust ._kbhit_ flush'es before 'os.read' here
-                read_plus += read
+    def peek(self, count: int) -> bytes:
+        """Copy out the next 0..Count Bytes, without taking them"""
 
-            t2 = time.time()
+        start = self.start
+        kbytes = bytes(self.bytearray_[start : (start + count)])
 
-            # Exactly once, write the ⎋[5 N Call for the ⎋[0 N Reply to close Input
-            # Take quick and slow Inputs till the closing ⎋[0 N Reply does arrive
+        return kbytes
 
-            read = read_plus
-            if not read_list:
+    def startswith(self, prefix: bytes) -> bool:
+        """Say if the next Bytes match, without taking them"""
 
-                stdio.write("\033[5n")
+        startswith = self.bytearray_.startswith(prefix, self.start)
+        return startswith
 
-                # todo: Try calling for different Replies to close Input
-                # todo: Don't call for Reply to close Text, except to close the ` of ⌥``
+    def endswith(self, suffix: bytes) -> bool:
+        """Say if the last Bytes not yet taken match"""
 
-            else:
+        endswith = self.bytearray_.endswith(suffix, self.start)
+        return endswith
 
-                m = re.search(rb"\033\[0n", string=read_plus)
-                if m and (m.end() > 0):
-                    extra = read_plus[m.end() :]
-                    read = read_plus[: m.end()]
+    def find(self, sub: bytes) -> int:
+        """Say how far past the Read Cursor the Bytes first match, else -1"""
 
-                    # todo: Stop finding ⎋[0 N Closing Reply out of context
+        start = self.start
+        index = self.bytearray_.find(sub, start)
+        if index < 0:
+            return -1
 
-            delay_list.append(t2 - t)
-            read_list.append(read)
-            t = t2
+        return index - start
 
-        #
+    def match_if(self, regex: re.Pattern[bytes]) -> re.Match[bytes] | None:
+        """Match the next Bytes, without taking them"""
 
-        kbytes = b"".join(read_list)
-        if kbytes == b"``" b"\033[0n":
-            assert len(read_list) >= 2, (read_list,)
-            read_list[::] = (b"``", b"\033[0n")
-            delay_list[::] = (sum(delay_list[:1]), delay_list[-1])
+        m = regex.match(self.bytearray_, self.start)
+        return m
 
-        # Succeed
+    def advance(self, count: int) -> None:
+        """Take 1 or more Bytes, by moving the Read Cursor past them"""
 
-        reads = tuple(read_list)
-        delays = tuple(delay_list)
+        assert 0 < count <= len(self), (count, len(self))
+        self.start += count
 
-        tp = TerminalPoke(hit=hit, delays=delays, reads=reads, extra=extra)
+        if self.start == len(self.bytearray_):
+            self.clear()
 
-        return tp
+    def take_text_if(self) -> bytes:
+        """Take the whole Run of Printable Text at the Read Cursor, else take 0 Bytes"""
 
-    def tp_from_startswith_mouse_arrow_kbytes(self, tp: TerminalPoke) -> tuple[bytes, bytes]:
-        """Fabricate the Key Caps and Bytes of a Mouse Release, when encoded as an Arrow Burst"""
+        start = self.start
+        with memoryview(self.bytearray_) as view:
+            span = terminal_byte_scanner.scan_pack(view, start=start)
 
-        kbytes = tp.to_kbytes()
+        text_stop = span[1]  # stops short of the Head, and of any Stash
+        if text_stop == start:
+            return b""
 
-        y_high = self.y_high
-        x_wide = self.x_wide
-        row_y = self.row_y
-        column_x = self.column_x
+        kbytes = bytes(self.bytearray_[start:text_stop])
+        self.advance(text_stop - start)
 
-        assert Y1 <= row_y <= y_high, (row_y, y_high)
-        assert X1 <= column_x <= x_wide, (column_x, x_wide)
+        return kbytes
 
-        dy_dx_by_arrow_kbytes = DY_DX_BY_ARROW_KBYTES
+    def take(self, count: int) -> bytes:
+        """Take and return the next 1 or more Bytes"""
 
-        # Visit each Arrow
+        start = self.start
+        kbytes = bytes(self.bytearray_[start : (start + count)])
+        self.advance(count)
 
-        y = row_y
-        x = column_x
+        return kbytes
 
-        from_bytearray = bytearray(kbytes)
-        to_bytearray = bytearray()
+    def pop0(self) -> int:
+        """Take and return the next 1 Byte"""
 
-        while True:
-            arrow = bytes(from_bytearray[:3])
-            if arrow not in dy_dx_by_arrow_kbytes.keys():
-                break
+        kord = self.bytearray_[self.start]
+        self.advance(1)
 
-            to_bytearray.extend(arrow)
-            del from_bytearray[:3]
+        return kord
 
-            # Look up which way this Arrow points
+    def unread(self, data: bytes) -> None:
+        """Give Bytes back, to take again before the Bytes not yet taken"""
 
-            (dy, dx) = dy_dx_by_arrow_kbytes[arrow]
+        start = self.start
+        if len(data) <= start:
+            self.bytearray_[(start - len(data)) : start] = data
+            self.start = start - len(data)
+        else:
+            self.bytearray_[:start] = data
+            self.start = 0
 
-            assert bool(dy) != bool(dx), (dy, dx)
-            assert dy in (-1, 0, +1), (dy,)
-            assert dx in (-1, 0, +1), (dx,)
+    def _compact_if_(self) -> None:
+        """Drop the Bytes taken, once they outnumber the Bytes not yet taken"""
 
-            # Move our more virtual Arrow Cursor (not the more real Terminal Cursor outside)
+        start = self.start
+        if start and (start >= (len(self.bytearray_) - start)):
+            del self.bytearray_[:start]
+            self.start = 0
 
-            if x > x_wide:
-                x = X1
-                y = min(y + 1, y_high)
+        # moves each Byte at most once per Byte taken, so takes O(1) Time per Byte amortized
 
-            assert Y1 <= y <= y_high, (y, y_high)
-            assert X1 <= x <= x_wide, (x, x_wide)
 
-            y += dy
-            x += dx
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
+class TerminalInput:
+    """Hold 1 Terminal Input, as its Bytes, and its Pack once asked for"""
 
-            y = max(Y1, min(y, y_high))
+    kbytes: bytes  # b'\033\033OP'
+    _pack_: TerminalBytePack | None = dataclasses.field(default=None, compare=False, repr=False)
 
-            if x < X1:
-                x = x_wide
-                y = max(Y1, y - 1)
+    def __init__(self, kbytes: bytes) -> None:
 
-        if x > x_wide:
-            x = x_wide  # caps differently at end of Arrow Burst
+        object.__setattr__(self, "kbytes", kbytes)  # as if not frozen, till __init__ returns
+        object.__setattr__(self, "_pack_", None)
 
-        assert Y1 <= y <= y_high, (y, y_high)
-        assert X1 <= x <= x_wide, (x, x_wide)
+        # forms no Pack till asked, as the Key Caps of most Inputs need only the Bytes
 
-        # Give up here, if no Arrow Burst found
+    @property
+    def caps(self) -> str:
+        """Speak of the Bytes with 1 Keycaps per Character"""  # '⎋⎋⇧O⇧P'
 
-        if not to_bytearray:
-            return (b"", b"")
+        (caps, face) = terminal_keycap_index.kbytes_to_kcaps_pair(self.kbytes)
+        return caps
 
-        # Encode the Arrow Burst as an ⌥-Click Release of the Mouse
+    @property
+    def face(self) -> str:
+        """Speak of the Bytes with Keycaps of 1 Keyboard Chord, else empty"""  # '⎋F1'
 
-        arrow_kbytes = bytes(to_bytearray)
+        (caps, face) = terminal_keycap_index.kbytes_to_kcaps_pair(self.kbytes)
+        return face
 
-        f8 = int("0b01000", base=0)  # f = ⌥ of 0b⌃⌥⇧00
-        kcaps = f"\033[<{f8};{x};{y}m"  # f x y, not f y x  # 'm' for Release  # not 'M' for Press
-        mouse_kbytes = kcaps.encode()
+    @property
+    def backtail(self) -> bytes:
+        """Pick out the Csi Intermediate Bytes and Final Byte"""  # b' q'
 
-        # Succeed (but trust the Caller to distinguish Single Arrows from Longer Bursts as needed)
+        kbytes = self.kbytes
+        (text_stop, head_stop, neck_stop, back_stop, stash_stop) = self.stops
 
-        return (mouse_kbytes, arrow_kbytes)
+        backtail = kbytes[neck_stop:back_stop] + kbytes[stash_stop:]
+        return backtail
 
-        # ('\033[<8;25;80m', b'\033[C',)  # Down Arrow into the Southeast Corner
+    @property
+    def pack(self) -> TerminalBytePack:
+        """Form a closed Pack of the Bytes once, and then keep it"""
 
+        kbytes = self.kbytes
 
-@dataclasses.dataclass(order=True)  # , frozen=True)
-class TerminalInput:
-    """Hold 1 Terminal Input"""
+        pack = self._pack_
+        if pack is None:
+            pack = TerminalBytePack(kbytes)
+            pack.close_if_csi_shift_m()
+            pack.close()
 
-    pack: TerminalBytePack
-    backtail: bytes  # b' q'
+            assert pack.to_bytes() == kbytes, (pack, kbytes)
 
-    kbytes: bytes  # b'\033\033OP'
-    caps: str  # '⎋⎋⇧O⇧P'
-    face: str  # ''  # '⎋F1'
+            object.__setattr__(self, "_pack_", pack)  # as if not frozen, while caching
 
-    def __init__(self, kbytes: bytes) -> None:
+        return pack
 
-        pack = TerminalBytePack(kbytes)
-        pack.close_if_csi_shift_m()
-        pack.close()
+        # shares the 1 Pack across Calls, so Callers mustn't change it
 
-        self.pack = pack
-        self.backtail = bytes(pack.back + pack.tail)
+    @property
+    def stops(self) -> tuple[int, int, int, int, int]:
+        """Find the ends of .text .head .neck .back .stash in the Bytes"""
 
-        self.kbytes = kbytes
-        caps = kbytes_to_precise_kcaps(kbytes)
-        face = kbytes_to_concise_kcaps_if(kbytes)
+        pack = self.pack
 
-        self.kbytes = kbytes
-        self.caps = caps
-        self.face = face
+        text_stop = len(pack.text.encode())
+        head_stop = text_stop + len(pack.head)
+        neck_stop = head_stop + len(pack.neck)
+        back_stop = neck_stop + len(pack.back)
+        stash_stop = back_stop + len(pack.stash)
 
-        # todo: freeze TerminalInput after __init__
+        stops = (text_stop, head_stop, neck_stop, back_stop, stash_stop)
+        return stops
 
     def to_csi_ints_if(self, backtail: bytes, start: bytes, default: int) -> list[int]:
         """Pick out the Nonnegative Int Literals of a CSI Escape Sequence"""
 
-        pack = self.pack
+        kbytes = self.kbytes
+        (text_stop, head_stop, neck_stop, back_stop, stash_stop) = self.stops
 
-        head = pack.head
-        neck = pack.neck
-        back = pack.back
-        stash = pack.stash
-        tail = pack.tail
-        closed = pack.closed
+        head = kbytes[text_stop:head_stop]
+        neck = kbytes[head_stop:neck_stop]
+        stash = kbytes[back_stop:stash_stop]
 
         if head.startswith(b"\033["):
             if neck.startswith(start):
                 neckpart = neck.removeprefix(start)
                 if re.fullmatch(b"[0-9;]*", string=neckpart):
-                    if backtail == (back + tail):
-                        if closed:
-                            assert not stash, (stash, backtail, self)
+                    if backtail == self.backtail:
+                        assert not stash, (stash, backtail, self)
 
-                            ints = list((int(_) if _ else default) for _ in neckpart.split(b";"))
+                        ints = list((int(_) if _ else default) for _ in neckpart.split(b";"))
 
-                            return ints
+                        return ints
 
         return list()
 
@@ -2566,6 +6012,8 @@ class TerminalInput:
 class TerminalBytePack:
     """Hold 1 Control Char, else 1 or more Text Chars, else some Bytes"""
 
+    __slots__ = ("text", "head", "neck", "back", "stash", "tail", "closed")
+
     text: str  # 0 or more Chars of Printable Text
 
     head: bytearray  # 1 Control Byte, else ⎋[, or ⎋O, or 3..6 Bytes starting with ⎋[M
@@ -2575,7 +6023,7 @@ class TerminalBytePack:
     stash: bytearray  # 1..3 Bytes taken for now, in hope of decoding 2..4 Later
     tail: bytearray  # CSI Final Byte, in 0x40..0x7E (63 Codes)
 
-    closed: bool = False  # closed because completed, or because continuation undefined
+    closed: bool  # closed because completed, or because continuation undefined
 
     Headbook = (b"\033", b"\033\033", b"\033\033O", b"\033\033[", b"\033O", b"\033[", b"\033]")
 
@@ -2766,8 +6214,45 @@ class TerminalBytePack:
         self._try_closed_(b"\033[", b"3;5", b"H")  # CSI Head with Next and Tail
         self._try_closed_(b"\033[", b"6", b" q")  # CSI Head with Neck and Back & Tail
 
+        # Try the Stash against trial Decodes
+
+        self._try_stash_()
+
         # todo: Test each Control Flow Return? Test each Control Flow Branch?
 
+    def _try_stash_(self) -> None:
+        """Require the same Stash, Decodes, and Extras as from trial Decodes"""
+
+        heads = [b""]
+        heads.extend(bytes([_]) for _ in range(0xC2, 0xF4 + 1))
+        heads.extend(bytes([_, 0x80]) for _ in (0xE1, 0xED, 0xF1, 0xF4))
+        heads.extend(bytes([_, 0xBF]) for _ in (0xE0, 0xEF, 0xF0, 0xF3))
+        heads.extend([b"\xf0\x90\x80", b"\xf4\x8f\xbf"])
+
+        for head in heads:
+            for ord_ in range(0x100):
+                byte = bytes([ord_])
+
+                pack = TerminalBytePack(b"")
+                pack.stash.extend(head)
+                got = pack._take_one_stashable_if(byte)
+                got_stash = bytes(pack.stash)
+
+                stash_plus = head + byte
+                try:
+                    decode = stash_plus.decode()
+                    want = (decode, stash_plus)
+                    want_stash = b""
+                except UnicodeDecodeError:
+                    want = ("", stash_plus)
+                    want_stash = b""
+                    if pack._any_decodes_startswith_(stash_plus):
+                        want = ("", b"")
+                        want_stash = stash_plus
+
+                assert got == want, (got, want, stash_plus)
+                assert got_stash == want_stash, (got_stash, want_stash, stash_plus)
+
     def _try_open_(self, *args: bytes) -> None:
         """Require the Eval of the Str of the Pack equals its Bytes"""
 
@@ -2833,6 +6318,19 @@ class TerminalBytePack:
     def take_some_if(self, data: bytes) -> bytes:
         """Take in the Bytes and return 0 Bytes, else return the trailing Bytes that don't fit"""
 
+        # Take many Bytes at once by Table Lookup, when starting empty
+
+        if data and (not self):
+            span = terminal_byte_scanner.scan_pack(data, start=0)
+            self._take_span_(data, span=span)
+
+            stop = span[-2]
+            extras = data[stop:]
+
+            return extras  # maybe .closed, maybe not
+
+        # Else take 1 Byte at a time
+
         for index in range(len(data)):
             byte = data[index:][:1]
             after_bytes = data[index:][1:]
@@ -2843,6 +6341,28 @@ class TerminalBytePack:
 
         return b""  # maybe .closed, maybe not
 
+    def _take_span_(
+        self, data: bytes | memoryview, span: tuple[int, int, int, int, int, int, int, bool]
+    ) -> None:
+        """Take in the Bytes of 1 Pack as framed by the TerminalByteScanner"""
+
+        (start, text_stop, head_stop, neck_stop, back_stop, stash_stop, stop, closed) = span
+
+        assert not self, (self,)
+
+        self.text = bytes(data[start:text_stop]).decode()
+
+        self.head.extend(data[text_stop:head_stop])
+        self.neck.extend(data[head_stop:neck_stop])
+        self.back.extend(data[neck_stop:back_stop])
+
+        self.stash.extend(data[back_stop:stash_stop])
+        self.tail.extend(data[stash_stop:stop])
+
+        self.closed = closed
+
+        self._require_simple_()
+
     def take_one(self, byte: bytes) -> None:
         """Take in next 1 Byte and return 0 Bytes, else raise ValueError"""
 
@@ -2905,26 +6425,54 @@ class TerminalBytePack:
         """Take 1 Byte into Stash, if next Bytes could make it Decodable"""
 
         stash = self.stash
-        stash_plus = bytes(stash + byte)
+        lead_by_byte = UTF8_LEAD_BY_BYTE
 
-        try:
-            decode = stash_plus.decode()
-        except UnicodeDecodeError:
-            decodes = self.any_decodes_startswith(stash_plus)
-            if decodes:
-                stash.extend(byte)
-                return ("", b"")  # holds 1..3 possibly Decodable Bytes in Stash
+        ord_ = byte[0]
+
+        # Forward 1 Byte of US-Ascii, else decline 1 Undecodable Byte, else start the Stash
+
+        if not stash:
+            (need, lo, hi, code) = lead_by_byte[ord_]
+            if need == 0:
+                return (chr(code), byte)  # forwards 1 Decodable Byte
+            if need < 0:
+                return ("", byte)  # declines 1 Undecodable Byte
+
+            stash.append(ord_)
+            return ("", b"")  # holds 1 possibly Decodable Byte in Stash
 
+        # Decline the Stash and this Byte, if this Byte can't come next
+
+        (need, lo, hi, code) = lead_by_byte[stash[0]]
+
+        count = len(stash)
+        if count > 1:
+            (lo, hi) = (0x80, 0xBF)  # only the 2nd Byte has a narrower Range
+
+        if not (lo <= ord_ <= hi):
+            stash_plus = bytes(stash) + byte
             stash.clear()
-            return ("", stash_plus)  # declines 1..4 Undecodable Bytes
+            return ("", stash_plus)  # declines 2..4 Undecodable Bytes
+
+        # Take this Byte into the Stash, else forward the Stash and this Byte
 
+        if count < need:
+            stash.append(ord_)
+            return ("", b"")  # holds 2..3 possibly Decodable Bytes in Stash
+
+        for index in range(1, count):
+            code = (code << 6) | (stash[index] & 0x3F)
+        code = (code << 6) | (ord_ & 0x3F)
+
+        stash_plus = bytes(stash) + byte
         stash.clear()
-        assert len(decode) == 1, (decode, stash, byte)
 
-        return (decode, stash_plus)  # forwards 1..4 Decodable Bytes
+        return (chr(code), stash_plus)  # forwards 2..4 Decodable Bytes
 
-    def any_decodes_startswith(self, data: bytes) -> str:
-        """Return Say if these Bytes start 1 or more UTF-8 Encodings of Chars"""
+        # classifies each Byte by its Lead Byte and Count, without trial Decodes
+
+    def _any_decodes_startswith_(self, data: bytes) -> str:
+        """Say if these Bytes start 1 or more UTF-8 Encodings of Chars, by trial Decodes"""
 
         closers = (b"\x80", b"\xbf", b"\x80\x80", b"\xbf\xbf", b"\x80\x80\x80", b"\xbf\xbf\xbf")
 
@@ -3176,53 +6724,487 @@ class TerminalBytePack:
                 neck.extend(byte)
                 return b""
 
-        # Accept \033 \134 Esc \ String Terminator (ST) into Back and Tail
+        # Accept \033 \134 Esc \ String Terminator (ST) into Back and Tail
+
+        if not back:
+            if encode == b"\033":
+                back.extend(byte)
+                return b""
+
+        if back == b"\033":
+            if code == 0o134 == 0x5C == ord("\\"):
+                tail.extend(byte)
+                self.closed = True
+                return b""
+
+        # Accept \007 BEL, much as if String Terminator (ST)
+
+        if code == 0o007:  # BEL
+            tail.extend(byte)
+            self.closed = True
+            return b""
+
+        # Decline 1 Bytes of Unprintable or Multi-Byte Char
+
+        return byte  # declines 1 Byte of 1 Unprintable or Multi-Byte Char
+
+    def close_if_csi_shift_m(self) -> bool:
+        """Convert to Csi ⎋[⇧M cut short, if now standing open as 3 of 6 Char Mouse Report"""
+
+        head = self.head
+        back = self.back
+        neck = self.neck
+        tail = self.tail
+        closed = self.closed
+
+        if (head == b"\033[M") and (not back) and (not neck) and (not tail):
+            if not closed:
+
+                self.head.clear()
+                self.head.extend(b"\033[")
+                self.tail.extend(b"M")
+
+                self.closed = True
+
+                return True
+
+        return False
+
+
+#
+# Split Bytes into Packs, a whole Chunk per Call, by Table Lookup per Byte
+#
+
+
+def _utf8_lead_(byte: int) -> tuple[int, int, int, int]:
+    """Say how many more Bytes a Lead Byte needs, what next Byte fits, and its Code Bits"""
+
+    if byte < 0x80:
+        return (0, 0, 0, byte)  # 1 Byte of US-Ascii
+
+    if 0xC2 <= byte <= 0xDF:
+        return (1, 0x80, 0xBF, byte & 0x1F)
+
+    if byte == 0xE0:
+        return (2, 0xA0, 0xBF, byte & 0x0F)  # rejects Overlong 3 Byte Encodings
+    if byte == 0xED:
+        return (2, 0x80, 0x9F, byte & 0x0F)  # rejects U+D800..U+DFFF Surrogates
+    if 0xE1 <= byte <= 0xEF:
+        return (2, 0x80, 0xBF, byte & 0x0F)
+
+    if byte == 0xF0:
+        return (3, 0x90, 0xBF, byte & 0x07)  # rejects Overlong 4 Byte Encodings
+    if byte == 0xF4:
+        return (3, 0x80, 0x8F, byte & 0x07)  # rejects Codes past U+10FFFF
+    if 0xF1 <= byte <= 0xF3:
+        return (3, 0x80, 0xBF, byte & 0x07)
+
+    return (-1, 0, 0, -1)  # 0x80..0xC1 and 0xF5..0xFF never lead
+
+    # the same Ranges as the Strict UTF-8 of Python 'bytes.decode'
+
+
+UTF8_LEAD_BY_BYTE = tuple(_utf8_lead_(_) for _ in range(0x100))
+
+
+class TerminalByteScanner:
+    """Split Bytes into Packs, a whole Chunk per Call, by Table Lookup per Byte"""
+
+    rows: tuple[tuple[tuple[int, int], ...], ...]  # (Move, Segment) per State per Unit
+
+    # Name the States of 1 Pack
+
+    Ground = 0  # empty
+    Text = 1  # 1 or more Printable Chars
+    Esc = 2  # ⎋
+    EscEsc = 3  # ⎋⎋
+    SS3 = 4  # ⎋O or ⎋⎋O
+    CSI = 5  # ⎋[ without Neck or Back
+    EscCSI = 6  # ⎋⎋[ without Neck or Back
+    CSINeck = 7  # ⎋[ or ⎋⎋[ with Neck, without Back
+    CSIBack = 8  # ⎋[ or ⎋⎋[ with Back
+    OSC = 9  # ⎋] with or without Neck
+    OSCEsc = 10  # ⎋] with or without Neck, and then the ⎋ of ⎋\ String Terminator (ST)
+    Mouse = 11  # ⎋[M and 0..2 of 3 more Chars or Bytes
+
+    # Name the Moves that end the Pack
+
+    Close = 12  # takes the Unit as Head or Tail, and closes the Pack
+    Cut = 13  # declines the Unit, and leaves it to start the next Pack
+
+    # Name the Segments of 1 Pack, in order
+
+    TextSeg = 0
+    HeadSeg = 1
+    NeckSeg = 2
+    BackSeg = 3
+    TailSeg = 4
+
+    # Name the Units that aren't 1 Byte of US-Ascii
+
+    WidePrintable = 0x80  # 2..4 Bytes of UTF-8 of 1 Printable Char
+    WideOther = 0x81  # 2..4 Bytes of UTF-8 of 1 Unprintable Char, or 1..4 Undecodable Bytes
+
+    TextRun = re.compile(rb"[\x20-\x7E]+")  # 1 or more Printable US-Ascii Bytes
+
+    def __init__(self) -> None:
+        self.rows = self._compile_rows_()
+
+    #
+    # Precompile the Table
+    #
+
+    def _compile_rows_(self) -> tuple[tuple[tuple[int, int], ...], ...]:
+        """Choose the next Move and Segment for each Unit in each State"""
+
+        rows = list()
+        for state in range(self.Close):
+            row = tuple(self._choose_move_(state, unit=_) for _ in range(0x80 + 2))
+            rows.append(row)
+
+        return tuple(rows)
+
+    def _choose_move_(self, state: int, unit: int) -> tuple[int, int]:
+        """Choose the next Move and Segment for 1 Unit in 1 State"""
+
+        t = chr(unit) if (unit < 0x80) else ""  # US-Ascii, else Empty
+        printable = t.isprintable() if t else (unit == self.WidePrintable)
+
+        assert CSI_P_CHARS == "0123456789:;<=>?"
+        assert CSI_I_CHARS == """ !'#$%&'()*+,-./"""
+        assert CSI_F_CHARS == "@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~"
+
+        # Start Text, else take 1 Unprintable as Head, else start an Esc Sequence
+
+        if state == self.Ground:
+            if printable:
+                return (self.Text, self.TextSeg)
+            if t == "\033":
+                return (self.Esc, self.HeadSeg)
+            return (self.Close, self.HeadSeg)
+
+        if state == self.Text:
+            if printable:
+                return (self.Text, self.TextSeg)
+            return (self.Cut, self.TextSeg)
+
+        # Grow the Head of ⎋ ⎋⎋ ⎋O ⎋⎋O ⎋[ ⎋⎋[ ⎋], else take any 1 Unit as its Tail
+
+        if state == self.Esc:
+            esc_moves = {"\033": self.EscEsc, "O": self.SS3, "[": self.CSI, "]": self.OSC}
+            if t and (t in esc_moves.keys()):
+                return (esc_moves[t], self.HeadSeg)
+            return (self.Close, self.TailSeg)
+
+        if state == self.EscEsc:
+            esc_esc_moves = {"O": self.SS3, "[": self.EscCSI}
+            if t and (t in esc_esc_moves.keys()):
+                return (esc_esc_moves[t], self.HeadSeg)
+            return (self.Close, self.TailSeg)
+
+        if state == self.SS3:
+            return (self.Close, self.TailSeg)
+
+        # Take the Neck, Back, and Tail of ⎋[ or ⎋⎋[, or the ⇧M of ⎋[⇧M, or of ⎋]
+
+        if state in (self.CSI, self.EscCSI, self.CSINeck, self.CSIBack):
+            return self._choose_csi_move_(state, t=t)
+
+        if state in (self.OSC, self.OSCEsc):
+            return self._choose_osc_move_(state, t=t)
+
+        # Count the 3 Chars or Bytes past ⎋[⇧M elsewhere
+
+        assert state == self.Mouse, (state,)
+
+        return (self.Mouse, self.HeadSeg)
+
+    def _choose_csi_move_(self, state: int, t: str) -> tuple[int, int]:
+        """Choose the next Move and Segment for 1 Unit in 1 State of ⎋[ or ⎋⎋["""
+
+        assert state in (self.CSI, self.EscCSI, self.CSINeck, self.CSIBack), (state,)
+
+        if (state == self.CSI) and (t == "M"):
+            return (self.Mouse, self.HeadSeg)
+        if t and (state != self.CSIBack) and (t in CSI_P_CHARS):
+            return (self.CSINeck, self.NeckSeg)
+        if t and ("\x20" <= t <= "\x2f"):
+            return (self.CSIBack, self.BackSeg)
+        if t and (t in CSI_F_CHARS):
+            return (self.Close, self.TailSeg)
+        return (self.Cut, self.TailSeg)
+
+    def _choose_osc_move_(self, state: int, t: str) -> tuple[int, int]:
+        """Choose the next Move and Segment for 1 Unit in 1 State of ⎋]"""
+
+        if state == self.OSC:
+            if t and ("\x20" <= t <= "\x7f"):
+                return (self.OSC, self.NeckSeg)
+            if t == "\033":
+                return (self.OSCEsc, self.BackSeg)
+            if t == "\a":
+                return (self.Close, self.TailSeg)
+            return (self.Cut, self.TailSeg)
+
+        assert state == self.OSCEsc, (state,)
+
+        if t in ("\\", "\a"):
+            return (self.Close, self.TailSeg)
+        return (self.Cut, self.TailSeg)
+
+    #
+    # Frame Packs
+    #
+
+    def split_packs(
+        self, data: bytes | memoryview
+    ) -> list[tuple[int, int, int, int, int, int, int, bool]]:
+        """Frame every Pack of a whole Chunk, and leave the last Pack open, if not closed"""
+
+        spans = list()
+
+        start = 0
+        length = len(data)
+        while start < length:
+            span = self.scan_pack(data, start=start)
+            spans.append(span)
+
+            stop = span[-2]
+            assert stop > start, (stop, start, span)
+            start = stop
+
+        return spans
+
+    def ends_whole(self, data: bytes | memoryview) -> bool:
+        """Say if the Bytes end with a closed Pack, or with whole Text"""
+
+        spans = self.split_packs(data)
+        if not spans:
+            return False
+
+        (start, text_stop, head_stop, neck_stop, back_stop, stash_stop, stop, closed) = spans[-1]
+        if closed:
+            return True
+
+        if (text_stop > start) and (stop == text_stop):
+            return True  # ends with whole Text, without Head, and without Stash
+
+        return False
+
+    def scan_pack(
+        self, data: bytes | memoryview, start: int
+    ) -> tuple[int, int, int, int, int, int, int, bool]:
+        """Frame 1 Pack, and say where its Text, Head, Neck, Back, Stash, & Tail stop"""
+
+        rows = self.rows
+        text_run = self.TextRun
+
+        (Text, Mouse, Close, Cut) = (self.Text, self.Mouse, self.Close, self.Cut)
+
+        length = len(data)
+
+        state = self.Ground
+        stops = [start, start, start, start]  # where the Text, Head, Neck, & Back stop
+
+        mouse_chars = 3  # counts the Chars of ⎋[⇧M
+        mouse_decodes = True
+
+        index = start
+        while index < length:
+            unit_start = index
+
+            # Take 1 Byte of US-Ascii, else 1..4 Bytes of UTF-8, else 1..4 Undecodable Bytes
+
+            (index, unit, code) = self._take_unit_(data, index=index)
+            if index < 0:  # stashes 1..3 Bytes, in hope of decoding 2..4 later
+                return self._span_(start, stops, stash_stop=length, stop=length, closed=False)
+
+            # Count 3 Chars, else 3 Bytes, past ⎋[⇧M
+
+            if state == Mouse:
+                if mouse_decodes and (code >= 0):
+                    mouse_chars += 1
+                    closing = mouse_chars == 6
+                else:
+                    if (index - start) > 6:
+                        return self._span_(start, stops, stops[-1], stop=unit_start, closed=False)
+                    mouse_decodes = False
+                    closing = (index - start) == 6
+
+                stops[1:] = (index, index, index)
+                if closing:
+                    return self._span_(start, stops, stops[-1], stop=index, closed=True)
+
+                continue
+
+            # Look up the next Move and Segment, and stretch the Segments till then
+
+            (move, segment) = rows[state][unit]
+
+            if move == Cut:
+                return self._span_(start, stops, stops[-1], stop=unit_start, closed=False)
+
+            stops[segment:] = (len(stops) - segment) * [index]  # but not for the Tail
+
+            if move == Close:
+                return self._span_(start, stops, stops[-1], stop=index, closed=True)
+
+            state = move
+
+            # Take many Printable US-Ascii Bytes at once
+
+            if state == Text:
+                m = text_run.match(data, index)
+                if m:
+                    index = m.end()
+                    stops[:] = (index, index, index, index)
+
+        return self._span_(start, stops, stops[-1], stop=length, closed=False)
+
+    def _take_unit_(self, data: bytes | memoryview, index: int) -> tuple[int, int, int]:
+        """Take 1 Unit, and say where it stops, what it is, and its Code Point, if any"""
+
+        lead_by_byte = UTF8_LEAD_BY_BYTE
+
+        byte = data[index]
+        index += 1
+        if byte < 0x80:
+            return (index, byte, byte)
+
+        length = len(data)
+
+        (need, lo, hi, code) = lead_by_byte[byte]
+        while need > 0:
+            if index >= length:
+                return (-1, -1, -1)  # says the Unit is incomplete
+
+            byte = data[index]
+            index += 1
+
+            if not (lo <= byte <= hi):
+                code = -1
+                break  # declines the Byte that doesn't fit, along with those before it
+
+            code = (code << 6) | (byte & 0x3F)
+            (need, lo, hi) = (need - 1, 0x80, 0xBF)
+
+        unit = self.WideOther
+        if (code >= 0) and chr(code).isprintable():
+            unit = self.WidePrintable
+
+        return (index, unit, code)
+
+    def _span_(
+        self, start: int, stops: list[int], stash_stop: int, stop: int, closed: bool
+    ) -> tuple[int, int, int, int, int, int, int, bool]:
+        """Say where the Text, Head, Neck, Back, Stash, & Tail of 1 Pack stop"""
+
+        (text_stop, head_stop, neck_stop, back_stop) = stops
+        span = (start, text_stop, head_stop, neck_stop, back_stop, stash_stop, stop, closed)
+
+        return span
+
+    #
+    # Tests, to run slowly and thoroughly
+    #
+
+    def _try_terminal_byte_scanner_(self) -> None:
+        """Require the same Packs from Table Lookup as from taking 1 Byte at a time"""
+
+        datas = [
+            b"",
+            b"Superb",
+            b"Superb\xc2",
+            b"\033",
+            b"\033\033",
+            b"\033O",
+            b"\033[6 ",
+            b"\xed\x80",
+            b"\xf4\x80\x80",
+            b"\033[M#\xff",
+            b"\033[M \xc4\x8a",
+            b"\n",
+            b"\033\033[3;5~",
+            b"\xc0",
+            b"\xff",
+            b"\xc2\xad",
+            b"\033A",
+            b"\033\t",
+            b"\033OP",
+            b"\033[3;5H",
+            b"\033[6 q",
+        ]
+
+        datas.extend(
+            [
+                b"abc\033[A\033[B\rdef\xc3\xa9\xe2\x82\xac\x7f\033\033OP",
+                b"\033]11;rgb:ffff/ffff/ffff\a\033]11;rgb:0/0/0\033\\\033[0n",
+                b"\033[M !!\033[M\xc4\x8a\xc4\x8a\xc4\x8a\033[<0;5;9m\033[<0;5;9M",
+                b"\xc2A\xe0\x80\xed\xa0\x80\xf4\x90\x80\x80\xc2\x1b[A``\x00\x1b\x7f",
+                b"\033[200~Hello,\rWorld\033[201~\033[5n\033[0n\033]\xc3\xa9",
+                b"\033[1;2\033[6;\033\033\033[\xc3\xa9\033O\033\033O\xff\033]\033x",
+            ]
+        )
+
+        for data in datas:
+            self._try_split_(data)
 
-        if not back:
-            if encode == b"\033":
-                back.extend(byte)
-                return b""
+    def _try_split_(self, data: bytes) -> None:
+        """Require the same Packs from Table Lookup as from taking 1 Byte at a time"""
 
-        if back == b"\033":
-            if code == 0o134 == 0x5C == ord("\\"):
-                tail.extend(byte)
-                self.closed = True
-                return b""
+        spans = self.split_packs(data)
+        slow_packs = self._split_slowly_(data)
 
-        # Accept \007 BEL, much as if String Terminator (ST)
+        assert len(spans) == len(slow_packs), (len(spans), len(slow_packs), data)
 
-        if code == 0o007:  # BEL
-            tail.extend(byte)
-            self.closed = True
-            return b""
+        for span, slow_pack in zip(spans, slow_packs):
+            fast_pack = TerminalBytePack(b"")
+            fast_pack._take_span_(data, span=span)
+            assert repr(fast_pack) == repr(slow_pack), (fast_pack, slow_pack, data)
 
-        # Decline 1 Bytes of Unprintable or Multi-Byte Char
+        if data:
+            pack = TerminalBytePack(b"")
+            extras = pack.take_some_if(data)
+            assert repr(pack) == repr(slow_packs[0]), (pack, slow_packs[0], data)
+            assert (pack.to_bytes() + extras) == data, (pack, extras, data)
 
-        return byte  # declines 1 Byte of 1 Unprintable or Multi-Byte Char
+    def _split_slowly_(self, data: bytes) -> list[TerminalBytePack]:
+        """Frame every Pack by taking 1 Byte at a time"""
 
-    def close_if_csi_shift_m(self) -> bool:
-        """Convert to Csi ⎋[⇧M cut short, if now standing open as 3 of 6 Char Mouse Report"""
+        packs = list()
 
-        head = self.head
-        back = self.back
-        neck = self.neck
-        tail = self.tail
-        closed = self.closed
+        pack = TerminalBytePack(b"")
+        index = 0
+        while index < len(data):
+            byte = data[index:][:1]
+            index += 1
 
-        if (head == b"\033[M") and (not back) and (not neck) and (not tail):
-            if not closed:
+            extras = pack.take_one_if(byte)
+            if extras:
+                packs.append(pack)
+                pack = TerminalBytePack(b"")
+                index -= len(extras)
 
-                self.head.clear()
-                self.head.extend(b"\033[")
-                self.tail.extend(b"M")
+        if pack:
+            packs.append(pack)
 
-                self.closed = True
+        return packs
 
-                return True
+    def _time_terminal_byte_scanner_(self) -> tuple[float, float]:
+        """Time framing a large Paste by taking 1 Byte at a time, and then by Table Lookup"""
 
-        return False
+        para = b"The quick brown fox jumps over the lazy dog,\r\033[A\033[C" + "déjà vu\r".encode()
+        data = (4096 * para)[:0x10000]  # 64 KiB
+
+        t0 = time.time()
+        slow_packs = self._split_slowly_(data)
+        t1 = time.time()
+        spans = self.split_packs(data)
+        t2 = time.time()
 
-    # todo: Limit rate of input so livelocks go less wild, like in Keyboard/ Screen loopback
+        assert len(spans) == len(slow_packs), (len(spans), len(slow_packs))
+
+        return (t1 - t0, t2 - t1)
 
 
 BEL = "\a"  # U+0007 Bell (BEL)
@@ -3234,10 +7216,14 @@ CSI = "\033["  # 01/11 05/11 Control Sequence Introducer
 OSC = "\033]"  # 01/11 05/13 Operating System Command
 ST = "\033\134"  # 05/11 05/12 String Terminator
 
+CUF_X = "\033[" "{}C"  # CSI 04/03 Cursor Forward
 CUP_Y_X = "\033[" "{};{}H"  # CSI 04/08 [Choose] Cursor Position
+ED_PS = "\033[" "{}J"  # CSI 04/10 Erase in Display
 
 DCH_X = "\033[" "{}" "P"  # CSI 05/00 Delete Character
 
+SGR_PS = "\033[" "{}m"  # CSI 06/13 Select Graphic Rendition
+
 
 DSR_5 = "\033[" "5n"  # CSI 06/14 [Request] Device Status Report  # Ps 5 Request DSR_0
 DSR_0 = "\033[" "0n"  # CSI 06/14 [Response] Device Status Report  # Ps 0 Response Ready
@@ -3256,6 +7242,8 @@ CSI_F_CHARS = "@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~"
 
 _SM_SGR_MOUSE_ = "\033[" "?1000;1006h"  # codes Press/ Release as ⎋[{f};{x};{y} ⇧M and M
 _RM_SGR_MOUSE_ = "\033[" "?1000;1006l"
+_SM_SGR_MOTION_ = "\033[" "?1003;1006h"  # codes Moves/ Drags too, as ⎋[<{f + 32};{x};{y} ⇧M
+_RM_SGR_MOTION_ = "\033[" "?1003;1006l"
 
 _SM_BRACKETED_PASTE_ = "\033[" "?2004h"  # codes Start/ End as ⎋[200~ and ⎋[201~
 _RM_BRACKETED_PASTE_ = "\033[" "?2004l"
@@ -3266,6 +7254,37 @@ SM_DECTCEM = "\033[" "?25h"  # 06/08 Set Mode (SMS) 25 VT220 Show Cursor
 RM_DECTCEM = "\033[" "?25l"  # 06/12 Reset Mode (RM) 25 VT220 Hide Cursor
 
 
+MIRROR_TOKEN_REGEX = re.compile(  # splits Writes into Csi, Osc, Esc, Control, and Text
+    r"\033\[([0-9:;<=>?]*)[ -/]*([@-~])"
+    r"|\033\][^\a\033]*(?:\a|\033\\)"
+    r"|\033.?"
+    r"|[\x00-\x1F\x7F-\x9F]"
+    r"|[^\x00-\x1F\x7F-\x9F\033]+",
+    flags=re.DOTALL,
+)
+
+
+NON_ASCII_REGEX = re.compile(r"[^\x00-\x7F]")  # matches each Char that may be Wide
+
+SGR_PARAMS_REGEX = re.compile(r"\033\[([0-9;]*)m")  # matches 1 SGR, and its Params
+SGRS_REGEX = re.compile(r"(?:\033\[[0-9;]*m)*")  # matches 0 or more SGR, and nothing else
+
+
+CPR_Y_X_REGEX = re.compile(rb"\033\[[0-9]*;[0-9]*R")  # matches the ⎋[ ⇧R Reply to ⎋[6N
+XTWINOPS_8_H_W_REGEX = re.compile(rb"\033\[8;[0-9]*;[0-9]*t")  # matches the ⎋[8 T Reply to ⎋[18T
+DSR_0_REGEX = re.compile(rb"\033\[0n")  # matches the ⎋[0N Reply to ⎋[5N
+KITTY_FLAGS_REGEX = re.compile(rb"\033\[\?([0-9]*)u")  # matches the ⎋[?{flags}U Reply to ⎋[?U
+KITTY_KEY_REGEX = re.compile(  # matches ⎋[{code}[:alternates][;{mods}[:event][;text]]U
+    rb"\033\[([0-9]+)(?::[0-9]*)*(?:;([0-9]*)(?::[0-9]+)?)?(?:;[0-9:]*)?u"
+)
+MOUSE_PRESS_REGEX = re.compile(rb"\033\[<[0-9]+;[0-9]+;[0-9]+M")  # matches a ⎋[<f;x;y ⇧M Press
+OSC_PAYLOAD_REGEX = re.compile(rb"[\x20-\x7F]*")  # matches the Printable Payload of an Osc Sequence
+MOUSE_SGR_REGEX = re.compile(rb"\033\[<([0-9]+);([0-9]+);([0-9]+)([Mm])")  # matches any SGR Report
+
+
+terminal_byte_scanner = TerminalByteScanner()  # compiles its Table after the Csi Chars
+
+
 @dataclasses.dataclass(order=True, frozen=True)
 class TerminalPoke:
     """Say what we got for Input, and how long we waited"""
@@ -3416,25 +7435,18 @@ class TerminalPoke:
         """Say what we got for Input, if indeed it is an Arrow Burst"""
 
         reads = self.reads
-        dy_dx_by_arrow_kbytes = DY_DX_BY_ARROW_KBYTES
         assert DSR_0 == "\033[" "0n"
 
         # Take nothing but ⎋[A ⎋[B ⎋[C ⎋[D plain Arrow Keystroke Chords, up to a ⎋[0 N Reply
 
-        arrow_burst_kbytearray = bytearray()
-        end = b""
-
         kbytes = b"".join(reads)
-        for index in range(0, len(kbytes), 3):
-            arrow = kbytes[index:][:3]
-
-            if arrow not in dy_dx_by_arrow_kbytes.keys():
-                end = kbytes[index:]
-                break
+        runs = arrow_kbytes_to_runs(kbytes)
+        length = 3 * sum(count for (arrow, count) in runs)
 
-            arrow_burst_kbytearray.extend(arrow)
+        arrow_burst_kbytes = kbytes[:length]
+        end = kbytes[length:]
 
-        if len(arrow_burst_kbytearray) < (4 * 3):
+        if len(arrow_burst_kbytes) < (4 * 3):
             return ""
 
         if b"\033[0n" not in end:
@@ -3442,7 +7454,6 @@ class TerminalPoke:
 
         # Say briefly how many Arrows came in what order, and if the End was strange
 
-        arrow_burst_kbytes = bytes(arrow_burst_kbytearray)
         kbytes_as_if = arrows_kbytes_pn_compress(arrow_burst_kbytes)
         rep = str(kbytes_as_if)
 
@@ -3483,6 +7494,155 @@ class TerminalPoke:
     # todo2: Fill Bold over 8 Dim keyboards | unmarked, ⌃, ⌥, ⇧ | ⌥⇧, ⌃⇧, ⌃⌥ | ⌃⌥⇧
 
 
+class TerminalGapStats:
+    """Estimate the Gaps inside 1 Poke, and between Pokes, from the Timing of each Poke"""
+
+    intra_gaps: collections.deque[float]  # the latest Gaps between Bursts inside 1 Poke
+    inter_gaps: collections.deque[float]  # the latest Gaps between Pokes, while waiting for Input
+    poke_count: int  # counts the Pokes taken, including those dropped from the Deques
+    idle_closed: float  # when the last Burst of the latest Poke ended, if an Idle Gap closed it
+
+    def __init__(self) -> None:
+        self.intra_gaps = collections.deque(maxlen=64)
+        self.inter_gaps = collections.deque(maxlen=64)
+        self.poke_count = 0
+        self.idle_closed = 0.0
+
+    def __str__(self) -> str:
+
+        intra_gaps = self.intra_gaps
+        inter_gaps = self.inter_gaps
+
+        intra_50 = sketch(self.quantile(intra_gaps, q=0.50), near=1e-3)
+        intra_90 = sketch(self.quantile(intra_gaps, q=0.90), near=1e-3)
+        inter_10 = sketch(self.quantile(inter_gaps, q=0.10), near=1e-3)
+        inter_50 = sketch(self.quantile(inter_gaps, q=0.50), near=1e-3)
+
+        burst_gap = sketch(self.burst_gap(), near=1e-3)
+        idle_gap = sketch(self.idle_gap(), near=1e-3)
+
+        s = f"Gaps: {len(intra_gaps)} inside at p50 {intra_50} p90 {intra_90}"
+        s += f", {len(inter_gaps)} between at p10 {inter_10} p50 {inter_50}"
+        s += f", so Burst Gap {burst_gap} & Idle Gap {idle_gap}"
+
+        return s
+
+        # 'Gaps: 3 inside at p50 1.2 p90 4.1, 9 between at p10 85 p50 240, so Burst Gap 300e-6 ...'
+
+    def take_poke(self, tp: TerminalPoke, arrival: float, idle_gap: float) -> None:
+        """Count the Gaps of 1 more Poke"""
+
+        intra_gaps = self.intra_gaps
+        inter_gaps = self.inter_gaps
+        idle_closed = self.idle_closed
+
+        assert DSR_0 == "\033[" "0n"
+
+        if not tp.reads:
+            return
+
+        self.idle_closed = (time.time() - idle_gap) if idle_gap else 0.0
+
+        # Count a Gap that ran past the Idle Gap as inside 1 Poke, if not past the IdleGapMax
+
+        self.poke_count += 1
+        if tp.hit >= IdleGapMin:  # skips the Pokes that arrived while we weren't yet waiting
+            gap = arrival - idle_closed
+            if idle_closed and (gap <= IdleGapMax):
+                intra_gaps.append(gap)  # lets the Idle Gap grow, when it closed Pokes too soon
+            else:
+                inter_gaps.append(tp.hit)
+
+        gaps = tp.delays[1:]
+        if tp.reads[-1].endswith(b"\033[0n"):
+            gaps = gaps[:-1]  # drops the Round Trip of the ⎋[0 N Reply
+
+        intra_gaps.extend(gaps)
+
+    def quantile(self, gaps: collections.abc.Iterable[float], q: float) -> float:
+        """Pick the Gap at the Q Quantile, else 0 when no Gaps measured"""
+
+        sorts = sorted(gaps)
+        if not sorts:
+            return 0
+
+        index = int(q * (len(sorts) - 1))
+        gap = sorts[index]
+
+        return gap
+
+        # sorts at most 64 Floats per Call, quick enough to call once per Poke
+
+    def burst_gap(self) -> float:
+        """Guess how long to wait for more Bytes of 1 Burst, before closing the Burst"""
+
+        intra_gaps = self.intra_gaps
+
+        if not intra_gaps:
+            return Immediately
+
+        gap = self.quantile(intra_gaps, q=0.10) / 4
+        gap = max(Immediately, min(gap, IdleGapMin / 2))
+
+        return gap
+
+        # waits a quarter of a quick Gap inside 1 Poke, so as to merge 2 Bursts quicker than that
+
+    def idle_gap(self) -> float:
+        """Guess how long to wait for more Bytes of 1 Poke, before closing the Poke"""
+
+        intra_gaps = self.intra_gaps
+        inter_gaps = self.inter_gaps
+
+        if not intra_gaps:
+            return IdleGapFirst
+
+        gap = 2 * self.quantile(intra_gaps, q=0.90)
+        if inter_gaps:
+            gap = min(gap, self.quantile(inter_gaps, q=0.10) / 2)
+
+        gap = max(IdleGapMin, min(gap, IdleGapMax))
+
+        return gap
+
+        # waits out twice a slow Gap inside 1 Poke, but half a quick Gap between Pokes at most
+
+    def _try_terminal_gap_stats_(self) -> None:
+        """Grow the Idle Gap, when Gaps run past it, but not past the IdleGapMax"""
+
+        intra_gaps = self.intra_gaps
+        inter_gaps = self.inter_gaps
+
+        # Start with 1 Gap inside 1 Poke, and 1 Gap between Pokes
+
+        tp = TerminalPoke(hit=0.100, delays=(0.001, 0.003), reads=(b"a", b"b"), extra=b"")
+        self.take_poke(tp, arrival=time.time(), idle_gap=0.0)
+
+        idle_gap = self.idle_gap()
+        assert idle_gap == 0.006, (idle_gap, self)
+
+        # Count a Gap just past the Idle Gap as inside 1 Poke
+
+        tp = TerminalPoke(hit=0.100, delays=(0.001,), reads=(b"c",), extra=b"")
+        self.take_poke(tp, arrival=time.time(), idle_gap=idle_gap)
+
+        for kbytes in (b"d", b"e", b"f"):
+            tp = TerminalPoke(hit=0.012, delays=(0.001,), reads=(kbytes,), extra=b"")
+            self.take_poke(tp, arrival=self.idle_closed + 0.020, idle_gap=idle_gap)
+
+        assert list(inter_gaps) == [0.100, 0.100], (inter_gaps,)
+        assert len(intra_gaps) == 4, (intra_gaps,)
+        assert self.idle_gap() > (2 * idle_gap), (self.idle_gap(), idle_gap)
+
+        # Count a Gap past the IdleGapMax as between Pokes
+
+        tp = TerminalPoke(hit=0.200, delays=(0.001,), reads=(b"g",), extra=b"")
+        self.take_poke(tp, arrival=self.idle_closed + 0.210, idle_gap=0.0)
+
+        assert list(inter_gaps) == [0.100, 0.100, 0.200], (inter_gaps,)
+        assert len(intra_gaps) == 4, (intra_gaps,)
+
+
 # Name the Shifting Keys
 
 Meta = unicodedata.lookup("Broken Circle With Northwest Arrow")  # ⎋
@@ -3505,6 +7665,10 @@ DY_DX_BY_ARROW_KBYTES = {
     b"\033[D": (0, -1),  # ⎋[⇧D  # ←
 }
 
+ARROW_PN_REGEX = re.compile(rb"\033\[([0-9]*)([ABCD])")  # matches ⎋[⇧A, ⎋[3⇧A, etc
+
+ARROW_RUN_REGEX = re.compile(rb"(?:\033\[A)+|(?:\033\[B)+|(?:\033\[C)+|(?:\033\[D)+")
+
 
 # Decode each distinct Key Chord Byte Encoding as a distinct Str without a " " Space in it
 
@@ -3545,6 +7709,7 @@ KCAP_BY_KTEXT = {  # r"←|↑|→|↓" and so on  # ⌃ ⌥ ⇧ ⌃⌥ ⌃⇧ 
     "\033O" "R": "F3",  # SS3 ⇧R
     "\033O" "S": "F4",  # SS3 ⇧S
     #
+    "\033[" "13~": "F3",  # Kitty Keyboard Protocol
     "\033[" "15;2~": "⇧F5",  # iTerm2 Apple
     "\033[" "15;3~": "⌥F5",  # iTerm2 Apple
     "\033[" "15;4~": "⌥⇧F5",  # ⌥⇧F6  # iTerm2 Apple
@@ -3710,6 +7875,9 @@ KCAP_BY_KTEXT = {  # r"←|↑|→|↓" and so on  # ⌃ ⌥ ⇧ ⌃⌥ ⌃⇧ 
     "\033[" "D": "←",  # CSI 04/04 Cursor [Back] Left (CUB)  # also ⌥← Apple
     "\033[" "F": "⇧Fn→",  # Apple  # CSI 04/06 Cursor Preceding Line (CPL)
     "\033[" "H": "⇧Fn←",  # Apple  # CSI 04/08 Cursor Position (CUP)
+    "\033[" "P": "F1",  # Kitty Keyboard Protocol
+    "\033[" "Q": "F2",  # Kitty Keyboard Protocol
+    "\033[" "S": "F4",  # Kitty Keyboard Protocol
     "\033[" "Z": "⇧Tab",  # ⇤  # CSI 05/10 Cursor Backward Tabulation (CBT)
     "\033" "b": "⌥←",  # ⎋B  # ⎋←  # Emacs M-b Backword-Word  # Apple
     "\033" "f": "⌥→",  # ⎋F  # ⎋→  # Emacs M-f Forward-Word  # Apple
@@ -3766,59 +7934,112 @@ OPTION_KTEXT_BY_KT = {
 # hand-sorted by ⌥E ⌥I ⌥N ⌥U ⌥` order
 
 
+KCAP_BY_CHORD_WORD = {
+    "Esc": "⎋",
+    "Meta": "⎋",
+    "Control": "⌃",
+    "Ctrl": "⌃",
+    "Alt": "⌥",
+    "Option": "⌥",
+    "Shift": "⇧",
+    "Command": "⌘",
+    "Fn": "Fn",
+}
+
+CHORD_TOKEN_REGEX = re.compile(  # splits Chords into Words, F Keys, and Chars
+    r"(" + "|".join(KCAP_BY_CHORD_WORD.keys()) + r")[-+]?" r"|(F[0-9]+)" r"|.",
+    flags=re.DOTALL,
+)
+
+
 def chord_to_caps_list(chord: str) -> list[str]:
     """Convert 'F2' to ['F2'] and 'Esc-F4' to ['⎋', 'F4'] and so on"""
 
-    d = {
-        "Esc": "⎋",
-        "Meta": "⎋",
-        "Control": "⌃",
-        "Ctrl": "⌃",
-        "Alt": "⌥",
-        "Option": "⌥",
-        "Shift": "⇧",
-        "Command": "⌘",
-        "Fn": "Fn",
-    }
+    kcap_by_chord_word = KCAP_BY_CHORD_WORD
 
     caps_list: list[str] = list()
+    for m in CHORD_TOKEN_REGEX.finditer(chord):
+        (word, fkey) = m.groups()
 
-    text = chord
-    while text:
-
-        short = ""
-        long = ""
-        for k, v in d.items():
-            if text.startswith(k + "+"):
-                short = k + "+"
-                long = v
-            elif text.startswith(k + "-"):
-                short = k + "-"
-                long = v
-            elif text.startswith(k):
-                short = k
-                long = v
-
-        fm = re.match(r"^F[0-9]+", text)
-
-        if short and long:
-            pass
-        elif fm:
-            short = long = fm.group(0)
+        if word:
+            long = kcap_by_chord_word[word]
+        elif fkey:
+            long = fkey
             if caps_list and caps_list[-1] == "Fn":
                 caps_list.pop()
         else:
-            short = long = text[:1]
+            long = m.group(0)
 
-        text = text.removeprefix(short)
         caps_list.append(long)
 
     return caps_list
 
+    # ['⌃', '⇧', 'X'] from 'Ctrl+Shift+X'
+    # ['F12'] from 'FnF12'
+
 
 def kbytes_to_concise_kcaps_if(kbytes: bytes) -> str:
     """Choose Keycaps to speak of the Bytes of 1 Keyboard Chord"""
 
+    (precise, concise_if) = terminal_keycap_index.kbytes_to_kcaps_pair(kbytes)
+    return concise_if
+
+
+def kbytes_to_precise_kcaps(kbytes: bytes) -> str:
+    """Choose 1 Keycaps per Character to speak of the Bytes of 1 Keyboard Chord"""
+
+    (precise, concise_if) = terminal_keycap_index.kbytes_to_kcaps_pair(kbytes)
+    return precise
+
+
+KCAP_BY_KITTY_CODE = {
+    9: "Tab",
+    13: "Return",
+    27: "⎋",
+    32: "Spacebar",
+    127: "Delete",
+}
+
+KITTY_MOD_KCAPS = (  # in the Order of Apple Menus
+    (4, "⌃"),  # Ctrl
+    (2, "⌥"),  # Alt
+    (1, "⇧"),  # Shift
+    (8, "⌘"),  # Super
+)
+
+
+def kitty_kbytes_to_kcaps_if(kbytes: bytes) -> str:
+    """Choose Keycaps to speak of a Kitty ⎋[ U Key, else empty"""
+
+    kcap_by_kitty_code = KCAP_BY_KITTY_CODE
+
+    m = KITTY_KEY_REGEX.fullmatch(kbytes)
+    if not m:
+        return ""
+
+    code = int(m.group(1))
+    mods = int(m.group(2) or b"1") - 1  # Kitty adds 1 to the Modifier Bits
+
+    if code in kcap_by_kitty_code.keys():
+        kc = kcap_by_kitty_code[code]
+    elif ord("a") <= code <= ord("z"):
+        kc = chr(code ^ 0x20)  # plain Key Cap 'A' from b'a'
+    elif (0x21 <= code < 0x7F) or (0xA0 < code < 0xE000):  # not the Kitty Private Use Codes
+        kc = chr(code)
+    else:
+        return ""
+
+    kcaps = "".join(kcap for (bit, kcap) in KITTY_MOD_KCAPS if mods & bit) + kc
+
+    return kcaps
+
+    # '⌃D' from b'\033[100;5u'
+    # '⎋' from b'\033[27u'
+
+
+def _kbytes_to_concise_kcaps_if_(kbytes: bytes) -> str:
+    """Choose Keycaps to speak of the Bytes of 1 Keyboard Chord, by probing the Tables"""
+
     ktext = kbytes.decode()  # todo: .kbytes_to_concise_kcaps_if may raise UnicodeDecodeError
     kcap_by_ktext = KCAP_BY_KTEXT  # '\e\e[A' for ⎋↑ etc
 
@@ -3856,8 +8077,8 @@ def kbytes_to_concise_kcaps_if(kbytes: bytes) -> str:
     # '⎋9' from ⌥9 while Apple Keyboard > Option as Meta Key
 
 
-def kbytes_to_precise_kcaps(kbytes: bytes) -> str:
-    """Choose 1 Keycaps per Character to speak of the Bytes of 1 Keyboard Chord"""
+def _kbytes_to_precise_kcaps_(kbytes: bytes) -> str:
+    """Choose 1 Keycaps per Character to speak of the Bytes of 1 Keyboard Chord, by testing"""
 
     assert kbytes, (kbytes,)
 
@@ -4028,47 +8249,328 @@ for _KTEXT_, _COUNT_ in collections.Counter(_KTEXT_UNROLL_).items():
     assert _COUNT_ == 1, (_COUNT_, _KTEXT_)
 
 
-def arrows_kbytes_pn_compress(kbytes: bytes) -> bytes:
-    """Compress each run of Arrows into a Pn > 1"""
+class TerminalKeycapIndex:
+    """Look up the Precise & Concise Key Caps of whole K Bytes, in 1 Probe"""
+
+    kcaps_pair_by_kbytes: dict[bytes, tuple[str, str]]  # compiled once from the Key Cap Tables
+    kcap_by_kt: dict[str, str]  # compiled once from the Key Cap Tables and the Latin-1 Chars
+    ktext_by_kcaps: dict[str, str]  # compiled once from KCAP_BY_KTEXT, first KText per Key Caps
+    lru_by_kbytes: collections.OrderedDict[bytes, tuple[str, str]]  # the K Bytes seen lately
+
+    def __init__(self) -> None:
+
+        kcap_by_ktext = KCAP_BY_KTEXT
+        option_ktext_by_kt = OPTION_KTEXT_BY_KT
+        option_kt_str = OPTION_KT_STR
+
+        # Compile 1 Key Cap per Char
+
+        kts = list(chr(_) for _ in range(0x100))
+        kts.extend(_ for _ in kcap_by_ktext.keys() if len(_) == 1)
+        kts.extend(option_ktext_by_kt.keys())
+        kts.extend(option_kt_str.replace(" ", ""))
+
+        kcap_by_kt = dict((_, _kt_to_kcap_(_)) for _ in kts)
+
+        # Compile every Precise & Concise Pair that has Concise Key Caps, and each Char
+
+        ktexts = list(kts)
+        ktexts.extend(kcap_by_ktext.keys())
+        ktexts.extend(("\033" + _) for _ in kcap_by_ktext.keys() if _.startswith("\033"))
+
+        kcaps_pair_by_kbytes = dict()
+        for ktext in ktexts:
+            kbytes = ktext.encode()
+            precise = _kbytes_to_precise_kcaps_(kbytes)
+            concise_if = _kbytes_to_concise_kcaps_if_(kbytes)
+            kcaps_pair_by_kbytes[kbytes] = (precise, concise_if)
 
-    dy_dx_by_arrow_kbytes = DY_DX_BY_ARROW_KBYTES
+        # Compile the first KText per Key Caps
 
-    pairs: list[tuple[int, bytes]] = list()
+        ktext_by_kcaps: dict[str, str] = dict()
+        for ktext, kcaps in kcap_by_ktext.items():
+            ktext_by_kcaps.setdefault(kcaps, ktext)
 
-    kbytearray = bytearray(kbytes)
-    while kbytearray:
-        arrow = bytes(kbytearray[:3])
-        del kbytearray[:3]
+        #
+
+        self.kcaps_pair_by_kbytes = kcaps_pair_by_kbytes
+        self.kcap_by_kt = kcap_by_kt
+        self.ktext_by_kcaps = ktext_by_kcaps
+        self.lru_by_kbytes = collections.OrderedDict()
+
+    def kbytes_to_kcaps_pair(self, kbytes: bytes) -> tuple[str, str]:
+        """Look up the Precise & Concise Key Caps of whole K Bytes, in 1 Probe"""
+
+        kcaps_pair_by_kbytes = self.kcaps_pair_by_kbytes
+        lru_by_kbytes = self.lru_by_kbytes
+
+        # Look up the K Bytes of the Key Cap Tables
+
+        pair = kcaps_pair_by_kbytes.get(kbytes)
+        if pair is not None:
+            return pair
+
+        # Look up the K Bytes seen lately
+
+        pair = lru_by_kbytes.get(kbytes)
+        if pair is not None:
+            lru_by_kbytes.move_to_end(kbytes)
+            return pair
 
-        assert arrow in dy_dx_by_arrow_kbytes.keys(), (arrow,)
+        # Else decode a Kitty Key, else form Precise Key Caps by Char, and no Concise Key Caps
 
-        tail = arrow[-1:]
-        if pairs and pairs[-1][-1] == tail:
-            pairs[-1] = (pairs[-1][0] + 1, tail)
+        kitty_kcaps = kitty_kbytes_to_kcaps_if(kbytes)
+        if kitty_kcaps:
+            pair = (kitty_kcaps, kitty_kcaps)  # as self-delimiting, so precise
         else:
-            pair = (1, tail)
-            pairs.append(pair)
+            precise = self._kbytes_to_precise_kcaps_by_kt_(kbytes)
+            pair = (precise, "")  # as outside the Key Cap Tables
+
+        lru_by_kbytes[kbytes] = pair
+        if len(lru_by_kbytes) > KcapsLruMax:
+            lru_by_kbytes.popitem(last=False)
+
+        return pair
+
+    def kcaps_to_kbytes_if(self, kcaps: str) -> bytes:
+        """Look up the K Bytes of the Key Caps, else empty Bytes"""
+
+        ktext_by_kcaps = self.ktext_by_kcaps
+
+        if kcaps.startswith("⎋") and (kcaps != "⎋"):
+            esc_kcaps = kcaps.removeprefix("⎋")
+            if esc_kcaps not in ktext_by_kcaps.keys():
+                return b""
+
+            kbytes = b"\033" + ktext_by_kcaps[esc_kcaps].encode()
+            return kbytes
+
+        kbytes = ktext_by_kcaps.get(kcaps, "").encode()
+        return kbytes
+
+        # b'\033\033OS' from '⎋F4'
+
+    def _kbytes_to_precise_kcaps_by_kt_(self, kbytes: bytes) -> str:
+        """Choose 1 Keycaps per Character, by Lookup"""
+
+        kcap_by_kt = self.kcap_by_kt
+
+        assert kbytes, (kbytes,)
+
+        ktext = kbytes.decode()  # may raise UnicodeDecodeError, same as ._kbytes_to_precise_kcaps_
+
+        precise = "".join(kcap_by_kt.get(_) or _kt_to_kcap_(_) for _ in ktext)
+
+        return precise
+
+    #
+    # Tests, to run slowly and thoroughly
+    #
+
+    def _try_terminal_keycap_index_(self) -> None:
+        """Require the same Key Caps from Lookup as from testing each Char"""
+
+        kbytes_list = list(self.kcaps_pair_by_kbytes.keys())
+        kbytes_list.extend(chr(_).encode() for _ in range(0x100, 0x300))
+        kbytes_list.extend(
+            [
+                b"Superb",
+                b"\033\033[3;5~",
+                b"\033[8;40;100t",
+                b"\033[<0;5;9M",
+                b"\033]11;rgb:ffff/ffff/ffff\a",
+                b"\033[200~",
+                "déjà vu".encode(),
+                "\u2388\u2325".encode(),
+            ]
+        )
+
+        for kbytes in 2 * kbytes_list:  # once to miss the LRU, and once to hit it
+            pair = self.kbytes_to_kcaps_pair(kbytes)
+            precise = _kbytes_to_precise_kcaps_(kbytes)
+            concise_if = _kbytes_to_concise_kcaps_if_(kbytes)
+            assert pair == (precise, concise_if), (pair, precise, concise_if, kbytes)
+
+        assert len(self.lru_by_kbytes) <= KcapsLruMax, (len(self.lru_by_kbytes),)
+
+        self._try_kcaps_to_kbytes_()
+
+    def _try_kcaps_to_kbytes_(self) -> None:
+        """Require each Chord to come back as the Key Caps of its K Bytes"""
+
+        assert chord_to_caps_list("F2") == ["F2"]
+        assert chord_to_caps_list("Esc-F4") == ["⎋", "F4"]
+        assert chord_to_caps_list("Ctrl+Shift+X") == ["⌃", "⇧", "X"]
+        assert chord_to_caps_list("FnF12") == ["F12"]
+        assert chord_to_caps_list("Fn") == ["Fn"]
+
+        for ktext, kcaps in KCAP_BY_KTEXT.items():
+            if kcaps.startswith("⎋") and (kcaps != "⎋"):
+                continue  # such as '⎋FnReturn' taken as ⎋ before 'FnReturn'
+
+            kbytes = self.kcaps_to_kbytes_if(kcaps)
+            assert KCAP_BY_KTEXT[kbytes.decode()] == kcaps, (kbytes, kcaps, ktext)
+
+        assert self.kcaps_to_kbytes_if("⎋F4") == b"\033\033OS"
+        assert self.kcaps_to_kbytes_if("Return") == b"\r"
+        assert self.kcaps_to_kbytes_if("⎋Nonesuch") == b""
+
+    def _time_terminal_keycap_index_(self) -> tuple[float, float]:
+        """Time forming Key Caps by testing each Char, and then by Lookup"""
+
+        kbytes_list = 1000 * [b"a", b"\033[A", b"\033OP", b"\033[<0;5;9M", b"\r", b"Hello"]
+
+        t0 = time.time()
+        for kbytes in kbytes_list:
+            _kbytes_to_precise_kcaps_(kbytes)
+            _kbytes_to_concise_kcaps_if_(kbytes)
+        t1 = time.time()
+        for kbytes in kbytes_list:
+            self.kbytes_to_kcaps_pair(kbytes)
+        t2 = time.time()
+
+        return (t1 - t0, t2 - t1)
+
+
+terminal_keycap_index = TerminalKeycapIndex()  # compiles its Index after the Key Cap Tables
+
+
+def arrow_kbytes_to_runs(kbytes: bytes) -> list[tuple[bytes, int]]:
+    """Split the leading Arrows into Runs of the same Arrow, as (Arrow, Count) Pairs"""
+
+    runs: list[tuple[bytes, int]] = list()
+
+    index = 0
+    while True:
+        m = ARROW_RUN_REGEX.match(kbytes, index)
+        if not m:
+            break
+
+        arrow = kbytes[index:][:3]
+        count = (m.end() - index) // 3
+        runs.append((arrow, count))
+
+        index = m.end()
+
+    return runs
+
+    # [(b'\033[C', 3), (b'\033[B', 2)] from b'\033[C\033[C\033[C\033[B\033[B\033[0n'
+
+
+def arrows_kbytes_pn_compress(kbytes: bytes) -> bytes:
+    """Compress each run of Arrows into a Pn > 1"""
+
+    runs = arrow_kbytes_to_runs(kbytes)
+    assert (3 * sum(count for (arrow, count) in runs)) == len(kbytes), (runs, kbytes)
 
     kbytes = b"".join(
-        (b"\033[" + (str(pn).encode() if (pn >= 2) else b"") + tail) for (pn, tail) in pairs
+        (b"\033[" + (str(pn).encode() if (pn >= 2) else b"") + arrow[-1:]) for (arrow, pn) in runs
     )
 
     return kbytes
 
 
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
+class OscColorReply:
+    """Say what Color the Terminal reports, at ⎋]10 Foreground, ⎋]11 Background, or ⎋]4 Palette"""
+
+    ps: int  # 10 Foreground, 11 Background, or 4 Palette
+    index: int  # the Palette Index of ⎋]4, else -1
+    rgb: tuple[int, int, int]  # each of R G B counted up to 0xFFFF
+
+
+@dataclasses.dataclass(order=True, frozen=True, slots=True)
+class OscClipboardReply:
+    """Say what the Terminal reports from a Clipboard, at ⎋]52"""
+
+    selection: str  # such as 'c' for the Clipboard, or 'p' for the Primary Selection
+    data: bytes  # decoded from Base64
+
+
+def osc_kbytes_to_reply_if(kbytes: bytes) -> OscColorReply | OscClipboardReply | None:
+    """Parse the Osc Reply of a Color or a Clipboard, else return None"""
+
+    # Drop the ⎋] Head, and the \007 BEL or ⎋\ ST Tail
+
+    if not kbytes.startswith(b"\033]"):
+        return None
+
+    if kbytes.endswith(b"\007"):
+        body = kbytes[2:-1]
+    elif kbytes.endswith(b"\033\\"):
+        body = kbytes[2:-2]
+    else:
+        return None
+
+    fields = body.split(b";")
+    if not fields[0].isdigit():
+        return None
+
+    ps = int(fields[0])
+
+    # Parse ⎋]10 ⎋]11 Foreground/ Background Colors, and ⎋]4 Palette Colors
+
+    if (ps in (10, 11)) and (len(fields) == 2):
+        rgb = osc_rgb_to_ints_if(fields[1])
+        if rgb:
+            return OscColorReply(ps, index=-1, rgb=rgb)
+
+    if (ps == 4) and (len(fields) == 3) and fields[1].isdigit():
+        rgb = osc_rgb_to_ints_if(fields[2])
+        if rgb:
+            return OscColorReply(ps, index=int(fields[1]), rgb=rgb)
+
+    # Parse ⎋]52 Clipboard, but not the ⎋]52;c;? Call for it
+
+    if (ps == 52) and (len(fields) == 3) and (fields[2] != b"?"):
+        try:
+            data = base64.b64decode(fields[2], validate=True)
+        except ValueError:
+            return None
+
+        selection = fields[1].decode(errors="replace")
+        return OscClipboardReply(selection, data=data)
+
+    return None
+
+    # OscColorReply(ps=11, index=-1, rgb=(65535, 65535, 65535)) from b'\033]11;rgb:ffff/ffff/ffff\a'
+
+
+def osc_rgb_to_ints_if(field: bytes) -> tuple[int, int, int] | tuple[()]:
+    """Parse 'rgb:{r}/{g}/{b}' of 1..4 Hex Digits each, as Ints counted up to 0xFFFF"""
+
+    if not field.startswith(b"rgb:"):
+        return ()
+
+    hexes = field.removeprefix(b"rgb:").split(b"/")
+    if len(hexes) != 3:
+        return ()
+
+    ints = list()
+    for hex_ in hexes:
+        if not (1 <= len(hex_) <= 4):
+            return ()
+        if hex_.translate(None, delete=b"0123456789ABCDEFabcdef"):
+            return ()
+
+        ints.append(int(hex_, 0x10) * 0xFFFF // (0x10 ** len(hex_) - 1))
+
+    return (ints[0], ints[1], ints[2])
+
+    # (65535, 0, 34952) from b'rgb:ffff/0/88'
+
+
 def tprint(*args: object, end: str = "\r\n") -> None:
     """Print to Terminal"""
 
     text = " ".join(str(_) for _ in args)
 
     assert sys.__stderr__ is not None
-    stdio: typing.TextIO = sys.__stderr__
+    stdio: typing.TextIO | TerminalWriter = sys.__stderr__
 
-    # if mouse_terminals:  # goes falsey while debugging
-    #     mt = mouse_terminals[-1]
-    #     stdio = mt.stdio
-    #     tcgetattr = mt.tcgetattr
-    #     assert tcgetattr, (tcgetattr,)
+    if mouse_terminals:  # goes falsey while debugging
+        mt = mouse_terminals[-1]
+        stdio = mt.stdio  # mirrors where the Cursor lands
 
     print(text, end=end, file=stdio)
 